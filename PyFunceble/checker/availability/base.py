@@ -52,7 +52,9 @@ License:
 
 # pylint: disable=too-many-lines
 
+import functools
 import multiprocessing
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -80,6 +82,7 @@ from PyFunceble.query.dns.query_tool import DNSQueryTool
 from PyFunceble.query.http_status_code import HTTPStatusCode
 from PyFunceble.query.netinfo.address import AddressInfo
 from PyFunceble.query.netinfo.hostbyaddr import HostByAddrInfo
+from PyFunceble.query.requests.response_cache import ResponseCache
 from PyFunceble.query.whois.query_tool import WhoisQueryTool
 
 
@@ -129,6 +132,7 @@ class AvailabilityCheckerBase(CheckerBase):
     addressinfo_query_tool: Optional[AddressInfo] = None
     hostbyaddr_query_tool: Optional[HostByAddrInfo] = None
     http_status_code_query_tool: Optional[HTTPStatusCode] = None
+    http_response_cache: Optional[ResponseCache] = None
     domain_syntax_checker: Optional[DomainSyntaxChecker] = None
     ip_syntax_checker: Optional[IPSyntaxChecker] = None
     url_syntax_checker: Optional[URLSyntaxChecker] = None
@@ -165,16 +169,18 @@ class AvailabilityCheckerBase(CheckerBase):
         self.whois_query_tool = WhoisQueryTool()
         self.addressinfo_query_tool = AddressInfo()
         self.hostbyaddr_query_tool = HostByAddrInfo()
+        self.http_response_cache = ResponseCache()
         self.http_status_code_query_tool = HTTPStatusCode()
+        self.http_status_code_query_tool.http_response_cache = self.http_response_cache
         self.domain_syntax_checker = DomainSyntaxChecker()
         self.ip_syntax_checker = IPSyntaxChecker()
         self.url_syntax_checker = URLSyntaxChecker()
         # WARNING: Put the aggressive one first!
         self.extra_rules_handlers = [
-            SubjectSwitchRulesHandler(),
-            DNSRulesHandler(),
-            EToxicHandler(),
-            ExtraRulesHandler(),
+            SubjectSwitchRulesHandler(http_response_cache=self.http_response_cache),
+            DNSRulesHandler(http_response_cache=self.http_response_cache),
+            EToxicHandler(http_response_cache=self.http_response_cache),
+            ExtraRulesHandler(http_response_cache=self.http_response_cache),
         ]
         self.db_session = db_session
 
@@ -227,6 +233,55 @@ class AvailabilityCheckerBase(CheckerBase):
             use_platform=use_platform,
         )
 
+    def record_lookup_timing(stage: str):  # pylint: disable=no-self-argument
+        """
+        Records the time spent by the decorated lookup method into the
+        :code:`timings` attribute of the status.
+
+        :param stage:
+            The name of the lookup stage to record.
+
+        .. note::
+            When a stage is queried more than once for the same subject, the
+            durations are summed.
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(self, *args, **kwargs):
+                started_at = time.perf_counter()
+
+                try:
+                    return func(self, *args, **kwargs)
+                finally:
+                    self.status.timings[stage] = self.status.timings.get(stage, 0.0) + (
+                        time.perf_counter() - started_at
+                    )
+
+            return wrapper
+
+        return decorator
+
+    def clear_http_response_cache_before_query(
+        func
+    ):  # pylint: disable=no-self-argument
+        """
+        Clears the cache of the HTTP responses before running the decorated
+        method.
+
+        .. note::
+            This way, a subject tested twice is never given the response of
+            its previous test.
+        """
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):  # pragma: no cover ## Safety!
+            self.http_response_cache.clear()
+
+            return func(self, *args, **kwargs)  # pylint: disable=not-callable
+
+        return wrapper
+
     @property
     def use_extra_rules(self) -> bool:
         """
@@ -505,6 +560,7 @@ class AvailabilityCheckerBase(CheckerBase):
         self.addressinfo_query_tool.set_subject(self.idna_subject)
         self.hostbyaddr_query_tool.set_subject(self.idna_subject)
         self.http_status_code_query_tool.set_subject(self.idna_subject)
+        self.http_response_cache.set_subject(self.idna_subject)
 
         self.domain_syntax_checker.subject = self.idna_subject
         self.ip_syntax_checker.subject = self.idna_subject
@@ -705,15 +761,7 @@ class AvailabilityCheckerBase(CheckerBase):
             lookup_order = ["NS", "CNAME", "A", "AAAA", "DNAME"]
 
         if lookup_order:
-            for record_type in lookup_order:
-                local_result = self.dns_query_tool.set_query_record_type(
-                    record_type
-                ).query()
-
-                if local_result:
-                    result[record_type] = local_result
-
-                    break
+            result.update(self.dns_query_tool.query_first(lookup_order))
 
         if self.status.idna_subject != self.dns_query_tool.subject:
             # Switch back subject because we don't want to break subsequential calls.
@@ -729,6 +777,7 @@ class AvailabilityCheckerBase(CheckerBase):
 
         return result
 
+    @record_lookup_timing("whois")
     def try_to_query_status_from_whois(
         self,
     ) -> "AvailabilityCheckerBase":
@@ -829,6 +878,7 @@ class AvailabilityCheckerBase(CheckerBase):
 
         return self
 
+    @record_lookup_timing("dns")
     def try_to_query_status_from_dns(self) -> "AvailabilityCheckerBase":
         """
         Tries to query the status from the DNS lookup.
@@ -861,6 +911,7 @@ class AvailabilityCheckerBase(CheckerBase):
 
         return self
 
+    @record_lookup_timing("netinfo")
     def try_to_query_status_from_netinfo(self) -> "AvailabilityCheckerBase":
         """
         Tries to query the status from the network information.
@@ -897,6 +948,7 @@ class AvailabilityCheckerBase(CheckerBase):
 
         return self
 
+    @record_lookup_timing("http_status_code")
     def try_to_query_status_from_http_status_code(
         self, *, from_domain_test: bool = False
     ) -> "AvailabilityCheckerBase":
@@ -963,6 +1015,7 @@ class AvailabilityCheckerBase(CheckerBase):
 
         return self
 
+    @record_lookup_timing("syntax")
     def try_to_query_status_from_syntax_lookup(
         self, from_domain_test: bool = False, from_url_test: bool = False
     ) -> "AvailabilityCheckerBase":
@@ -1020,6 +1073,7 @@ class AvailabilityCheckerBase(CheckerBase):
 
         raise NotImplementedError()
 
+    @record_lookup_timing("platform")
     def try_to_query_status_from_platform(self) -> "AvailabilityCheckerBase":
         """
         Tries to get and set the status from the platform API.
@@ -1070,6 +1124,7 @@ class AvailabilityCheckerBase(CheckerBase):
 
         return self
 
+    @record_lookup_timing("extra_rules")
     def try_to_query_status_from_extra_rules(self) -> "AvailabilityCheckerBase":
         """
         Tries to query the status from the extra rules.
@@ -1100,6 +1155,7 @@ class AvailabilityCheckerBase(CheckerBase):
 
     @CheckerBase.ensure_subject_is_given
     @CheckerBase.update_status_date_after_query
+    @clear_http_response_cache_before_query
     def query_status(self) -> "AvailabilityCheckerBase":
         """
         Queries the status and for for more action.
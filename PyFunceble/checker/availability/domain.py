@@ -88,6 +88,7 @@ class DomainAvailabilityChecker(AvailabilityCheckerBase):
         WHOIS datasets.
     """
 
+    @AvailabilityCheckerBase.record_lookup_timing("reputation")
     def try_to_query_status_from_reputation(self) -> "DomainAvailabilityChecker":
         """
         Tries to query the status from the reputation lookup.
@@ -119,6 +120,7 @@ class DomainAvailabilityChecker(AvailabilityCheckerBase):
 
     @AvailabilityCheckerBase.ensure_subject_is_given
     @AvailabilityCheckerBase.update_status_date_after_query
+    @AvailabilityCheckerBase.clear_http_response_cache_before_query
     def query_status(
         self,
     ) -> "DomainAvailabilityChecker":  # pragma: no cover
@@ -90,6 +90,7 @@ class DomainAndIPAvailabilityChecker(AvailabilityCheckerBase):
 
     @AvailabilityCheckerBase.ensure_subject_is_given
     @AvailabilityCheckerBase.update_status_date_after_query
+    @AvailabilityCheckerBase.clear_http_response_cache_before_query
     def query_status(
         self,
     ) -> "DomainAndIPAvailabilityChecker":  # pragma: no cover ## Just a switch.
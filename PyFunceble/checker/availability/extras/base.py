@@ -60,6 +60,8 @@ import PyFunceble.factory
 from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
 from PyFunceble.helpers.regex import RegexHelper
 from PyFunceble.query.dns.query_tool import DNSQueryTool
+from PyFunceble.query.record.http_response import HTTPResponseRecord
+from PyFunceble.query.requests.response_cache import ResponseCache
 
 
 class ExtraRuleHandlerBase:
@@ -70,14 +72,29 @@ class ExtraRuleHandlerBase:
         The previously gathered status.
     :type status:
         :class:`~PyFunceble.checker.availability.status.AvailabilityCheckerStatus`
+    :param http_response_cache:
+        The cache of the HTTP responses of the subject to read from. It should
+        be shared with the other handlers and lookup tools testing the same
+        subject.
     """
 
     _status: Optional[AvailabilityCheckerStatus] = None
-    req: Optional[requests.Response] = None
+    req: Optional[Union[requests.Response, HTTPResponseRecord]] = None
     dns_query_tool: Optional[DNSQueryTool] = None
     regex_helper: Optional[RegexHelper] = None
+    http_response_cache: Optional[ResponseCache] = None
+
+    def __init__(
+        self,
+        status: Optional[AvailabilityCheckerStatus] = None,
+        *,
+        http_response_cache: Optional[ResponseCache] = None,
+    ) -> None:
+        if http_response_cache is not None:
+            self.http_response_cache = http_response_cache
+        else:
+            self.http_response_cache = ResponseCache()
 
-    def __init__(self, status: Optional[AvailabilityCheckerStatus] = None) -> None:
         if status is not None:
             self.status = status
 
@@ -207,6 +224,10 @@ class ExtraRuleHandlerBase:
 
         self._status = value
 
+        if isinstance(value.idna_subject, str):
+            # Drops the responses of the previous subject - if any.
+            self.http_response_cache.set_subject(value.idna_subject)
+
     def set_status(self, value: AvailabilityCheckerStatus) -> "ExtraRuleHandlerBase":
         """
         Sets the status to work with.
@@ -227,7 +248,7 @@ class ExtraRuleHandlerBase:
             Whether we shoold follow the redirection - or not.
         """
 
-        self.req = PyFunceble.factory.Requester.get(
+        self.req = self.http_response_cache.get(
             self.req_url, allow_redirects=allow_redirects
         )
 
@@ -260,19 +281,19 @@ class ExtraRuleHandlerBase:
 
         matcher = any if not strict else all
 
-        def handle_regex_match_mode(_req: requests.Response):
+        def handle_regex_match_mode(_req: HTTPResponseRecord):
             if matcher(
                 self.regex_helper.set_regex(x).match(_req.text, return_match=False)
                 for x in matches
             ):
                 method()
 
-        def handle_string_match_mode(_req: requests.Response):
+        def handle_string_match_mode(_req: HTTPResponseRecord):
             if matcher(x in _req.text for x in matches):
                 method()
 
         try:
-            req = PyFunceble.factory.Requester.get(url, allow_redirects=allow_redirects)
+            req = self.http_response_cache.get(url, allow_redirects=allow_redirects)
 
             if match_mode == "regex":
                 handle_regex_match_mode(req)
@@ -325,7 +346,7 @@ class ExtraRuleHandlerBase:
 
         matcher = any if not strict else all
 
-        def handle_regex_match_mode(_req: requests.Response):
+        def handle_regex_match_mode(_req: HTTPResponseRecord):
             matches2search_result = {}
 
             for header, loc_matches in matches:
@@ -346,7 +367,7 @@ class ExtraRuleHandlerBase:
             if matcher(x for x in matches2search_result.values()):
                 method()
 
-        def handle_string_match_mode(_req: requests.Response):
+        def handle_string_match_mode(_req: HTTPResponseRecord):
             matches2search_result = {}
 
             for header, loc_matches in matches.items():
@@ -363,7 +384,7 @@ class ExtraRuleHandlerBase:
                 method()
 
         try:
-            req = PyFunceble.factory.Requester.get(url, allow_redirects=allow_redirects)
+            req = self.http_response_cache.get(url, allow_redirects=allow_redirects)
 
             if match_mode == "regex":
                 handle_regex_match_mode(req)
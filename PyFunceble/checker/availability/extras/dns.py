@@ -55,6 +55,7 @@ from typing import Optional
 import PyFunceble.facility
 from PyFunceble.checker.availability.extras.base import ExtraRuleHandlerBase
 from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
+from PyFunceble.query.requests.response_cache import ResponseCache
 
 
 class DNSRulesHandler(ExtraRuleHandlerBase):
@@ -69,7 +70,12 @@ class DNSRulesHandler(ExtraRuleHandlerBase):
 
     rulesets: dict = {}
 
-    def __init__(self, status: Optional[AvailabilityCheckerStatus] = None) -> None:
+    def __init__(
+        self,
+        status: Optional[AvailabilityCheckerStatus] = None,
+        *,
+        http_response_cache: Optional[ResponseCache] = None,
+    ) -> None:
         self.rulesets = {
             r"\.(25u\.com|2waky\.com|3-a\.net|4dq\.com|4pu\.com|acmetoy\.com|"
             r"almostmy\.com|americanunfinished\.com|as19557\.net|"
@@ -110,7 +116,7 @@ class DNSRulesHandler(ExtraRuleHandlerBase):
             ]
         }
 
-        super().__init__(status)
+        super().__init__(status, http_response_cache=http_response_cache)
 
     @ExtraRuleHandlerBase.ensure_status_is_given
     @ExtraRuleHandlerBase.setup_status_before
@@ -55,11 +55,11 @@ from typing import Optional
 from box import Box
 
 import PyFunceble.facility
-import PyFunceble.factory
 import PyFunceble.storage
 from PyFunceble.checker.availability.extras.base import ExtraRuleHandlerBase
 from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
-from PyFunceble.helpers.regex import RegexHelper
+from PyFunceble.helpers.multi_regex import MultiRegexHelper
+from PyFunceble.query.requests.response_cache import ResponseCache
 
 
 class ExtraRulesHandler(ExtraRuleHandlerBase):
@@ -75,7 +75,12 @@ class ExtraRulesHandler(ExtraRuleHandlerBase):
     regex_active2inactive: dict = {}
     http_codes_dataset: Optional[Box] = None
 
-    def __init__(self, status: Optional[AvailabilityCheckerStatus] = None) -> None:
+    def __init__(
+        self,
+        status: Optional[AvailabilityCheckerStatus] = None,
+        *,
+        http_response_cache: Optional[ResponseCache] = None,
+    ) -> None:
         self.regex_active2inactive = {
             r"\.000webhostapp\.com": [
                 (self.switch_to_down_if_status_code, {410, 424}),
@@ -117,37 +122,25 @@ class ExtraRulesHandler(ExtraRuleHandlerBase):
         else:
             self.http_codes_dataset = PyFunceble.storage.STD_HTTP_CODES
 
-        super().__init__(status)
+        super().__init__(status, http_response_cache=http_response_cache)
 
     def __regex_registry_handler(self, regex_registry: dict) -> "ExtraRulesHandler":
         """
         Handles the standard regex lookup case.
         """
 
-        regex_helper = RegexHelper()
-
-        for (
-            regex,
-            data,
-        ) in regex_registry.items():
-            broken = False
-            for element in data:
-                if not regex_helper.set_regex(regex).match(
-                    self.status.netloc, return_match=False
-                ):
-                    continue
+        regexes = tuple(regex_registry)
 
+        # The registry is compiled once (per process) and matched in one go.
+        for index in MultiRegexHelper(regexes).get_matching_indexes(self.status.netloc):
+            for element in regex_registry[regexes[index]]:
                 if isinstance(element, tuple):
                     element[0](*element[1:])
                 else:
                     element()
 
                 if self.status.status_after_extra_rules:
-                    broken = True
-                    break
-
-            if broken:
-                break
+                    return self
 
         return self
 
@@ -216,9 +209,7 @@ class ExtraRulesHandler(ExtraRuleHandlerBase):
             This method are assuming we are handling a imgur.com subdomain.
         """
 
-        req = PyFunceble.factory.Requester.get(
-            self.req_url_https, allow_redirects=False
-        )
+        req = self.http_response_cache.get(self.req_url_https, allow_redirects=False)
         username = self.status.netloc.replace(".imgur.com", "")
 
         if "Location" in req.headers:
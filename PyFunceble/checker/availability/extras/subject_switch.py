@@ -57,6 +57,7 @@ import PyFunceble.facility
 from PyFunceble.checker.availability.extras.base import ExtraRuleHandlerBase
 from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
 from PyFunceble.converter.url2netloc import Url2Netloc
+from PyFunceble.query.requests.response_cache import ResponseCache
 
 
 class SubjectSwitchRulesHandler(ExtraRuleHandlerBase):
@@ -73,9 +74,14 @@ class SubjectSwitchRulesHandler(ExtraRuleHandlerBase):
 
     url2netloc: Optional[Url2Netloc] = None
 
-    def __init__(self, status: Optional[AvailabilityCheckerStatus] = None) -> None:
+    def __init__(
+        self,
+        status: Optional[AvailabilityCheckerStatus] = None,
+        *,
+        http_response_cache: Optional[ResponseCache] = None,
+    ) -> None:
         self.url2netloc = Url2Netloc()
-        super().__init__(status)
+        super().__init__(status, http_response_cache=http_response_cache)
 
     def _switch_down_by_history(self) -> "SubjectSwitchRulesHandler":
         """
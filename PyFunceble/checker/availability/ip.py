@@ -88,6 +88,7 @@ class IPAvailabilityChecker(AvailabilityCheckerBase):
         WHOIS datasets.
     """
 
+    @AvailabilityCheckerBase.record_lookup_timing("reputation")
     def try_to_query_status_from_reputation(self) -> "IPAvailabilityChecker":
         """
         Tries to query the status from the reputation lookup.
@@ -119,6 +120,7 @@ class IPAvailabilityChecker(AvailabilityCheckerBase):
 
     @AvailabilityCheckerBase.ensure_subject_is_given
     @AvailabilityCheckerBase.update_status_date_after_query
+    @AvailabilityCheckerBase.clear_http_response_cache_before_query
     def query_status(
         self,
     ) -> "IPAvailabilityChecker":  # pragma: no cover
@@ -59,8 +59,10 @@ from PyFunceble.checker.availability.params import AvailabilityCheckerParams
 from PyFunceble.checker.status_base import CheckerStatusBase
 from PyFunceble.query.record.dns import DNSQueryToolRecord
 from PyFunceble.query.record.whois import WhoisQueryToolRecord
+from PyFunceble.utils.slots import add_slots
 
 
+@add_slots
 @dataclasses.dataclass
 class AvailabilityCheckerStatus(CheckerStatusBase):
     """
@@ -99,11 +101,16 @@ class AvailabilityCheckerStatus(CheckerStatusBase):
     netinfo: Optional[Dict[str, Optional[List[str]]]] = None
     http_status_code: Optional[int] = None
 
+    timings: Optional[Dict[str, float]] = None
+
     def __post_init__(self) -> None:
         self.dns_lookup_record = DNSQueryToolRecord()
         self.whois_lookup_record = WhoisQueryToolRecord()
         self.params = AvailabilityCheckerParams()
 
+        if self.timings is None:
+            self.timings = {}
+
     def is_special(self) -> bool:
         """
         Checks if the current status is a SPECIAL one.
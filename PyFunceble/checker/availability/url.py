@@ -128,6 +128,7 @@ class URLAvailabilityChecker(AvailabilityCheckerBase):
 
         return self
 
+    @AvailabilityCheckerBase.record_lookup_timing("http_status_code")
     def try_to_query_status_from_http_status_code(
         self, *, from_domain_test: bool = False
     ) -> "URLAvailabilityChecker":
@@ -186,6 +187,7 @@ class URLAvailabilityChecker(AvailabilityCheckerBase):
 
         return self
 
+    @AvailabilityCheckerBase.record_lookup_timing("reputation")
     def try_to_query_status_from_reputation(self) -> "URLAvailabilityChecker":
         """
         Tries to query the status from the reputation lookup.
@@ -246,6 +248,7 @@ class URLAvailabilityChecker(AvailabilityCheckerBase):
 
     @AvailabilityCheckerBase.ensure_subject_is_given
     @AvailabilityCheckerBase.update_status_date_after_query
+    @AvailabilityCheckerBase.clear_http_response_cache_before_query
     def query_status(
         self,
     ) -> "URLAvailabilityChecker":  # pragma: no cover
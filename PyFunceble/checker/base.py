@@ -396,17 +396,11 @@ class CheckerBase:
 
         if not self.status.subject_kind:
             cls_name = self.__class__.__name__.lower()
-            if (
-                hasattr(self.status, "ip_syntax") and self.status.ip_syntax
-            ) or "ip" in cls_name:
+            if getattr(self.status, "ip_syntax", None) or "ip" in cls_name:
                 self.status.subject_kind = "ip"
-            elif (
-                hasattr(self.status, "url_syntax") and self.status.url_syntax
-            ) or "url" in cls_name:
+            elif getattr(self.status, "url_syntax", None) or "url" in cls_name:
                 self.status.subject_kind = "url"
-            elif (
-                hasattr(self.status, "domain_syntax") and self.status.domain_syntax
-            ) or "domain" in cls_name:
+            elif getattr(self.status, "domain_syntax", None) or "domain" in cls_name:
                 self.status.subject_kind = "domain"
             else:
                 self.status.subject_kind = "unknown"
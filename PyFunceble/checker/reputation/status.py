@@ -57,8 +57,10 @@ from typing import List, Optional
 import PyFunceble.storage
 from PyFunceble.checker.status_base import CheckerStatusBase
 from PyFunceble.query.record.dns import DNSQueryToolRecord
+from PyFunceble.utils.slots import add_slots
 
 
+@add_slots
 @dataclasses.dataclass
 class ReputationCheckerStatus(CheckerStatusBase):
     """
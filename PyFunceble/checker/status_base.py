@@ -52,19 +52,45 @@ License:
 
 import dataclasses
 import datetime
-from typing import Optional
+import functools
+import typing
+from typing import Any, Optional, Tuple
 
 from PyFunceble.checker.complex_json_encoder import ComplexJsonEncoder
 from PyFunceble.checker.params_base import CheckerParamsBase
 from PyFunceble.helpers.dict import DictHelper
+from PyFunceble.utils.slots import (
+    add_slots,
+    get_field_names,
+    get_fields_getter,
+    get_slots_setters,
+)
 
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+ONE_MICROSECOND = datetime.timedelta(microseconds=1)
 
+
+@add_slots
 @dataclasses.dataclass
 class CheckerStatusBase:
     """
     Provides the base of all status classes.
+
+    .. note::
+        The fields are stored into :code:`__slots__` and the statuses are
+        pickled as a tuple of values (prefixed with :code:`SCHEMA_VERSION`)
+        instead of a dict of attributes.
+
+    .. note::
+        The output of :code:`to_dict` is cached until an attribute is set.
+        In-place changes of nested values (e.g. of :code:`timings`) are not
+        tracked.
     """
 
+    __slots__ = ("_dict_cache",)
+
+    SCHEMA_VERSION = 1
+
     subject_kind: Optional[str] = None
 
     subject: Optional[str] = None
@@ -78,16 +104,131 @@ class CheckerStatusBase:
 
     params: Optional[CheckerParamsBase] = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+
+    def __reduce__(self) -> tuple:
+        return (
+            type(self).from_tuple,
+            (self.SCHEMA_VERSION, self.to_tuple()),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_datetime_indexes(status_class: type) -> Tuple[int, ...]:
+        """
+        Provides the indexes of the (tuple of) fields of the given class which
+        hold a datetime.
+
+        :param status_class:
+            The status class to work with.
+        """
+
+        type_hints = typing.get_type_hints(status_class)
+
+        return tuple(
+            index
+            for index, name in enumerate(get_field_names(status_class))
+            if datetime.datetime
+            in (type_hints[name], *typing.get_args(type_hints[name]))
+        )
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Converts the current object to a tuple of values - ordered as the
+        fields.
+
+        .. note::
+            The UTC datetimes are packed as a number of microseconds since the
+            epoch. They are (by far) the most expensive values to pickle.
+        """
+
+        result = get_fields_getter(type(self))(self)
+        datetime_indexes = self.get_datetime_indexes(type(self))
+
+        if datetime_indexes:
+            result = list(result)
+
+            for index in datetime_indexes:
+                if (
+                    isinstance(result[index], datetime.datetime)
+                    and result[index].tzinfo is datetime.timezone.utc
+                ):
+                    result[index] = (result[index] - EPOCH) // ONE_MICROSECOND
+
+            result = tuple(result)
+
+        return result
+
+    @classmethod
+    def from_tuple(
+        cls, schema_version: int, values: Tuple[Any, ...]
+    ) -> "CheckerStatusBase":
+        """
+        Provides a new object from the given tuple of values.
+
+        :param schema_version:
+            The schema version the values were packed with.
+        :param values:
+            The values - ordered as the fields.
+
+        :raise ValueError:
+            When the given schema version or number of values does not match
+            the current class.
+        """
+
+        setters = get_slots_setters(cls)
+
+        if schema_version != cls.SCHEMA_VERSION:
+            raise ValueError(
+                f"<schema_version> ({schema_version!r}) should be "
+                f"{cls.SCHEMA_VERSION!r}."
+            )
+
+        if len(values) != len(setters):
+            raise ValueError(
+                f"<values> should have {len(setters)} items, {len(values)} given."
+            )
+
+        result = cls.__new__(cls)
+
+        for setter, value in zip(setters, values):
+            setter(result, value)
+
+        for index in cls.get_datetime_indexes(cls):
+            if isinstance(values[index], int):
+                setters[index](result, EPOCH + values[index] * ONE_MICROSECOND)
+
+        object.__setattr__(result, "_dict_cache", None)
+
+        return result
+
     def to_dict(self) -> dict:
         """
         Converts the current object to dict.
         """
 
-        return {
-            x: y if not hasattr(y, "to_dict") else y.to_dict()
-            for x, y in self.__dict__.items()
-            if not x.startswith("__")
-        }
+        try:
+            cached = self._dict_cache
+        except AttributeError:
+            cached = None
+
+        if cached is None:
+            cached = {}
+
+            for name in get_field_names(type(self)):
+                value = getattr(self, name)
+                cached[name] = (
+                    value if not hasattr(value, "to_dict") else value.to_dict()
+                )
+
+            object.__setattr__(self, "_dict_cache", cached)
+
+        # The callers are free to update the (first level of the) result.
+        return dict(cached)
 
     def to_json(self) -> str:
         """
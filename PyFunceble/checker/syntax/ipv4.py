@@ -163,7 +163,7 @@ class IPv4SyntaxChecker(CheckerBase):
                     or address.is_loopback
                     or address.is_link_local
                     or not address.is_global
-                    or RegexHelper(self._get_regex_reserved_ip()).match(
+                    or RegexHelper.compiled(self._get_regex_reserved_ip()).match(
                         self.idna_subject, return_match=False
                     )
                 )
@@ -108,15 +108,15 @@ class SecondLvlDomainSyntaxChecker(DomainSyntaxCheckerBase):
             if "." in subject_without_suffix:
                 return False
 
-            return RegexHelper(self.REGEX_VALID_DOMAIN).match(
+            return RegexHelper.compiled(self.REGEX_VALID_DOMAIN).match(
                 self.idna_subject, return_match=False
-            ) or RegexHelper(self.REGEX_VALID_RELAXED_DOMAIN).match(
+            ) or RegexHelper.compiled(self.REGEX_VALID_RELAXED_DOMAIN).match(
                 self.idna_subject, return_match=False
             )
 
         if "." in subject_without_extension:
             return False
 
-        return RegexHelper(self.REGEX_VALID_DOMAIN).match(
+        return RegexHelper.compiled(self.REGEX_VALID_DOMAIN).match(
             self.idna_subject, return_match=False
         )
@@ -56,8 +56,10 @@ from typing import Optional
 
 import PyFunceble.storage
 from PyFunceble.checker.status_base import CheckerStatusBase
+from PyFunceble.utils.slots import add_slots
 
 
+@add_slots
 @dataclasses.dataclass
 class SyntaxCheckerStatus(CheckerStatusBase):
     """
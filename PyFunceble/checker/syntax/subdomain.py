@@ -89,19 +89,19 @@ class SubDomainSyntaxChecker(DomainSyntaxCheckerBase):
 
         if subject_without_suffix:
             if suffix.count(".") >= 2:
-                return RegexHelper(self.REGEX_VALID_SUBDOMAIN).match(
+                return RegexHelper.compiled(self.REGEX_VALID_SUBDOMAIN).match(
                     subject_without_extension, return_match=False
                 )
 
             if "." in subject_without_suffix:
-                return RegexHelper(self.REGEX_VALID_SUBDOMAIN).match(
+                return RegexHelper.compiled(self.REGEX_VALID_SUBDOMAIN).match(
                     self.idna_subject, return_match=False
                 )
 
             return False
 
         if "." in subject_without_extension:
-            return RegexHelper(self.REGEX_VALID_SUBDOMAIN).match(
+            return RegexHelper.compiled(self.REGEX_VALID_SUBDOMAIN).match(
                 subject_without_extension, return_match=False
             )
 
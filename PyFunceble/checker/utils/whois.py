@@ -64,13 +64,18 @@ from PyFunceble.dataset.whois.sql import SQLDBWhoisDataset
 
 
 def get_whois_dataset_object(
-    *, db_session: Optional[Session] = None
+    *, db_session: Optional[Session] = None, batched: bool = False
 ) -> Union[DatasetBase, CSVDatasetBase, DBDatasetBase]:
     """
     Provides the whois dataset object to work with.
 
     :param db_session:
         A database session to use.
+    :param batched:
+        Whether the writes may be batched (when supported).
+
+        .. warning::
+            When batched, the caller has to flush or close the dataset.
 
     :raise ValueError:
         When the given database type is unkown.
@@ -90,6 +95,13 @@ def get_whois_dataset_object(
         ):
             result = SQLDBWhoisDataset(db_session=db_session)
 
+            if batched:
+                result.set_batch_size(
+                    PyFunceble.storage.CONFIGURATION.cli_testing.db_batch_size
+                ).set_batch_delay(
+                    PyFunceble.storage.CONFIGURATION.cli_testing.db_batch_delay
+                )
+
         if result:
             result.set_authorized(
                 bool(PyFunceble.storage.CONFIGURATION.cli_testing.whois_db)
@@ -244,6 +244,16 @@ def get_filtering_group_data() -> List[Tuple[List[str], dict]]:
                 "addresses. %s" % get_configured_value("cli_testing.cidr_expand"),
             },
         ),
+        (
+            ["--cidr-max-ipv6-addresses"],
+            {
+                "dest": "cli_testing.cidr_max_ipv6_addresses",
+                "type": int,
+                "help": "Sets the maximal number of addresses an IPv6 network\n"
+                "can have to be expanded. %s"
+                % get_configured_value("cli_testing.cidr_max_ipv6_addresses"),
+            },
+        ),
         (
             [
                 "--complements",
@@ -672,6 +682,105 @@ def get_dns_control_group_data() -> List[Tuple[List[str], dict]]:
                 "queries.\n %s" % get_configured_value("dns.delay"),
             },
         ),
+        (
+            ["--dns-concurrent-lookup"],
+            {
+                "dest": "dns.concurrent_lookup",
+                "action": "store_true",
+                "help": "Activates or disables the concurrent lookup of the DNS\n"
+                "record types. When active, all record types are queried at\n"
+                "the same time and the first positive answer (by priority) is\n"
+                "kept.\n%s" % get_configured_value("dns.concurrent_lookup"),
+            },
+        ),
+        (
+            ["--dns-cache"],
+            {
+                "dest": "dns.cache",
+                "action": "store_true",
+                "help": "Activates or disables the (TTL aware) caching of the\n"
+                "DNS answers. %s" % get_configured_value("dns.cache"),
+            },
+        ),
+        (
+            ["--dns-shared-cache"],
+            {
+                "dest": "dns.shared_cache",
+                "action": "store_true",
+                "help": "Activates or disables the sharing of the cached DNS\n"
+                "answers between processes - through a SQLite file. %s"
+                % get_configured_value("dns.shared_cache"),
+            },
+        ),
+    ]
+
+
+def get_whois_control_group_data() -> List[Tuple[List[str], dict]]:
+    """
+    Provides the argument of the WHOIS control group.
+    """
+
+    return [
+        (
+            [
+                "--whois-rate-limit",
+            ],
+            {
+                "dest": "whois.rate_limit",
+                "type": float,
+                "help": "Sets the number of queries per second we are allowed\n"
+                "to send to a single WHOIS server. %s"
+                % get_configured_value("whois.rate_limit"),
+            },
+        ),
+        (
+            [
+                "--whois-burst",
+            ],
+            {
+                "dest": "whois.burst",
+                "type": int,
+                "help": "Sets the number of queries we are allowed to send to a\n"
+                "single WHOIS server at once. %s" % get_configured_value("whois.burst"),
+            },
+        ),
+        (
+            [
+                "--whois-max-concurrent-queries",
+            ],
+            {
+                "dest": "whois.max_concurrent_queries",
+                "type": int,
+                "help": "Sets the maximal number of simultaneous queries to a\n"
+                "single WHOIS server. %s"
+                % get_configured_value("whois.max_concurrent_queries"),
+            },
+        ),
+        (
+            [
+                "--whois-max-retries",
+            ],
+            {
+                "dest": "whois.max_retries",
+                "type": int,
+                "help": "Sets the number of times we retry a WHOIS query which\n"
+                "got an empty reply or a reset connection. %s"
+                % get_configured_value("whois.max_retries"),
+            },
+        ),
+        (
+            [
+                "--whois-backoff",
+            ],
+            {
+                "dest": "whois.backoff",
+                "type": float,
+                "help": "Sets the number of seconds to wait before querying a\n"
+                "WHOIS server again after a failure. The delay is doubled\n"
+                "for each consecutive failure. %s"
+                % get_configured_value("whois.backoff"),
+            },
+        ),
     ]
 
 
@@ -740,6 +849,31 @@ def get_database_control_group_data() -> List[Tuple[List[str], dict]]:
                 % get_configured_value("cli_testing.db_type"),
             },
         ),
+        (
+            [
+                "--database-batch-size",
+            ],
+            {
+                "dest": "cli_testing.db_batch_size",
+                "type": int,
+                "help": "Sets the number of rows to buffer before writing them\n"
+                "into the mariadb, mysql or postgresql database. %s"
+                % get_configured_value("cli_testing.db_batch_size"),
+            },
+        ),
+        (
+            [
+                "--database-batch-delay",
+            ],
+            {
+                "dest": "cli_testing.db_batch_delay",
+                "type": float,
+                "help": "Sets the maximal time (in seconds) a row can stay\n"
+                "buffered before being written into the mariadb, mysql or\n"
+                "postgresql database. %s"
+                % get_configured_value("cli_testing.db_batch_delay"),
+            },
+        ),
         (
             [
                 "-dbr",
@@ -879,6 +1013,42 @@ def get_output_control_group_data() -> List[Tuple[List[str], dict]]:
                 % get_configured_value("cli_testing.hosts_ip"),
             },
         ),
+        (
+            [
+                "--columnar-results",
+            ],
+            {
+                "dest": "cli_testing.file_generation.columnar",
+                "action": "store_true",
+                "help": "Activates or disables the generation of the columnar\n"
+                "results files. %s"
+                % get_configured_value("cli_testing.file_generation.columnar"),
+            },
+        ),
+        (
+            [
+                "--columnar-format",
+            ],
+            {
+                "dest": "cli_testing.file_generation.columnar_format",
+                "type": str,
+                "choices": ["parquet", "arrow", "jsonl"],
+                "help": "Sets the format of the columnar results files. %s"
+                % get_configured_value("cli_testing.file_generation.columnar_format"),
+            },
+        ),
+        (
+            [
+                "--file-buffer-size",
+            ],
+            {
+                "dest": "cli_testing.file_generation.buffer_size",
+                "type": int,
+                "help": "Sets the size (in bytes) of the write buffer of each\n"
+                "output file. Set to 0 to write each line directly. %s"
+                % get_configured_value("cli_testing.file_generation.buffer_size"),
+            },
+        ),
         (
             [
                 "--merge-output",
@@ -956,6 +1126,20 @@ def get_output_control_group_data() -> List[Tuple[List[str], dict]]:
                 % get_configured_value("cli_testing.display_mode.registrar"),
             },
         ),
+        (
+            [
+                "--lookup-timings",
+            ],
+            {
+                "dest": "cli_testing.display_mode.lookup_timings",
+                "action": "store_true",
+                "help": "Activates or disables the display of the lookup\n"
+                "timings - file - at the end of a test.\n"
+                "The lookup timings file contains the amount, p50, p95 and\n"
+                "p99 (in milliseconds) of each lookup stage. %s"
+                % get_configured_value("cli_testing.display_mode.lookup_timings"),
+            },
+        ),
         (
             [
                 "--max-registrar",
@@ -1061,6 +1245,30 @@ def get_multiprocessing_group_data() -> List[Tuple[List[str], dict]]:
                 % get_configured_value("cli_testing.max_workers"),
             },
         ),
+        (
+            [
+                "--direct-queues",
+            ],
+            {
+                "dest": "cli_testing.direct_queues",
+                "action": "store_true",
+                "help": "Activates or disables the usage of direct queues\n"
+                "between our processes. %s"
+                % get_configured_value("cli_testing.direct_queues"),
+            },
+        ),
+        (
+            [
+                "--queue-batch-size",
+            ],
+            {
+                "dest": "cli_testing.queue_batch_size",
+                "type": int,
+                "help": "Sets the maximal number of subjects to share as a\n"
+                "single message with the tester processes. %s"
+                % get_configured_value("cli_testing.queue_batch_size"),
+            },
+        ),
     ]
 
 
@@ -1178,6 +1386,14 @@ def get_default_group_data() -> List[Tuple[List[str], dict]]:
                 "help": argparse.SUPPRESS,
             },
         ),
+        (
+            ["--logging-queue"],
+            {
+                "dest": "debug.queue",
+                "action": "store_true",
+                "help": argparse.SUPPRESS,
+            },
+        ),
         (
             ["--help"],
             {
@@ -1379,6 +1595,7 @@ def tool() -> None:
     )
     test_control_group = parser.add_argument_group("Test control")
     dns_control_group = parser.add_argument_group("DNS control")
+    whois_control_group = parser.add_argument_group("WHOIS control")
     proxy_control_group = parser.add_argument_group("Proxy control")
     database_control_group = parser.add_argument_group("Databases")
     output_control_group = parser.add_argument_group("Output control")
@@ -1390,6 +1607,7 @@ def tool() -> None:
         get_filtering_group_data,
         get_test_control_group_data,
         get_dns_control_group_data,
+        get_whois_control_group_data,
         get_proxy_control_group_data,
         get_database_control_group_data,
         get_output_control_group_data,
@@ -54,7 +54,7 @@ import copy
 import functools
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from domain2idna import domain2idna
 
@@ -104,6 +104,12 @@ class FilePreloader:
 
     STD_AUTHORIZED: bool = False
 
+    CHUNK_SIZE: int = 10000
+    """
+    The number of lines to read before saving them into the continue dataset
+    and saving our checkpoint.
+    """
+
     _authorized: Optional[bool] = False
     _protocol: Optional[dict] = None
 
@@ -328,6 +334,7 @@ class FilePreloader:
             new_dataset["previous_hash"] = None
             new_dataset["hash"] = None
             new_dataset["line_number"] = 1
+            new_dataset["offset"] = 0
 
             if append:
                 self.__description.append(new_dataset)
@@ -369,121 +376,199 @@ class FilePreloader:
 
         DictHelper(self.__description).to_json_file(self.__description_file)
 
+    def __get_chunk_of_line(
+        self, line: str, tested_at: datetime, *, print_dots: bool = False
+    ) -> List[dict]:
+        """
+        Provides the datasets (to insert into the continue dataset) of the
+        subjects of the given line.
+
+        :param line:
+            The (decoded) line to read.
+        :param tested_at:
+            The test date to give to each dataset.
+        :param print_dots:
+            Whether we should print a dot for each accepted subject.
+        """
+
+        result = []
+
+        if self.rpz_policy2subject and "SOA" in line:
+            self.rpz_policy2subject.set_soa(line.split()[0])
+
+        for subject in get_subjects_from_line(
+            line,
+            self.checker_type,
+            subject_type=self.protocol["subject_type"],
+            adblock_inputline2subject=self.adblock_inputline2subject,
+            wildcard2subject=self.wildcard2subject,
+            rpz_policy2subject=self.rpz_policy2subject,
+            rpz_inputline2subject=self.rpz_inputline2subject,
+            inputline2subject=self.inputline2subject,
+            subject2complements=self.subject2complements,
+            url2netloc=self.url2netloc,
+            cidr2subject=self.cidr2subject,
+        ):
+            to_send = dict(self.protocol)
+            to_send["subject"] = subject
+            to_send["idna_subject"] = domain2idna(subject)
+            to_send["tested_at"] = tested_at
+
+            if self.inactive_dataset.exists(to_send):
+                print_single_line("I")
+                continue
+
+            if TesterWorker.should_be_ignored(subject=to_send["idna_subject"]):
+                print_single_line("X")
+                continue
+
+            result.append(to_send)
+
+            if print_dots:
+                print_single_line()
+
+        return result
+
+    def __save_chunk(
+        self, chunk: List[dict], description: dict, offset: int, line_number: int
+    ) -> "FilePreloader":
+        """
+        Saves the given chunk into the continue dataset and saves our
+        checkpoint.
+
+        :param chunk:
+            The datasets to save. It is emptied once saved.
+        :param description:
+            The description to update.
+        :param offset:
+            The offset (in bytes) right after the chunk.
+        :param line_number:
+            The number of the line right after the chunk.
+        """
+
+        self.continue_dataset.update_many(chunk, ignore_if_exist=True)
+        chunk.clear()
+
+        description["offset"] = offset
+        description["line_number"] = line_number
+
+        self.__save_description()
+
+        return self
+
+    def __preload_file(
+        self, file_helper: FileHelper, description: dict, *, print_dots: bool = False
+    ) -> bool:
+        """
+        Streams the given file - from the latest checkpoint of the given
+        description - and inserts its subjects into the continue dataset.
+
+        :param file_helper:
+            The file to read.
+        :param description:
+            The description holding (and receiving) our checkpoint.
+        :param print_dots:
+            Whether we should print a dot for each accepted subject.
+
+        :return:
+            :code:`True` when we had to stop before the end of the file.
+        """
+
+        chunk = []
+        chunk_lines = 0
+        tested_at = datetime.now(timezone.utc) - timedelta(days=365.25 * 20)
+
+        with file_helper.open("rb") as file_stream:
+            file_stream.seek(description["offset"])
+
+            offset = description["offset"]
+            line_number = description["line_number"]
+
+            for line in file_stream:
+                if (
+                    self.continuous_integration
+                    and self.continuous_integration.is_time_exceeded()
+                ):
+                    return True
+
+                offset += len(line)
+                line_number += 1
+                chunk_lines += 1
+
+                chunk.extend(
+                    self.__get_chunk_of_line(
+                        line.decode("utf-8").strip(), tested_at, print_dots=print_dots
+                    )
+                )
+
+                if chunk_lines >= self.CHUNK_SIZE:
+                    self.__save_chunk(chunk, description, offset, line_number)
+                    chunk_lines = 0
+
+            self.__save_chunk(chunk, description, offset, line_number)
+
+        return False
+
     @execute_if_authorized(None)
     @ensure_protocol_is_given
     def start(self, print_dots: bool = False) -> "FilePreloader":
         """
         Starts the pre-loading of the currently set file path.
+
+        The file is streamed and its subjects are inserted - by chunk of
+        :code:`CHUNK_SIZE` lines - into the continue dataset. After each
+        chunk, the byte offset we reached is saved (as checkpoint) into the
+        description so that an interrupted preloading resumes where it stopped.
         """
 
         self.__load_description()
 
+        description = self.__description[self.__matching_index]
+
         broken = False
         file_helper = FileHelper(self.protocol["subject"])
-        self.__description[self.__matching_index]["hash"] = HashHelper().hash_file(
-            file_helper.path
-        )
+        file_hash = HashHelper().hash_file(file_helper.path)
 
         if isinstance(self.continue_dataset, CSVContinueDataset):
             self.continue_dataset.set_base_directory(self.protocol["output_dir"])
 
         if (
-            self.__description[self.__matching_index]["checker_type"]
-            != self.protocol["checker_type"]
-            or self.__description[self.__matching_index]["subject_type"]
-            != self.protocol["subject_type"]
+            description["checker_type"] != self.protocol["checker_type"]
+            or description["subject_type"] != self.protocol["subject_type"]
         ):
             try:
                 self.continue_dataset.cleanup()
             except TypeError:
                 self.continue_dataset.cleanup(session_id=self.protocol["session_id"])
 
-        if (
-            self.__description[self.__matching_index]["previous_hash"]
-            and self.__description[self.__matching_index]["hash"]
-            != self.__description[self.__matching_index]["previous_hash"]
-        ):
+            description["offset"] = 0
+            description["line_number"] = 1
+
+        if description["hash"] != file_hash or "offset" not in description:
             # Forces the reading of each lines because there is literally no
-            # way to know where something has been changed.
-            self.__description[self.__matching_index]["line_number"] = 1
+            # way to know where something has been changed since our latest
+            # checkpoint.
+            description["offset"] = 0
+            description["line_number"] = 1
+
+        description["hash"] = file_hash
 
         if (
-            self.__description[self.__matching_index]["checker_type"]
-            != self.protocol["checker_type"]
-            or self.__description[self.__matching_index]["subject_type"]
-            != self.protocol["subject_type"]
-            or self.__description[self.__matching_index]["hash"]
-            != self.__description[self.__matching_index]["previous_hash"]
+            description["checker_type"] != self.protocol["checker_type"]
+            or description["subject_type"] != self.protocol["subject_type"]
+            or description["hash"] != description["previous_hash"]
         ):
             try:
-                with file_helper.open("r", encoding="utf-8") as file_stream:
-                    line_num = 1
-
-                    for line in file_stream:
-                        if (
-                            line_num
-                            < self.__description[self.__matching_index]["line_number"]
-                        ):
-                            line_num += 1
-                            continue
-
-                        if (
-                            self.continuous_integration
-                            and self.continuous_integration.is_time_exceeded()
-                        ):
-                            broken = True
-                            break
-
-                        line = line.strip()
-
-                        if self.rpz_policy2subject and "SOA" in line:
-                            self.rpz_policy2subject.set_soa(line.split()[0])
-
-                        for subject in get_subjects_from_line(
-                            line,
-                            self.checker_type,
-                            subject_type=self.protocol["subject_type"],
-                            adblock_inputline2subject=self.adblock_inputline2subject,
-                            wildcard2subject=self.wildcard2subject,
-                            rpz_policy2subject=self.rpz_policy2subject,
-                            rpz_inputline2subject=self.rpz_inputline2subject,
-                            inputline2subject=self.inputline2subject,
-                            subject2complements=self.subject2complements,
-                            url2netloc=self.url2netloc,
-                            cidr2subject=self.cidr2subject,
-                        ):
-                            to_send = copy.deepcopy(self.protocol)
-                            to_send["subject"] = subject
-                            to_send["idna_subject"] = domain2idna(subject)
-                            to_send["tested_at"] = datetime.now(
-                                timezone.utc
-                            ) - timedelta(days=365.25 * 20)
-
-                            if self.inactive_dataset.exists(to_send):
-                                print_single_line("I")
-                                continue
-
-                            if TesterWorker.should_be_ignored(
-                                subject=to_send["idna_subject"]
-                            ):
-                                print_single_line("X")
-                                continue
-
-                            self.continue_dataset.update(to_send, ignore_if_exist=True)
-
-                            if print_dots:
-                                print_single_line()
-
-                        self.__description[self.__matching_index]["line_number"] += 1
-                        line_num += 1
+                broken = self.__preload_file(
+                    file_helper, description, print_dots=print_dots
+                )
             except KeyboardInterrupt as exception:
+                # Our description holds the latest saved checkpoint.
                 self.__save_description()
                 raise exception
 
         if not broken:
-            self.__description[self.__matching_index]["previous_hash"] = (
-                self.__description[self.__matching_index]["hash"]
-            )
+            description["previous_hash"] = description["hash"]
 
         self.__save_description()
 
@@ -0,0 +1,465 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the generation of the columnar results files.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import dataclasses
+import datetime
+import functools
+import json
+import os
+import typing
+from typing import Any, Dict, List, Optional, Tuple
+
+import PyFunceble.cli.storage
+import PyFunceble.facility
+import PyFunceble.storage
+from PyFunceble.checker.complex_json_encoder import ComplexJsonEncoder
+from PyFunceble.checker.status_base import CheckerStatusBase
+from PyFunceble.cli.filesystem.dir_base import FilesystemDirBase
+from PyFunceble.helpers.directory import DirectoryHelper
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover ## Optional dependency
+    pyarrow = None
+
+# types.NoneType is only available since Python 3.10.
+NoneType = type(None)
+
+
+class ColumnarStatusWriter(FilesystemDirBase):
+    """
+    Provides an interface for the generation of the columnar results files.
+
+    The given statuses are buffered and written - in batches - into one
+    file per status (partition). Each instance writes its own files. Therefore
+    multiple sessions never write into the same file.
+
+    .. note::
+        The :code:`parquet` and :code:`arrow` formats require the
+        :code:`pyarrow` package. When it is not installed, we fall back to
+        the :code:`jsonl` (JSON lines) format.
+
+    .. warning::
+        The :code:`parquet` and :code:`arrow` files are only readable once
+        :code:`close` was called.
+    """
+
+    SUPPORTED_FORMATS: Tuple[str, ...] = ("parquet", "arrow", "jsonl")
+    FORMAT2EXTENSION: Dict[str, str] = {
+        "parquet": "parquet",
+        "arrow": "arrow",
+        "jsonl": "jsonl",
+    }
+
+    STD_FORMAT: str = "parquet"
+    STD_BATCH_SIZE: int = 1000
+
+    _format: str = "parquet"
+    _batch_size: int = 1000
+
+    _buffers: Optional[Dict[Tuple[str, type], List[dict]]] = None
+    _writers: Optional[Dict[Tuple[str, type], Any]] = None
+    _session_id: Optional[str] = None
+
+    def __init__(
+        self,
+        parent_dirname: Optional[str] = None,
+        *,
+        output_format: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        self._buffers = {}
+        self._writers = {}
+        self._session_id = (
+            f"{datetime.datetime.now(datetime.timezone.utc):%Y%m%dT%H%M%S%f}_"
+            f"{os.getpid()}"
+        )
+
+        if output_format is not None:
+            self.format = output_format
+        else:
+            self.guess_and_set_format()
+
+        if batch_size is not None:
+            self.batch_size = batch_size
+        else:
+            self.batch_size = self.STD_BATCH_SIZE
+
+        super().__init__(parent_dirname=parent_dirname)
+
+    @property
+    def format(self) -> str:
+        """
+        Provides the current state of the :code:`_format` attribute.
+        """
+
+        return self._format
+
+    @format.setter
+    def format(self, value: str) -> None:
+        """
+        Sets the format to write.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`str`.
+        :raise ValueError:
+            When the given :code:`value` is not supported.
+        """
+
+        if not isinstance(value, str):
+            raise TypeError(f"<value> should be {str}, {type(value)} given.")
+
+        value = value.lower()
+
+        if value not in self.SUPPORTED_FORMATS:
+            raise ValueError(
+                f"<value> ({value!r}) should be one of {self.SUPPORTED_FORMATS}."
+            )
+
+        if self._writers:
+            raise ValueError("<format> can't be changed while files are opened.")
+
+        if value != "jsonl" and pyarrow is None:
+            PyFunceble.facility.Logger.info(
+                "pyarrow is not installed. Falling back to the jsonl format."
+            )
+
+            value = "jsonl"
+
+        self._format = value
+
+    def set_format(self, value: str) -> "ColumnarStatusWriter":
+        """
+        Sets the format to write.
+
+        :param value:
+            The value to set.
+        """
+
+        self.format = value
+
+        return self
+
+    def guess_and_set_format(self) -> "ColumnarStatusWriter":
+        """
+        Tries to guess the format from the configuration.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            # pylint: disable=line-too-long
+            self.format = (
+                PyFunceble.storage.CONFIGURATION.cli_testing.file_generation.columnar_format
+            )
+        else:
+            self.format = self.STD_FORMAT
+
+        return self
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Provides the current state of the :code:`_batch_size` attribute.
+        """
+
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: int) -> None:
+        """
+        Sets the number of statuses to buffer before writing them.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not an :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError(f"<value> ({value!r}) should be greater than 0.")
+
+        self._batch_size = value
+
+    def set_batch_size(self, value: int) -> "ColumnarStatusWriter":
+        """
+        Sets the number of statuses to buffer before writing them.
+
+        :param value:
+            The value to set.
+        """
+
+        self.batch_size = value
+
+        return self
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_columns(status_class: type) -> Dict[str, type]:
+        """
+        Provides the columns (and their type) of the given status class.
+
+        The scalar fields keep their type, everything else (e.g. the DNS
+        lookup or the timings) is stored as JSON.
+
+        :param status_class:
+            The status class to provide the columns for.
+        """
+
+        result = {}
+        type_hints = typing.get_type_hints(status_class)
+
+        for field in dataclasses.fields(status_class):
+            field_type = type_hints.get(field.name, str)
+            field_args = [x for x in typing.get_args(field_type) if x is not NoneType]
+
+            if typing.get_origin(field_type) is typing.Union and len(field_args) == 1:
+                field_type = field_args[0]
+
+            if field_type not in (bool, int, float, str, datetime.datetime):
+                field_type = dict
+
+            result[field.name] = field_type
+
+        return result
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_schema(cls, status_class: type) -> "pyarrow.Schema":
+        """
+        Provides the arrow schema of the given status class.
+
+        :param status_class:
+            The status class to provide the schema for.
+        """
+
+        type2arrow = {
+            bool: pyarrow.bool_(),
+            int: pyarrow.int64(),
+            float: pyarrow.float64(),
+            str: pyarrow.string(),
+            datetime.datetime: pyarrow.timestamp("us", tz="UTC"),
+            dict: pyarrow.string(),
+        }
+
+        return pyarrow.schema(
+            [
+                (name, type2arrow[column_type])
+                for name, column_type in cls.get_columns(status_class).items()
+            ]
+        )
+
+    def get_partition_directory(self, status: CheckerStatusBase) -> str:
+        """
+        Provides the directory of the partition of the given status.
+
+        :param status:
+            The status to provide the partition directory for.
+        """
+
+        return os.path.join(
+            self.get_output_basedir(),
+            PyFunceble.cli.storage.OUTPUTS.columnar.directory,
+            status.status.upper(),
+        )
+
+    def get_file_path(self, partition_directory: str, status_class: type) -> str:
+        """
+        Provides the path of the file to write the statuses of the given
+        class into.
+
+        :param partition_directory:
+            The directory of the partition.
+        :param status_class:
+            The class of the statuses to write.
+        """
+
+        return os.path.join(
+            partition_directory,
+            f"{status_class.__name__}_{self._session_id}."
+            f"{self.FORMAT2EXTENSION[self.format]}",
+        )
+
+    def get_writer(self, key: Tuple[str, type]) -> Any:
+        """
+        Provides the (opened) writer of the given partition.
+
+        :param key:
+            The key of the partition.
+        """
+
+        if key in self._writers:
+            return self._writers[key]
+
+        partition_directory, status_class = key
+        file_path = self.get_file_path(partition_directory, status_class)
+
+        DirectoryHelper(partition_directory).create()
+
+        PyFunceble.facility.Logger.debug("Opening %r.", file_path)
+
+        if self.format == "parquet":
+            writer = pyarrow.parquet.ParquetWriter(
+                file_path, self.get_schema(status_class)
+            )
+        elif self.format == "arrow":
+            writer = pyarrow.ipc.new_file(file_path, self.get_schema(status_class))
+        else:
+            # pylint: disable=consider-using-with
+            writer = open(file_path, "a", encoding="utf-8")
+
+        self._writers[key] = writer
+
+        return writer
+
+    def write_batch(self, key: Tuple[str, type]) -> "ColumnarStatusWriter":
+        """
+        Writes the buffered statuses of the given partition.
+
+        :param key:
+            The key of the partition.
+        """
+
+        records = self._buffers.pop(key, None)
+
+        if not records:
+            return self
+
+        writer = self.get_writer(key)
+
+        if self.format == "jsonl":
+            writer.write(
+                "".join(json.dumps(x, cls=ComplexJsonEncoder) + "\n" for x in records)
+            )
+            writer.flush()
+
+            return self
+
+        columns = {}
+
+        for name, column_type in self.get_columns(key[1]).items():
+            if column_type is dict:
+                columns[name] = [
+                    (
+                        json.dumps(x[name], cls=ComplexJsonEncoder)
+                        if x.get(name) is not None
+                        else None
+                    )
+                    for x in records
+                ]
+            else:
+                columns[name] = [x.get(name) for x in records]
+
+        batch = pyarrow.RecordBatch.from_pydict(columns, schema=self.get_schema(key[1]))
+
+        writer.write_batch(batch)
+
+        return self
+
+    def add(self, status: CheckerStatusBase) -> "ColumnarStatusWriter":
+        """
+        Adds the given status into the buffer of its partition. The buffer is
+        written once it reaches the batch size.
+
+        :param status:
+            The status to add.
+
+        :raise TypeError:
+            When the given :code:`status` is not a
+            :class:`~PyFunceble.checker.status_base.CheckerStatusBase`.
+        """
+
+        if not isinstance(status, CheckerStatusBase):
+            raise TypeError(
+                f"<status> should be {CheckerStatusBase}, {type(status)} given."
+            )
+
+        key = (self.get_partition_directory(status), type(status))
+
+        self._buffers.setdefault(key, []).append(status.to_dict())
+
+        if len(self._buffers[key]) >= self.batch_size:
+            self.write_batch(key)
+
+        return self
+
+    def flush(self) -> "ColumnarStatusWriter":
+        """
+        Writes the buffered statuses of all partitions.
+        """
+
+        for key in list(self._buffers):
+            self.write_batch(key)
+
+        return self
+
+    def close(self) -> "ColumnarStatusWriter":
+        """
+        Writes the buffered statuses and closes all files.
+        """
+
+        self.flush()
+
+        while self._writers:
+            _, writer = self._writers.popitem()
+            writer.close()
+
+        return self
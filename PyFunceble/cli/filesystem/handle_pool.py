@@ -0,0 +1,350 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides a pool of opened file handles.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import collections
+import os
+import time
+from typing import Optional, TextIO
+
+import PyFunceble.facility
+import PyFunceble.storage
+from PyFunceble.helpers.directory import DirectoryHelper
+
+
+class FileHandlePool:
+    """
+    Provides a pool of opened (append) file handles.
+
+    Instead of opening and closing a file for each line we write, we keep
+    (at most :code:`max_handles`) files open and let them buffer what we
+    write into them.
+
+    .. note::
+        The least recently used handle is closed when we need to open a new
+        one while the pool is full.
+
+    .. note::
+        The buffered data are written every :code:`flush_interval` seconds
+        (checked at each write), when :code:`flush` is called and when the
+        pool is closed.
+
+    .. warning::
+        The pool assumes that we are the only writer of the files it
+        handles. The buffers are not flushed on line boundaries. Therefore,
+        the lines of multiple writers would get interleaved.
+
+    .. warning::
+        What is still buffered when the process is killed is lost.
+    """
+
+    STD_MAX_HANDLES: int = 64
+    STD_BUFFER_SIZE: int = 64 * 1024
+    STD_FLUSH_INTERVAL: float = 5.0
+    STD_ENCODING: str = "utf-8"
+
+    _handles: Optional[collections.OrderedDict] = None
+
+    _max_handles: int = 64
+    _buffer_size: int = 64 * 1024
+    _flush_interval: float = 5.0
+    _last_flush: float = 0.0
+
+    def __init__(
+        self,
+        *,
+        max_handles: Optional[int] = None,
+        buffer_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ) -> None:
+        self._handles = collections.OrderedDict()
+
+        if max_handles is not None:
+            self.max_handles = max_handles
+        else:
+            self.max_handles = self.STD_MAX_HANDLES
+
+        if buffer_size is not None:
+            self.buffer_size = buffer_size
+        else:
+            self.guess_and_set_buffer_size()
+
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        else:
+            self.flush_interval = self.STD_FLUSH_INTERVAL
+
+        self._last_flush = time.monotonic()
+
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self._handles
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    @property
+    def max_handles(self) -> int:
+        """
+        Provides the current state of the :code:`_max_handles` attribute.
+        """
+
+        return self._max_handles
+
+    @max_handles.setter
+    def max_handles(self, value: int) -> None:
+        """
+        Sets the maximum number of handles to keep open.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not an :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError(f"<value> ({value!r}) should be greater than 0.")
+
+        self._max_handles = value
+
+    def set_max_handles(self, value: int) -> "FileHandlePool":
+        """
+        Sets the maximum number of handles to keep open.
+
+        :param value:
+            The value to set.
+        """
+
+        self.max_handles = value
+
+        return self
+
+    @property
+    def buffer_size(self) -> int:
+        """
+        Provides the current state of the :code:`_buffer_size` attribute.
+        """
+
+        return self._buffer_size
+
+    @buffer_size.setter
+    def buffer_size(self, value: int) -> None:
+        """
+        Sets the size (in bytes) of the buffer of each newly opened handle.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not an :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError(f"<value> ({value!r}) should be greater than 0.")
+
+        self._buffer_size = value
+
+    def set_buffer_size(self, value: int) -> "FileHandlePool":
+        """
+        Sets the size (in bytes) of the buffer of each newly opened handle.
+
+        :param value:
+            The value to set.
+        """
+
+        self.buffer_size = value
+
+        return self
+
+    def guess_and_set_buffer_size(self) -> "FileHandlePool":
+        """
+        Tries to guess the size of the buffer from the configuration.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded() and (
+            PyFunceble.storage.CONFIGURATION.cli_testing.file_generation.buffer_size
+        ):
+            self.buffer_size = int(
+                PyFunceble.storage.CONFIGURATION.cli_testing.file_generation.buffer_size
+            )
+        else:
+            self.buffer_size = self.STD_BUFFER_SIZE
+
+        return self
+
+    @property
+    def flush_interval(self) -> float:
+        """
+        Provides the current state of the :code:`_flush_interval` attribute.
+        """
+
+        return self._flush_interval
+
+    @flush_interval.setter
+    def flush_interval(self, value: float) -> None:
+        """
+        Sets the number of seconds between two flushes of the handles.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`float` nor an
+            :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is negative.
+        """
+
+        if not isinstance(value, (float, int)) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {float}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError(f"<value> ({value!r}) should be positive.")
+
+        self._flush_interval = float(value)
+
+    def set_flush_interval(self, value: float) -> "FileHandlePool":
+        """
+        Sets the number of seconds between two flushes of the handles.
+
+        :param value:
+            The value to set.
+        """
+
+        self.flush_interval = value
+
+        return self
+
+    def get_handle(self, file_path: str) -> TextIO:
+        """
+        Provides the (append) handle of the given file. If it is not open
+        yet, we open it - and close the least recently used one if the pool
+        is full.
+
+        :param file_path:
+            The path of the file to provide the handle for.
+        """
+
+        handle = self._handles.get(file_path)
+
+        if handle is not None:
+            self._handles.move_to_end(file_path)
+            return handle
+
+        while len(self._handles) >= self.max_handles:
+            oldest_path, oldest = self._handles.popitem(last=False)
+
+            PyFunceble.facility.Logger.debug("Closing handle of %r.", oldest_path)
+            oldest.close()
+
+        DirectoryHelper(os.path.dirname(file_path)).create()
+
+        # pylint: disable=consider-using-with
+        handle = open(
+            file_path, "a", encoding=self.STD_ENCODING, buffering=self.buffer_size
+        )
+        self._handles[file_path] = handle
+
+        PyFunceble.facility.Logger.debug("Opened handle of %r.", file_path)
+
+        return handle
+
+    def write(self, file_path: str, data: str) -> "FileHandlePool":
+        """
+        Writes the given data into the given file.
+
+        :param file_path:
+            The path of the file to write into.
+        :param data:
+            The data to write.
+        """
+
+        self.get_handle(file_path).write(data)
+
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+        return self
+
+    def flush(self) -> "FileHandlePool":
+        """
+        Writes the buffered data of all handles into their files.
+        """
+
+        for handle in self._handles.values():
+            handle.flush()
+
+        self._last_flush = time.monotonic()
+
+        return self
+
+    def close(self) -> "FileHandlePool":
+        """
+        Closes (and therefore flushes) all handles.
+        """
+
+        while self._handles:
+            _, handle = self._handles.popitem(last=False)
+            handle.close()
+
+        self._last_flush = time.monotonic()
+
+        return self
@@ -53,6 +53,7 @@ License:
 import copy
 import functools
 import os
+import time
 from typing import Dict, Optional, Union
 
 from PyFunceble.cli.filesystem.dir_base import FilesystemDirBase
@@ -63,6 +64,11 @@ from PyFunceble.helpers.file import FileHelper
 class FilesystemJSONBase(FilesystemDirBase):
     """
     A base interface for the manipulation of JSON files.
+
+    .. note::
+        When buffered, the datasets are kept in memory and only written to
+        their file every :code:`FLUSH_EVERY` saves, every
+        :code:`FLUSH_INTERVAL` seconds or when :code:`flush` is called.
     """
 
     dataset: Dict[str, int] = {}
@@ -71,6 +77,15 @@ class FilesystemJSONBase(FilesystemDirBase):
     SOURCE_FILE: Optional[str] = None
     STD_DATASET: Union[dict, list] = {}
 
+    FLUSH_EVERY: int = 1000
+    FLUSH_INTERVAL: float = 30.0
+
+    _buffered: bool = False
+    _buffer: Optional[Dict[str, Union[dict, list]]] = None
+    _dirty: Optional[set] = None
+    _saves_since_flush: int = 0
+    _last_flush: float = 0.0
+
     def update_source_file_path_beforehand(func):  # pylint: disable=no-self-argument
         """
         Updates the source file before launching the decorated method.
@@ -114,12 +129,93 @@ class FilesystemJSONBase(FilesystemDirBase):
 
         return wrapper
 
+    @property
+    def buffered(self) -> bool:
+        """
+        Provides the current state of the :code:`_buffered` attribute.
+        """
+
+        return self._buffered
+
+    @buffered.setter
+    def buffered(self, value: bool) -> None:
+        """
+        Allows/Disallows the buffering of the datasets in memory.
+
+        .. warning::
+            When disallowed, the buffered datasets are flushed.
+
+        .. warning::
+            Only allow it when the current process is the only writer of the
+            datasets. Each buffered instance overwrites the file with its own
+            in-memory copy.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`bool`.
+        """
+
+        if not isinstance(value, bool):
+            raise TypeError(f"<value> should be {bool}, {type(value)} given.")
+
+        if not value and self._buffered:
+            self.flush()
+
+        if value and self._buffer is None:
+            self._buffer = {}
+            self._dirty = set()
+            self._last_flush = time.monotonic()
+
+        self._buffered = value
+
+    def set_buffered(self, value: bool) -> "FilesystemJSONBase":
+        """
+        Allows/Disallows the buffering of the datasets in memory.
+
+        :param value:
+            The value to set.
+        """
+
+        self.buffered = value
+
+        return self
+
+    @staticmethod
+    def write_dataset(file_path: str, dataset: Union[dict, list]) -> None:
+        """
+        Writes the given dataset into the given file.
+
+        .. note::
+            The dataset is written into a temporary file which then replaces
+            the given file. Therefore, the given file is never half written.
+
+        :param file_path:
+            The file to write.
+        :param dataset:
+            The dataset to write.
+        """
+
+        temp_file_path = f"{file_path}.{os.getpid()}.tmp"
+
+        try:
+            DictHelper(dataset).to_json_file(temp_file_path)
+            os.replace(temp_file_path, file_path)
+        finally:
+            FileHelper(temp_file_path).delete()
+
     @update_source_file_path_beforehand
     def fetch_dataset(self) -> "FilesystemJSONBase":
         """
         Fetch the dataset from the source file.
         """
 
+        if self.buffered and self.source_file_path in self._buffer:
+            self.dataset = self._buffer[self.source_file_path]
+
+            return self
+
         file_helper = FileHelper(self.source_file_path)
 
         if file_helper.exists():
@@ -127,6 +223,9 @@ class FilesystemJSONBase(FilesystemDirBase):
         else:
             self.dataset = copy.deepcopy(self.STD_DATASET)
 
+        if self.buffered:
+            self._buffer[self.source_file_path] = self.dataset
+
         return self
 
     def save_dataset(self) -> "FilesystemJSONBase":
@@ -134,6 +233,36 @@ class FilesystemJSONBase(FilesystemDirBase):
         Saves the current dataset into it's final destination.
         """
 
-        DictHelper(self.dataset).to_json_file(self.source_file_path)
+        if not self.buffered:
+            self.write_dataset(self.source_file_path, self.dataset)
+
+            return self
+
+        self._buffer[self.source_file_path] = self.dataset
+        self._dirty.add(self.source_file_path)
+        self._saves_since_flush += 1
+
+        if (
+            self._saves_since_flush >= self.FLUSH_EVERY
+            or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL
+        ):
+            self.flush()
+
+        return self
+
+    def flush(self) -> "FilesystemJSONBase":
+        """
+        Writes the buffered (and modified) datasets into their files.
+        """
+
+        if not self._dirty:
+            return self
+
+        for file_path in sorted(self._dirty):
+            self.write_dataset(file_path, self._buffer[file_path])
+
+        self._dirty.clear()
+        self._saves_since_flush = 0
+        self._last_flush = time.monotonic()
 
         return self
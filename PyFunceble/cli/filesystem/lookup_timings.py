@@ -0,0 +1,200 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides everything related to the lookup timings counter.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import math
+from typing import Dict, List, Optional, Union
+
+import PyFunceble.cli.storage
+from PyFunceble.cli.filesystem.json_base import FilesystemJSONBase
+
+
+class LookupTimingsCounter(FilesystemJSONBase):
+    """
+    Provides our lookup timings stats counter.
+
+    .. note::
+        We don't keep every single duration. Instead, we keep a log-scaled
+        histogram (in milliseconds) of each lookup stage. Therefore, the
+        provided percentiles are accurate at :code:`BUCKET_GROWTH` (10%) close
+        - which is more than enough for a human reader.
+    """
+
+    STD_DATASET: Dict[str, dict] = {"stages": {}}
+
+    BUCKET_GROWTH: float = 1.1
+    BUCKET_START: float = 0.01
+
+    PERCENTILES: List[int] = [50, 95, 99]
+
+    SOURCE_FILE: str = PyFunceble.cli.storage.LOOKUP_TIMINGS_FILE
+
+    def get_bucket_index(self, duration: float) -> int:
+        """
+        Provides the index of the bucket to use to store the given duration.
+
+        :param duration:
+            The duration (in milliseconds).
+        """
+
+        if duration <= self.BUCKET_START:
+            return 0
+
+        return math.ceil(math.log(duration / self.BUCKET_START, self.BUCKET_GROWTH))
+
+    def get_bucket_upper_bound(self, index: int) -> float:
+        """
+        Provides the upper bound (in milliseconds) of the given bucket.
+
+        :param index:
+            The index of the bucket.
+        """
+
+        return self.BUCKET_START * (self.BUCKET_GROWTH**index)
+
+    @FilesystemJSONBase.fetch_dataset_beforehand
+    def get_percentile(self, stage: str, percentile: int) -> Optional[float]:
+        """
+        Provides the given percentile (in milliseconds) of the given stage.
+
+        :param stage:
+            The lookup stage to work with.
+        :param percentile:
+            The percentile to provide.
+
+        :raise ValueError:
+            When the given :code:`percentile` is not in the :code:`]0, 100]`
+            range.
+        """
+
+        if not 0 < percentile <= 100:
+            raise ValueError(f"<percentile> ({percentile!r}) should be in ]0, 100].")
+
+        if stage not in self.dataset["stages"]:
+            return None
+
+        dataset = self.dataset["stages"][stage]
+        rank = math.ceil(percentile * dataset["count"] / 100)
+        seen = 0
+
+        for index, amount in sorted(
+            ((int(x), y) for x, y in dataset["buckets"].items()), key=lambda x: x[0]
+        ):
+            seen += amount
+
+            if seen >= rank:
+                return min(self.get_bucket_upper_bound(index), dataset["max"])
+
+        return dataset["max"]  # pragma: no cover ## Safety!
+
+    @FilesystemJSONBase.fetch_dataset_beforehand
+    def get_dataset_for_printer(self) -> List[Dict[str, Union[str, int]]]:
+        """
+        Provides the dataset that the printer may understand.
+        """
+
+        result = []
+
+        for stage, dataset in self.dataset["stages"].items():
+            result.append(
+                {
+                    "stage": stage,
+                    "amount": dataset["count"],
+                    **{
+                        f"p{x}": f"{self.get_percentile(stage, x):.2f}"
+                        for x in self.PERCENTILES
+                    },
+                }
+            )
+
+        return result
+
+    @FilesystemJSONBase.update_source_file_path_beforehand
+    @FilesystemJSONBase.fetch_dataset_beforehand
+    @FilesystemJSONBase.save_dataset_afterwards
+    def count(self, timings: Dict[str, float]) -> "LookupTimingsCounter":
+        """
+        Starts the counting process.
+
+        :param timings:
+            The timings (in seconds) to count into our dataset. The keys
+            should be the lookup stage and the values, the time spent by it.
+
+        :raise TypeError:
+            When the given :code:`timings` is not a :py:class:`dict`.
+        """
+
+        if not isinstance(timings, dict):
+            raise TypeError(f"<timings> should be {dict}, {type(timings)} given.")
+
+        if "stages" not in self.dataset:
+            self.dataset = {"stages": {}}
+
+        for stage, duration in timings.items():
+            duration *= 1000
+
+            if stage not in self.dataset["stages"]:
+                self.dataset["stages"][stage] = {
+                    "count": 0,
+                    "total": 0.0,
+                    "max": 0.0,
+                    "buckets": {},
+                }
+
+            dataset = self.dataset["stages"][stage]
+            index = str(self.get_bucket_index(duration))
+
+            dataset["count"] += 1
+            dataset["total"] += duration
+            dataset["max"] = max(dataset["max"], duration)
+            dataset["buckets"][index] = dataset["buckets"].get(index, 0) + 1
+
+        return self
@@ -81,6 +81,10 @@ class PrinterBase:
         "minutes": 2,
         "seconds": 6,
         "registrar": 30,
+        "stage": 15,
+        "p50": 12,
+        "p95": 12,
+        "p99": 12,
     }
 
     TEMPLATES: Dict[str, string.Template] = {
@@ -97,6 +101,7 @@ class PrinterBase:
             "\nExecution Time: $days:$hours:$minutes:$seconds\n"
         ),
         "registrar": string.Template("$registrar $percentage $amount"),
+        "lookup_timings": string.Template("$stage $amount $p50 $p95 $p99"),
     }
 
     HEADERS: Dict[str, str] = {
@@ -114,6 +119,10 @@ class PrinterBase:
         "minutes": "Minutes",
         "seconds": "Seconds",
         "registrar": "Registrar",
+        "stage": "Lookup",
+        "p50": "P50 (ms)",
+        "p95": "P95 (ms)",
+        "p99": "P99 (ms)",
     }
 
     _template_to_use: Optional[str] = None
@@ -285,7 +294,9 @@ class PrinterBase:
         if not value:
             raise ValueError("<value> should not be empty.")
 
-        self._dataset = copy.deepcopy(value)
+        # We only read the first level of the dataset. Therefore, there is no
+        # need to (deeply) copy the nested values.
+        self._dataset = copy.copy(value)
 
     def set_dataset(self, value: Dict[str, str]) -> "PrinterBase":
         """
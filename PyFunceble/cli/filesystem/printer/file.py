@@ -56,6 +56,7 @@ from typing import Dict, Optional
 
 import PyFunceble.facility
 import PyFunceble.storage
+from PyFunceble.cli.filesystem.handle_pool import FileHandlePool
 from PyFunceble.cli.filesystem.printer.base import PrinterBase
 from PyFunceble.helpers.file import FileHelper
 
@@ -74,6 +75,7 @@ class FilePrinter(PrinterBase):
     file_helper: FileHelper = FileHelper()
 
     _destination: Optional[str] = None
+    _file_handle_pool: Optional[FileHandlePool] = None
     allow_coloration: bool = True
 
     def __init__(
@@ -82,11 +84,15 @@ class FilePrinter(PrinterBase):
         *,
         dataset: Optional[Dict[str, str]] = None,
         destination: Optional[str] = None,
+        file_handle_pool: Optional[FileHandlePool] = None,
         **kwargs,
     ) -> None:
         if destination is not None:
             self.destination = destination
 
+        if file_handle_pool is not None:
+            self.file_handle_pool = file_handle_pool
+
         super().__init__(template_to_use=template_to_use, dataset=dataset, **kwargs)
 
     def ensure_destination_is_given(func):  # pylint: disable=no-self-argument
@@ -166,6 +172,44 @@ class FilePrinter(PrinterBase):
 
         return self
 
+    @property
+    def file_handle_pool(self) -> Optional[FileHandlePool]:
+        """
+        Provides the current state of the :code:`_file_handle_pool` attribute.
+        """
+
+        return self._file_handle_pool
+
+    @file_handle_pool.setter
+    def file_handle_pool(self, value: FileHandlePool) -> None:
+        """
+        Sets the pool of file handles to write through.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a
+            :class:`~PyFunceble.cli.filesystem.handle_pool.FileHandlePool`.
+        """
+
+        if not isinstance(value, FileHandlePool):
+            raise TypeError(f"<value> should be {FileHandlePool}, {type(value)} given.")
+
+        self._file_handle_pool = value
+
+    def set_file_handle_pool(self, value: FileHandlePool) -> "FilePrinter":
+        """
+        Sets the pool of file handles to write through.
+
+        :param value:
+            The value to set.
+        """
+
+        self.file_handle_pool = value
+
+        return self
+
     @staticmethod
     def get_generation_date_line() -> str:
         """
@@ -186,19 +230,27 @@ class FilePrinter(PrinterBase):
 
         line_to_print = self.get_line_to_print() + "\n"
         without_header = ["hosts", "plain"]
+        to_write = []
 
         PyFunceble.facility.Logger.debug("Line to print: %r", line_to_print)
 
-        if not self.file_helper.exists():
-            self.file_helper.write(self.STD_FILE_GENERATION, overwrite=True)
-            self.file_helper.write(self.get_generation_date_line())
-            self.file_helper.write("\n\n")
+        if (
+            self.file_handle_pool is None
+            or self.destination not in self.file_handle_pool
+        ) and not self.file_helper.exists():
+            to_write.extend(
+                [self.STD_FILE_GENERATION, self.get_generation_date_line(), "\n\n"]
+            )
 
             if self.template_to_use not in without_header:
-                self.file_helper.write(self.get_header_to_print())
-                self.file_helper.write("\n")
+                to_write.extend([self.get_header_to_print(), "\n"])
+
+        to_write.append(line_to_print)
 
-        self.file_helper.write(line_to_print)
+        if self.file_handle_pool is not None:
+            self.file_handle_pool.write(self.destination, "".join(to_write))
+        else:
+            self.file_helper.write("".join(to_write))
 
         PyFunceble.facility.Logger.info(
             "Finished to write into %r.", self.file_helper.path
@@ -65,6 +65,7 @@ from PyFunceble.cli.filesystem.dir_base import FilesystemDirBase
 from PyFunceble.cli.filesystem.dir_structure.restore import (
     DirectoryStructureRestoration,
 )
+from PyFunceble.cli.filesystem.handle_pool import FileHandlePool
 from PyFunceble.cli.filesystem.printer.file import FilePrinter
 from PyFunceble.helpers.directory import DirectoryHelper
 from PyFunceble.utils.platform import PlatformUtility
@@ -113,6 +114,7 @@ class StatusFileGenerator(FilesystemDirBase):
         allow_unified_file: Optional[bool] = None,
         parent_dirname: Optional[str] = None,
         test_dataset: Optional[dict] = None,
+        file_handle_pool: Optional[FileHandlePool] = None,
     ) -> None:
         if status is not None:
             self.status = status
@@ -145,6 +147,9 @@ class StatusFileGenerator(FilesystemDirBase):
         if test_dataset is not None:
             self.test_dataset = test_dataset
 
+        if file_handle_pool is not None:
+            self.file_handle_pool = file_handle_pool
+
         super().__init__(parent_dirname=parent_dirname)
 
     def ensure_status_is_given(func):  # pylint: disable=no-self-argument
@@ -255,6 +260,45 @@ class StatusFileGenerator(FilesystemDirBase):
 
         return self
 
+    @property
+    def file_handle_pool(self) -> Optional[FileHandlePool]:
+        """
+        Provides the pool of file handles our file printer writes through.
+        """
+
+        return self.file_printer.file_handle_pool
+
+    @file_handle_pool.setter
+    def file_handle_pool(self, value: FileHandlePool) -> None:
+        """
+        Sets the pool of file handles to write through.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a
+            :class:`~PyFunceble.cli.filesystem.handle_pool.FileHandlePool`.
+        """
+
+        if not isinstance(value, FileHandlePool):
+            raise TypeError(f"<value> should be {FileHandlePool}, {type(value)} given.")
+
+        # Our own printer: the default one is shared by all instances.
+        self.file_printer = FilePrinter(file_handle_pool=value)
+
+    def set_file_handle_pool(self, value: FileHandlePool) -> "StatusFileGenerator":
+        """
+        Sets the pool of file handles to write through.
+
+        :param value:
+            The value to set.
+        """
+
+        self.file_handle_pool = value
+
+        return self
+
     @property
     def allow_hosts_files(self) -> bool:
         """
@@ -57,8 +57,11 @@ import queue
 from typing import Any, List, Optional
 
 import PyFunceble.facility
+import PyFunceble.storage
 from PyFunceble.cli.continuous_integration.base import ContinuousIntegrationBase
+from PyFunceble.cli.processes.batch import MessageBatch
 from PyFunceble.cli.processes.workers.base import WorkerBase
+from PyFunceble.utils.platform import PlatformUtility
 
 
 class ProcessesManagerBase:
@@ -73,6 +76,9 @@ class ProcessesManagerBase:
     else:
         STD_MAX_WORKER: int = 1
 
+    STD_DIRECT_QUEUE: bool = False
+    STD_BATCH_SIZE: int = 1
+
     WORKER_OBJ: Optional[WorkerBase] = None
 
     input_datasets: Optional[List] = []
@@ -107,6 +113,11 @@ class ProcessesManagerBase:
     _output_workers_count: Optional[int] = None
 
     _max_worker: Optional[int] = None
+    _direct_queue: bool = False
+    _batch_size: int = 1
+
+    _input_batch: Optional[MessageBatch] = None
+    _input_batch_worker_name: Optional[str] = None
 
     def __init__(
         self,
@@ -121,15 +132,29 @@ class ProcessesManagerBase:
         generate_output_queue: bool = True,
         output_queue_num: int = 1,
         output_workers_count: Optional[int] = None,
+        direct_queue: Optional[bool] = None,
+        batch_size: Optional[int] = None,
     ) -> None:
+        if direct_queue is not None:
+            self.direct_queue = direct_queue
+        else:
+            self.guess_and_set_direct_queue()
+
+        if batch_size is not None:
+            self.batch_size = batch_size
+        else:
+            self.guess_and_set_batch_size()
+
         if manager is not None:
             self.manager = manager
-        else:
+        elif not self.direct_queue:
             self.manager = multiprocessing.Manager()
+        else:
+            self.manager = None
 
         if input_queue is None:
             if generate_input_queue:
-                self.input_queue = self.manager.Queue()
+                self.input_queue = self.create_queue()
             else:
                 self.input_queue = None
         else:
@@ -138,7 +163,7 @@ class ProcessesManagerBase:
         if output_queue is None:
             if generate_output_queue:
                 self.output_queue = [
-                    self.manager.Queue() for _ in range(output_queue_num)
+                    self.create_queue() for _ in range(output_queue_num)
                 ]
             else:
                 self.output_queue = None
@@ -256,6 +281,138 @@ class ProcessesManagerBase:
 
         return self
 
+    @property
+    def direct_queue(self) -> bool:
+        """
+        Provides the current state of the :code:`_direct_queue` attribute.
+        """
+
+        return self._direct_queue
+
+    @direct_queue.setter
+    def direct_queue(self, value: bool) -> None:
+        """
+        Sets whether we should use direct (:py:class:`multiprocessing.Queue`)
+        queues instead of the queue proxies of our manager.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`bool`.
+        """
+
+        if not isinstance(value, bool):
+            raise TypeError(f"<value> should be {bool}, {type(value)} given.")
+
+        self._direct_queue = value
+
+    def set_direct_queue(self, value: bool) -> "ProcessesManagerBase":
+        """
+        Sets whether we should use direct (:py:class:`multiprocessing.Queue`)
+        queues instead of the queue proxies of our manager.
+
+        :param value:
+            The value to set.
+        """
+
+        self.direct_queue = value
+
+        return self
+
+    def guess_and_set_direct_queue(self) -> "ProcessesManagerBase":
+        """
+        Try to guess and set the usage of direct queues.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            # The size of a direct queue can't be read under Mac OS - and we
+            # need it.
+            self.direct_queue = (
+                bool(PyFunceble.storage.CONFIGURATION.cli_testing.direct_queues)
+                and not PlatformUtility.is_mac_os()
+            )
+        else:
+            self.direct_queue = self.STD_DIRECT_QUEUE
+
+        return self
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Provides the current state of the :code:`_batch_size` attribute.
+        """
+
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: int) -> None:
+        """
+        Sets the maximal number of messages to share as a single batch through
+        the input queue.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError("<value> should be greater or equal to one.")
+
+        self._batch_size = value
+
+    def set_batch_size(self, value: int) -> "ProcessesManagerBase":
+        """
+        Sets the maximal number of messages to share as a single batch through
+        the input queue.
+
+        :param value:
+            The value to set.
+        """
+
+        self.batch_size = value
+
+        return self
+
+    def guess_and_set_batch_size(self) -> "ProcessesManagerBase":
+        """
+        Try to guess and set the batch size.
+        """
+
+        if (
+            PyFunceble.facility.ConfigLoader.is_already_loaded()
+            and PyFunceble.storage.CONFIGURATION.cli_testing.queue_batch_size
+        ):
+            self.batch_size = int(
+                PyFunceble.storage.CONFIGURATION.cli_testing.queue_batch_size
+            )
+        else:
+            self.batch_size = self.STD_BATCH_SIZE
+
+        return self
+
+    def create_queue(self) -> queue.Queue:
+        """
+        Provides a new queue to work with.
+
+        When the direct queues are authorized, the provided queue is a
+        :py:class:`multiprocessing.Queue` - which communicates directly through
+        a pipe. Otherwise, it is a queue proxy which goes through the server
+        process of our manager for each :code:`put` and :code:`get`.
+        """
+
+        if self.direct_queue:
+            return multiprocessing.Queue()
+
+        return self.manager.Queue()
+
     def is_running(self) -> bool:
         """
         Checks if a worker is running.
@@ -405,6 +562,63 @@ class ProcessesManagerBase:
 
         PyFunceble.facility.Logger.debug("Added to the (main) queue: %r", data)
 
+    def add_to_input_batch(
+        self,
+        data: dict,
+        *,
+        header: Optional[dict] = None,
+        worker_name: Optional[str] = None,
+    ) -> "ProcessesManagerBase":
+        """
+        Adds the given data to the batch of the input queue. The batch is
+        shared through the input queue as soon as it is full, or when the
+        header changes.
+
+        :param data:
+            The (message specific) data to add into the batch.
+        :param header:
+            The dataset shared by all messages of the batch. The given data is
+            merged over it by the worker.
+        :param worker_name:
+            The name of the worker that is sending the message.
+        """
+
+        if header is None:
+            header = {}
+
+        if self.batch_size <= 1:
+            self.add_to_input_queue({**header, **data}, worker_name=worker_name)
+            return self
+
+        if self._input_batch is not None and (
+            self._input_batch.header != header
+            or self._input_batch_worker_name != worker_name
+        ):
+            self.flush_input_batch()
+
+        if self._input_batch is None:
+            self._input_batch = MessageBatch(header=dict(header))
+            self._input_batch_worker_name = worker_name
+
+        self._input_batch.append(data)
+
+        if len(self._input_batch) >= self.batch_size:
+            self.flush_input_batch()
+
+        return self
+
+    def flush_input_batch(self) -> "ProcessesManagerBase":
+        """
+        Shares the current batch (if any) through the input queue.
+        """
+
+        if self._input_batch is not None:
+            batch, self._input_batch = self._input_batch, None
+
+            self.add_to_input_queue(batch, worker_name=self._input_batch_worker_name)
+
+        return self
+
     @create_workers_if_missing
     def add_to_output_queue(
         self, data: Any, *, worker_name: Optional[str] = None
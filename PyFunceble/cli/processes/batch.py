@@ -0,0 +1,105 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the batch of messages we share through our queues.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from typing import Any, Iterator, List, Optional
+
+
+class MessageBatch:
+    """
+    Provides a batch of messages which can be shared through our queues as a
+    single message. This let us pay the (pickling and) IPC cost once for
+    many messages.
+
+    :param messages:
+        The messages of the batch.
+    :param header:
+        The dataset shared by all messages of the batch. When given, each
+        message is expected to be a :py:class:`dict` which will be merged
+        over (a copy of) the header while unpacking.
+    """
+
+    __slots__ = ("messages", "header")
+
+    def __init__(
+        self, messages: Optional[List[Any]] = None, header: Optional[dict] = None
+    ) -> None:
+        if messages is not None:
+            self.messages = messages
+        else:
+            self.messages = []
+
+        self.header = header
+
+    def __repr__(self) -> str:
+        return f"<MessageBatch header={self.header!r} size={len(self.messages)}>"
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.header is None:
+            yield from self.messages
+        else:
+            for message in self.messages:
+                yield {**self.header, **message}
+
+    def append(self, message: Any) -> "MessageBatch":
+        """
+        Appends the given message to the batch.
+
+        :param message:
+            The message to append.
+        """
+
+        self.messages.append(message)
+
+        return self
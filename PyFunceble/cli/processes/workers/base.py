@@ -63,6 +63,7 @@ import PyFunceble.cli.factory
 import PyFunceble.facility
 import PyFunceble.sessions
 from PyFunceble.cli.continuous_integration.base import ContinuousIntegrationBase
+from PyFunceble.cli.processes.batch import MessageBatch
 
 
 class WorkerBase(multiprocessing.Process):
@@ -93,6 +94,7 @@ class WorkerBase(multiprocessing.Process):
 
     concurrent_worker_names: Optional[List[str]] = None
     db_session: Optional[PyFunceble.cli.factory.db_session] = None
+    logging_queue: Optional[multiprocessing.Queue] = None
 
     _parent_connection: Optional[multiprocessing.connection.Connection] = None
     _child_connection: Optional[multiprocessing.connection.Connection] = None
@@ -129,6 +131,9 @@ class WorkerBase(multiprocessing.Process):
         self.accept_waiting_delay = True
         self.concurrent_worker_names = []
 
+        # The queue of the listener which writes our logs (if activated).
+        self.logging_queue = PyFunceble.facility.Logger.queue
+
         try:
             self.db_session = (
                 PyFunceble.cli.factory.DBSession.get_db_session().get_new_session()()
@@ -149,6 +154,12 @@ class WorkerBase(multiprocessing.Process):
         A method which will be executed after the :code:`__init__` method.
         """
 
+    def __post_run__(self) -> None:
+        """
+        A method which will be executed (within the worker) after the
+        :code:`run` loop ended.
+        """
+
     @property
     def exception(self):
         """
@@ -281,6 +292,10 @@ class WorkerBase(multiprocessing.Process):
             PyFunceble.cli.facility.CredentialLoader.start()
             PyFunceble.cli.factory.DBSession.init_db_sessions()
 
+        if self.logging_queue is not None:
+            # Our records are written by the listener of the main process.
+            PyFunceble.facility.Logger.set_queue(self.logging_queue).init_loggers()
+
         # Be sure that all settings are loaded proprely!!
         PyFunceble.factory.Requester = PyFunceble.factory.requester()
 
@@ -374,8 +389,19 @@ class WorkerBase(multiprocessing.Process):
                     self.share_waiting_message(apply_breakoff=wait_for_stop)
                     continue
 
+                if isinstance(consumed, MessageBatch):
+                    to_process = consumed
+                else:
+                    to_process = [consumed]
+
+                results = []
+
                 try:
-                    result = self.target(consumed)
+                    for data in to_process:
+                        result = self.target(data)
+
+                        if result is not None:
+                            results.append(result)
                 except (EOFError, KeyboardInterrupt):
                     PyFunceble.facility.Logger.info(
                         "Got EOFError/KeyboardInterrupt. Stopping worker."
@@ -383,9 +409,13 @@ class WorkerBase(multiprocessing.Process):
                     self.global_exit_event.set()
                     break
 
-                if result is not None:
-                    self.add_to_output_queue(result)
+                if len(results) > 1:
+                    # The results of a batch are shared as a batch.
+                    self.add_to_output_queue(MessageBatch(results))
+                elif results:
+                    self.add_to_output_queue(results[0])
 
+                for result in results:
                     PyFunceble.facility.Logger.info(
                         "Produced: %r",
                         result,
@@ -404,6 +434,8 @@ class WorkerBase(multiprocessing.Process):
 
             self.exit_it.set()
             raise exception
+        finally:
+            self.__post_run__()
 
     def terminate(self) -> None:
         """
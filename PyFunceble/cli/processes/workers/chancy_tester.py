@@ -77,6 +77,11 @@ class ChancyTesterWorker(TesterWorker):
 
         return super().__post_init__()
 
+    def __post_run__(self) -> None:
+        self.producer_worker.__post_run__()
+
+        return super().__post_run__()
+
     def target(self, consumed: dict) -> Optional[Tuple[Any, ...]]:
         """
         The actually wall destructor.
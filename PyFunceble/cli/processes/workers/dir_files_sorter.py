@@ -103,6 +103,7 @@ class DireFileSorterWorker(FileSorterWorkerBase):
                 PyFunceble.cli.storage.OUTPUTS.logs.directories.parent,
             ),
             os.path.join(directory, PyFunceble.cli.storage.OUTPUTS.splitted.directory),
+            os.path.join(directory, PyFunceble.cli.storage.OUTPUTS.columnar.directory),
         ]
 
         files_to_ignore = [
@@ -111,6 +112,7 @@ class DireFileSorterWorker(FileSorterWorkerBase):
             PyFunceble.cli.storage.TEST_RUNNING_FILE,
             PyFunceble.cli.storage.COUNTER_FILE,
             PyFunceble.cli.storage.REGISTRAR_COUNTER_FILE,
+            PyFunceble.cli.storage.LOOKUP_TIMINGS_FILE,
             PyFunceble.cli.storage.PRE_LOADER_FILE,
         ]
 
@@ -155,21 +157,36 @@ class DireFileSorterWorker(FileSorterWorkerBase):
         else:
             write_header = True
 
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=PyFunceble.storage.CONFIGURATION.cli_testing.max_workers,
-        ) as executor:
-            submitted_list = []
-
-            for file in self.get_files_to_sort(directory):
-                submitted = executor.submit(
-                    self.process_file_sorting, file, remove_duplicates, write_header
-                )
-                submitted_list.append(submitted)
-
-            for submitted in concurrent.futures.as_completed(submitted_list):
-                # Ensure that everything is finished
-
-                if submitted.exception():
-                    raise submitted.exception()
+        # The chunks of all files are sorted by the same pool of processes -
+        # and share the same pending slots.
+        chunk_workers = self.get_chunk_workers()
+        chunk_executor = self.get_chunk_executor(chunk_workers)
+        pending_chunks = self.get_pending_chunks_slots(chunk_workers)
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=PyFunceble.storage.CONFIGURATION.cli_testing.max_workers,
+            ) as executor:
+                submitted_list = []
+
+                for file in self.get_files_to_sort(directory):
+                    submitted = executor.submit(
+                        self.process_file_sorting,
+                        file,
+                        remove_duplicates,
+                        write_header,
+                        executor=chunk_executor,
+                        pending_chunks=pending_chunks,
+                    )
+                    submitted_list.append(submitted)
+
+                for submitted in concurrent.futures.as_completed(submitted_list):
+                    # Ensure that everything is finished
+
+                    if submitted.exception():
+                        raise submitted.exception()
+        finally:
+            if chunk_executor is not None:
+                chunk_executor.shutdown()
 
         return None
@@ -109,8 +109,19 @@ class FileSorterWorker(FileSorterWorkerBase):
         else:
             write_header = True
 
-        self.process_file_sorting(
-            file, remove_duplicates=remove_duplicates, write_header=write_header
-        )
+        chunk_workers = self.get_chunk_workers()
+        chunk_executor = self.get_chunk_executor(chunk_workers)
+
+        try:
+            self.process_file_sorting(
+                file,
+                remove_duplicates=remove_duplicates,
+                write_header=write_header,
+                executor=chunk_executor,
+                pending_chunks=self.get_pending_chunks_slots(chunk_workers),
+            )
+        finally:
+            if chunk_executor is not None:
+                chunk_executor.shutdown()
 
         return None
@@ -50,13 +50,16 @@ License:
     limitations under the License.
 """
 
+import concurrent.futures
 import heapq
+import json
+import multiprocessing
 import os
 import secrets
+import sys
 import tempfile
-from io import TextIOWrapper
-from itertools import islice
-from typing import Any, Generator, List, Tuple
+import threading
+from typing import Any, Callable, Generator, Iterable, List, Optional
 
 import PyFunceble.cli.storage
 import PyFunceble.facility
@@ -66,7 +69,6 @@ from PyFunceble.cli.filesystem.printer.file import FilePrinter
 from PyFunceble.cli.processes.workers.base import WorkerBase
 from PyFunceble.cli.utils.sort import get_best_sorting_key
 from PyFunceble.helpers.file import FileHelper
-from PyFunceble.helpers.list import ListHelper
 
 
 class FileSorterWorkerBase(WorkerBase):
@@ -74,7 +76,24 @@ class FileSorterWorkerBase(WorkerBase):
     Provides our the base of all our file sorters.
     """
 
-    MAX_LINES: int = 32_000
+    MAX_CHUNK_MEMORY: int = 64 * 1024 * 1024
+    """
+    The (approximate) maximal number of bytes a chunk - its lines and their
+    keys - may take in memory.
+    """
+
+    RECORD_MEMORY_FACTOR: int = 3
+    """
+    The factor to apply to the size of a line to estimate the memory taken by
+    the line, its key and the (decorated) record holding both.
+    """
+
+    PENDING_CHUNKS_PER_WORKER: int = 2
+    """
+    The maximal number of chunks - per worker of the pool - which may wait for
+    (or be in) a parallel sort at the same time.
+    """
+
     FILE_BUFFER_SIZE: int = 64 * 1024
 
     def __post_init__(self) -> None:
@@ -83,6 +102,281 @@ class FileSorterWorkerBase(WorkerBase):
 
         return super().__post_init__()
 
+    @staticmethod
+    def get_chunk_workers(max_workers: Optional[int] = None) -> int:
+        """
+        Provides the number of processes to sort the chunks with.
+
+        :param max_workers:
+            The maximal number of processes to use.
+
+            When not given, we read the configured number of workers - or
+            fallback to the number of CPUs.
+        """
+
+        if max_workers is None:
+            if PyFunceble.facility.ConfigLoader.is_already_loaded():
+                max_workers = PyFunceble.storage.CONFIGURATION.cli_testing.max_workers
+
+            if not max_workers:
+                max_workers = os.cpu_count() or 1
+
+        return max_workers
+
+    @classmethod
+    def get_chunk_executor(
+        cls,
+        max_workers: Optional[int] = None,
+    ) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        """
+        Provides the pool of processes to sort the chunks with - when we are
+        allowed to sort in parallel.
+
+        .. note::
+            We only sort in parallel when the :code:`fork` start method is
+            used. Otherwise, the configuration (thus the sorting key) may
+            differ between the processes.
+
+        :param max_workers:
+            The maximal number of processes to use.
+
+            When not given, we read the configured number of workers - or
+            fallback to the number of CPUs.
+        """
+
+        if multiprocessing.get_start_method() != "fork":
+            return None
+
+        if multiprocessing.current_process().daemon:
+            # Daemonic processes are not allowed to have children.
+            return None
+
+        max_workers = cls.get_chunk_workers(max_workers)
+
+        if max_workers <= 1:
+            return None
+
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+
+    @classmethod
+    def get_pending_chunks_slots(
+        cls, max_workers: Optional[int] = None
+    ) -> threading.BoundedSemaphore:
+        """
+        Provides the slots a chunk has to take before being given to our pool
+        of processes.
+
+        .. note::
+            Share the same slots between all the sorts using the same pool.
+            That way, at most :code:`PENDING_CHUNKS_PER_WORKER` chunks per
+            worker are kept in memory - whatever the number of files being
+            sorted.
+
+        :param max_workers:
+            The maximal number of processes of the pool.
+
+            When not given, we read the configured number of workers - or
+            fallback to the number of CPUs.
+        """
+
+        return threading.BoundedSemaphore(
+            cls.PENDING_CHUNKS_PER_WORKER * max(1, cls.get_chunk_workers(max_workers))
+        )
+
+    @classmethod
+    def iter_chunks(
+        cls, lines: Iterable[str], max_chunk_memory: Optional[int] = None
+    ) -> Generator[List[str], None, None]:
+        """
+        Splits the given lines into chunks which (approximately) fit into the
+        given memory budget.
+
+        :param lines:
+            The lines to split.
+        :param max_chunk_memory:
+            The maximal number of bytes a chunk may take in memory.
+        """
+
+        if max_chunk_memory is None:
+            max_chunk_memory = cls.MAX_CHUNK_MEMORY
+
+        chunk = []
+        chunk_memory = 0
+
+        for line in lines:
+            if not line.endswith("\n"):
+                line += "\n"
+
+            chunk.append(line)
+            chunk_memory += sys.getsizeof(line) * cls.RECORD_MEMORY_FACTOR
+
+            if chunk_memory >= max_chunk_memory:
+                yield chunk
+
+                chunk = []
+                chunk_memory = 0
+
+        if chunk:
+            yield chunk
+
+    @classmethod
+    def sort_chunk(
+        cls,
+        lines: List[str],
+        destination: str,
+        *,
+        sorting_key: Callable[[str], Any],
+        remove_duplicates: bool = True,
+    ) -> str:
+        """
+        Sorts the given lines and write them - along with their keys - into
+        the given destination.
+
+        The key of each line is computed once (decorate-sort-undecorate) and
+        stored next to the line so that the merge doesn't have to compute it
+        again.
+
+        :param lines:
+            The lines to sort.
+        :param destination:
+            The file to write.
+        :param sorting_key:
+            The sorting key to apply.
+        :param remove_duplicates:
+            Activates the deletion of duplicates.
+        """
+
+        if remove_duplicates:
+            lines = dict.fromkeys(lines)
+
+        records = sorted((sorting_key(x), x) for x in lines)
+
+        with open(
+            destination, "w", encoding="utf-8", buffering=cls.FILE_BUFFER_SIZE
+        ) as file_stream:
+            file_stream.writelines(f"{json.dumps(x)}\n" for x in records)
+
+        return destination
+
+    @classmethod
+    def sort_chunks(
+        cls,
+        lines: Iterable[str],
+        directory: str,
+        *,
+        sorting_key: Callable[[str], Any],
+        remove_duplicates: bool = True,
+        max_chunk_memory: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        pending_chunks: Optional[threading.Semaphore] = None,
+    ) -> List[str]:
+        """
+        Splits the given lines into chunks and sorts each of them into its own
+        file.
+
+        :param lines:
+            The lines to sort.
+        :param directory:
+            The directory to write the sorted chunks into.
+        :param sorting_key:
+            The sorting key to apply.
+        :param remove_duplicates:
+            Activates the deletion of duplicates.
+        :param max_chunk_memory:
+            The maximal number of bytes a chunk may take in memory.
+        :param executor:
+            The executor to sort the chunks with.
+        :param pending_chunks:
+            The slots a chunk has to take before being given to the executor.
+            A slot is given back once the chunk is sorted.
+
+            When not given, we only allow :code:`PENDING_CHUNKS_PER_WORKER`
+            pending chunks.
+
+        :return:
+            The sorted chunk files - in the order of their chunks.
+        """
+
+        sorted_files = []
+
+        if executor is not None and pending_chunks is None:
+            pending_chunks = cls.get_pending_chunks_slots(1)
+
+        for chunk in cls.iter_chunks(lines, max_chunk_memory):
+            args = (chunk, os.path.join(directory, secrets.token_hex(6)))
+            kwargs = {
+                "sorting_key": sorting_key,
+                "remove_duplicates": remove_duplicates,
+            }
+
+            if executor is None:
+                sorted_files.append(cls.sort_chunk(*args, **kwargs))
+                continue
+
+            # We don't want to read the whole file into memory.
+            pending_chunks.acquire()
+
+            try:
+                submitted = executor.submit(cls.sort_chunk, *args, **kwargs)
+            except BaseException:
+                pending_chunks.release()
+                raise
+
+            submitted.add_done_callback(lambda _: pending_chunks.release())
+            sorted_files.append(submitted)
+
+        return [
+            x.result() if isinstance(x, concurrent.futures.Future) else x
+            for x in sorted_files
+        ]
+
+    @classmethod
+    def iter_chunk_records(cls, chunk_file: str) -> Generator[list, None, None]:
+        """
+        Provides the (decorated) records of the given chunk file.
+
+        :param chunk_file:
+            The chunk file to read.
+        """
+
+        with open(
+            chunk_file, "r", encoding="utf-8", buffering=cls.FILE_BUFFER_SIZE
+        ) as file_stream:
+            for line in file_stream:
+                yield json.loads(line)
+
+    @classmethod
+    def merge_chunks(
+        cls,
+        chunk_files: List[str],
+        *,
+        remove_duplicates: bool = True,
+        write_header: bool = True,
+    ) -> Generator[str, None, None]:
+        """
+        Merges the given (sorted) chunk files and yield each lines of the
+        merged file.
+
+        :param chunk_files:
+            The chunk files to merge.
+        :param remove_duplicates:
+            Activates the deletion of duplicates.
+        :param write_header:
+            Activates the deletion of our (previous) header lines.
+        """
+
+        previous = None
+
+        for _, value in heapq.merge(*[cls.iter_chunk_records(x) for x in chunk_files]):
+            if remove_duplicates and value == previous:
+                continue
+
+            if write_header and value[0] == "#":
+                continue
+
+            yield value
+            previous = value
+
     @classmethod
     def process_file_sorting(
         cls,
@@ -90,6 +384,10 @@ class FileSorterWorkerBase(WorkerBase):
         remove_duplicates: bool = True,
         write_header: bool = True,
         sorting_key: Any = None,
+        *,
+        max_chunk_memory: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        pending_chunks: Optional[threading.Semaphore] = None,
     ) -> None:
         """
         Process the sorting of the given file.
@@ -107,73 +405,27 @@ class FileSorterWorkerBase(WorkerBase):
 
             .. warning::
                 When this is set to :py:class:`True`, we assume that the header
-                itself was already given. Meaning that the first 2 commented
-                lines will be excluded from the sorting and regenerated.
+                itself was already given. Meaning that the commented lines will
+                be excluded from the sorting and regenerated.
         :param sorting_key:
             The sorting key to apply while sorting.
 
             This is the lambda/function that goes into the :code:`key` argument
             of the :py:class:`sorted` function.
+        :param max_chunk_memory:
+            The maximal number of bytes a chunk may take in memory.
+        :param executor:
+            The executor to sort the chunks with.
+
+            When given, the chunks are sorted in parallel and merged once
+            all of them are sorted.
+        :param pending_chunks:
+            The slots a chunk has to take before being given to the executor.
+
+            .. seealso::
+                :meth:`get_pending_chunks_slots`
         """
 
-        # pylint: disable=too-many-locals,too-many-statements
-
-        def merge_files(
-            files: List[TextIOWrapper],
-        ) -> Generator[Tuple[List[TextIOWrapper]], str, None]:
-            """
-            Merges the given files and yield each "lines" of the merged file.
-
-            :param files:
-                The files to merge.
-            """
-
-            result = []
-
-            for index, file in enumerate(files):
-                try:
-                    iterator = iter(file)
-                    value = next(iterator)
-
-                    heapq.heappush(
-                        result, ((sorting_key(value), index, value, iterator, file))
-                    )
-                except StopIteration:
-                    file.close()
-
-            previous = None
-            comment_count = 0
-            max_comment_count = 2
-
-            while result:
-                ignore = False
-
-                _, index, value, iterator, file = heapq.heappop(result)
-
-                if remove_duplicates and value == previous:
-                    ignore = True
-
-                if (
-                    write_header
-                    and comment_count < max_comment_count
-                    and value[0] == "#"
-                ):
-                    ignore = True
-                    max_comment_count += 1
-
-                if not ignore:
-                    yield value
-                    previous = value
-
-                try:
-                    value = next(iterator)
-
-                    heapq.heappush(
-                        result, ((sorting_key(value), index, value, iterator, file))
-                    )
-                except StopIteration:
-                    file.close()
-
         temp_directory = tempfile.TemporaryDirectory()
         temporary_output_file = os.path.join(temp_directory.name, secrets.token_hex(6))
 
@@ -182,34 +434,20 @@ class FileSorterWorkerBase(WorkerBase):
 
         file_helper = FileHelper(file)
 
-        sorted_files = []
-
         PyFunceble.facility.Logger.info("Started sort of %r.", file)
 
         with file_helper.open(
             "r", encoding="utf-8", buffering=cls.FILE_BUFFER_SIZE
         ) as file_stream:
-            while True:
-                to_sort = list(islice(file_stream, cls.MAX_LINES))
-
-                if not to_sort:
-                    break
-
-                new_file = open(
-                    os.path.join(temp_directory.name, secrets.token_hex(6)),
-                    "w+",
-                    encoding="utf-8",
-                    buffering=cls.FILE_BUFFER_SIZE,
-                )
-                new_file.writelines(
-                    ListHelper(to_sort)
-                    .remove_duplicates()
-                    .custom_sort(key_method=sorting_key)
-                    .subject
-                )
-                new_file.flush()
-                new_file.seek(0)
-                sorted_files.append(new_file)
+            sorted_files = cls.sort_chunks(
+                file_stream,
+                temp_directory.name,
+                sorting_key=sorting_key,
+                remove_duplicates=remove_duplicates,
+                max_chunk_memory=max_chunk_memory,
+                executor=executor,
+                pending_chunks=pending_chunks,
+            )
 
         with open(
             temporary_output_file, "w", cls.FILE_BUFFER_SIZE, encoding="utf-8"
@@ -219,7 +457,13 @@ class FileSorterWorkerBase(WorkerBase):
                 file_stream.write(FilePrinter.get_generation_date_line())
                 file_stream.write("\n\n")
 
-            file_stream.writelines(merge_files(sorted_files))
+            file_stream.writelines(
+                cls.merge_chunks(
+                    sorted_files,
+                    remove_duplicates=remove_duplicates,
+                    write_header=write_header,
+                )
+            )
 
         FileHelper(temporary_output_file).move(file)
 
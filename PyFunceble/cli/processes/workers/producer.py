@@ -60,7 +60,10 @@ import PyFunceble.facility
 import PyFunceble.storage
 from PyFunceble.checker.status_base import CheckerStatusBase
 from PyFunceble.checker.utils.whois import get_whois_dataset_object
+from PyFunceble.cli.filesystem.columnar import ColumnarStatusWriter
 from PyFunceble.cli.filesystem.counter import FilesystemCounter
+from PyFunceble.cli.filesystem.handle_pool import FileHandlePool
+from PyFunceble.cli.filesystem.lookup_timings import LookupTimingsCounter
 from PyFunceble.cli.filesystem.printer.file import FilePrinter
 from PyFunceble.cli.filesystem.printer.stdout import StdoutPrinter
 from PyFunceble.cli.filesystem.registrar_counter import RegistrarCounter
@@ -93,8 +96,11 @@ class ProducerWorker(WorkerBase):
     inactive_dataset: Optional[InactiveDatasetBase] = None
     continue_dataset: Optional[ContinueDatasetBase] = None
     status_file_generator: Optional[StatusFileGenerator] = None
+    file_handle_pool: Optional[FileHandlePool] = None
+    columnar_writer: Optional[ColumnarStatusWriter] = None
     counter: Optional[FilesystemCounter] = None
     registrar_counter: Optional[RegistrarCounter] = None
+    lookup_timings_counter: Optional[LookupTimingsCounter] = None
     platform_query_tool: Optional[PlatformQueryTool] = None
 
     header_already_printed: Optional[bool] = None
@@ -112,20 +118,71 @@ class ProducerWorker(WorkerBase):
 
         self.stdout_printer = StdoutPrinter(skip_column=skip_columns)
         self.file_printer = FilePrinter(skip_column=skip_columns)
-        self.whois_dataset = get_whois_dataset_object(db_session=self.db_session)
-        self.inactive_dataset = get_inactive_dataset_object(db_session=self.db_session)
+        self.whois_dataset = get_whois_dataset_object(
+            db_session=self.db_session, batched=True
+        )
+        self.inactive_dataset = get_inactive_dataset_object(
+            db_session=self.db_session, batched=True
+        )
         self.continue_dataset = get_continue_databaset_object(
-            db_session=self.db_session
+            db_session=self.db_session, batched=True
         )
         self.status_file_generator = StatusFileGenerator().guess_all_settings()
+
+        if (
+            PyFunceble.storage.CONFIGURATION.cli_testing.file_generation.buffer_size
+            and not PyFunceble.storage.CONFIGURATION.cli_testing.chancy_tester
+        ):
+            # We are the only writer of the status files. Therefore, we keep
+            # them open instead of opening them for each line.
+            self.file_handle_pool = FileHandlePool()
+
+            self.file_printer.set_file_handle_pool(self.file_handle_pool)
+            self.status_file_generator.set_file_handle_pool(self.file_handle_pool)
+
+        if PyFunceble.storage.CONFIGURATION.cli_testing.file_generation.columnar:
+            self.columnar_writer = ColumnarStatusWriter()
+
         self.counter = FilesystemCounter()
         self.registrar_counter = RegistrarCounter()
+        self.lookup_timings_counter = LookupTimingsCounter()
+
+        if not PyFunceble.storage.CONFIGURATION.cli_testing.chancy_tester:
+            # We are the only writer of the counters. Therefore, we keep them in
+            # memory and only write them from time to time.
+            self.counter.set_buffered(True)
+            self.registrar_counter.set_buffered(True)
+            self.lookup_timings_counter.set_buffered(True)
         self.platform_query_tool = PlatformQueryTool()
 
         self.header_already_printed = False
 
         return super().__post_init__()
 
+    def __post_run__(self) -> None:
+        self.counter.flush()
+        self.registrar_counter.flush()
+        self.lookup_timings_counter.flush()
+
+        if self.file_handle_pool is not None:
+            self.file_handle_pool.close()
+
+        if self.columnar_writer is not None:
+            self.columnar_writer.close()
+
+        if not PyFunceble.storage.CONFIGURATION.cli_testing.chancy_tester:
+            # We are the only writer. Therefore, we are the one who should
+            # finish the work of the datasets.
+            self.continue_dataset.close()
+            self.inactive_dataset.close()
+            self.whois_dataset.close()
+        else:
+            self.continue_dataset.flush()
+            self.inactive_dataset.flush()
+            self.whois_dataset.flush()
+
+        return super().__post_run__()
+
     @staticmethod
     def should_we_ignore(test_result: CheckerStatusBase) -> bool:
         """
@@ -346,6 +403,11 @@ class ProducerWorker(WorkerBase):
             self.status_file_generator.allow_hosts_files = previous_allow_hosts_file
             self.status_file_generator.allow_plain_files = previous_allow_plain_file
 
+            if self.columnar_writer is not None:
+                self.columnar_writer.set_parent_dirname(
+                    test_dataset["destination"]
+                ).add(test_result)
+
     def run_counter(self, test_dataset: dict, test_result: CheckerStatusBase) -> None:
         """
         Runs the counter of the current file.
@@ -360,12 +422,18 @@ class ProducerWorker(WorkerBase):
             self.registrar_counter.set_differ_to_inline(True).set_parent_dirname(
                 test_dataset["destination"]
             )
+            self.lookup_timings_counter.set_differ_to_inline(True).set_parent_dirname(
+                test_dataset["destination"]
+            )
 
             self.counter.count(test_result)
 
             if hasattr(test_result, "registrar") and test_result.registrar:
                 self.registrar_counter.count(test_result.registrar)
 
+            if hasattr(test_result, "timings") and test_result.timings:
+                self.lookup_timings_counter.count(test_result.timings)
+
             self.counter.set_differ_to_inline(False)
             self.registrar_counter.set_differ_to_inline(False)
 
@@ -69,7 +69,8 @@ from PyFunceble.cli.utils.stdout import print_single_line
 from PyFunceble.dataset.autocontinue.base import ContinueDatasetBase
 from PyFunceble.dataset.autocontinue.csv import CSVContinueDataset
 from PyFunceble.dataset.inactive.base import InactiveDatasetBase
-from PyFunceble.helpers.regex import RegexHelper
+from PyFunceble.helpers.multi_regex import MultiRegexHelper
+from PyFunceble.query.whois.query_tool import WhoisQueryTool
 
 
 class TesterWorker(WorkerBase):
@@ -81,6 +82,26 @@ class TesterWorker(WorkerBase):
 
     STD_NAME: str = "pyfunceble_tester_worker"
 
+    IGNORE_REGEXES: Tuple[str, ...] = (
+        r"localhost$",
+        r"localdomain$",
+        r"local$",
+        r"broadcasthost$",
+        r"0\.0\.0\.0$",
+        r"allhosts$",
+        r"allnodes$",
+        r"allrouters$",
+        r"localnet$",
+        r"loopback$",
+        r"mcastprefix$",
+        r"ip6-mcastprefix$",
+        r"ip6-localhost$",
+        r"ip6-loopback$",
+        r"ip6-allnodes$",
+        r"ip6-allrouters$",
+        r"ip6-localnet$",
+    )
+
     continue_dataset: Optional[ContinueDatasetBase] = None
     inactive_dataset: Optional[InactiveDatasetBase] = None
     testing_object: Optional[CheckerBase] = None
@@ -126,16 +147,24 @@ class TesterWorker(WorkerBase):
 
         return super().__post_init__()
 
+    def __post_run__(self) -> None:
+        if WhoisQueryTool.shared_rate_limiter is not None:
+            for server, metrics in sorted(
+                WhoisQueryTool.shared_rate_limiter.get_metrics().items()
+            ):
+                PyFunceble.facility.Logger.info(
+                    "WHOIS metrics of %r: %r", server, metrics
+                )
+
+        return super().__post_run__()
+
     @staticmethod
     def should_be_ignored(subject: str) -> bool:
         """
         Checks if the given subject should be ignored.
         """
 
-        # pylint: disable=line-too-long
-        regex_ignore = r"localhost$|localdomain$|local$|broadcasthost$|0\.0\.0\.0$|allhosts$|allnodes$|allrouters$|localnet$|loopback$|mcastprefix$|ip6-mcastprefix$|ip6-localhost$|ip6-loopback$|ip6-allnodes$|ip6-allrouters$|ip6-localnet$"
-
-        if RegexHelper(regex_ignore).match(subject, return_match=False):
+        if MultiRegexHelper(TesterWorker.IGNORE_REGEXES).match(subject):
             PyFunceble.facility.Logger.info(
                 "Ignoring %r because it is in our default regex.", subject
             )
@@ -154,10 +183,10 @@ class TesterWorker(WorkerBase):
 
         if bool(
             PyFunceble.storage.CONFIGURATION.cli_testing.file_filter
-        ) and not RegexHelper(
-            PyFunceble.storage.CONFIGURATION.cli_testing.file_filter
+        ) and not MultiRegexHelper(
+            (PyFunceble.storage.CONFIGURATION.cli_testing.file_filter,)
         ).match(
-            subject, return_match=False
+            subject
         ):
             PyFunceble.facility.Logger.info(
                 "Ignoring %r because it does not match the filter to look for.",
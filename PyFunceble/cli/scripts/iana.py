@@ -195,7 +195,9 @@ class IanaDBGenerator:
         Given an extension, tries to get or guess its extension.
         """
 
-        whois_query_tool = WhoisQueryTool()
+        # We probe (once) a lot of servers. Therefore, we don't want to be
+        # slowed down by the rate limiter nor to retry unexisting servers.
+        whois_query_tool = WhoisQueryTool(max_retries=0).set_rate_limiter(None)
 
         dummy_domain = f"hello.{extension}"
         iana_record = (
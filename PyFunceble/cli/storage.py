@@ -167,6 +167,7 @@ WHOIS_DB_FILE = "whois.csv"
 EXECUTION_TIME_FILE = "execution_time.json"
 COUNTER_FILE = "counter.json"
 REGISTRAR_COUNTER_FILE = "registrar_counter.json"
+LOOKUP_TIMINGS_FILE = "lookup_timings.json"
 TEST_RUNNING_FILE = ".running"
 
 PRE_LOADER_FILE = "preload.json"
@@ -241,6 +242,7 @@ UNIVERSAL_OUTPUTS: dict = {
             "execution_time": "execution_time.json",
             "percentage": "percentage.txt",
             "registrar": "registrar.txt",
+            "lookup_timings": "lookup_timings.txt",
             "whois": "whois.json",
             "date_format": "date_format.json",
             "no_referrer": "no_referrer.json",
@@ -250,6 +252,7 @@ UNIVERSAL_OUTPUTS: dict = {
     "parent_directory": "output",
     "merged_directory": "merged_results",
     "splitted": {"directory": "splitted"},
+    "columnar": {"directory": "columnar"},
 }
 
 OUTPUTS: Optional[Box] = Box(
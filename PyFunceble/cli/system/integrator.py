@@ -109,6 +109,11 @@ class SystemIntegrator(SystemBase):
         if not PyFunceble.facility.Logger.activated:
             PyFunceble.facility.Logger.guess_all_settings()
 
+        if hasattr(self.args, "debug__queue") and self.args.debug__queue:
+            PyFunceble.facility.Logger.set_use_queue(True)
+        else:
+            PyFunceble.facility.Logger.guess_and_set_use_queue()
+
         # We do this because the starting point is here under the CLI :-)
         PyFunceble.facility.Logger.init_loggers()
 
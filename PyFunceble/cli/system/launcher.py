@@ -54,7 +54,6 @@ License:
 # pylint: disable=too-many-lines
 
 import argparse
-import copy
 import datetime
 import multiprocessing
 import os
@@ -88,6 +87,7 @@ from PyFunceble.cli.filesystem.dir_base import FilesystemDirBase
 from PyFunceble.cli.filesystem.dir_structure.restore import (
     DirectoryStructureRestoration,
 )
+from PyFunceble.cli.filesystem.lookup_timings import LookupTimingsCounter
 from PyFunceble.cli.filesystem.printer.file import FilePrinter
 from PyFunceble.cli.filesystem.printer.stdout import StdoutPrinter
 from PyFunceble.cli.filesystem.registrar_counter import RegistrarCounter
@@ -118,10 +118,12 @@ from PyFunceble.converter.wildcard2subject import Wildcard2Subject
 from PyFunceble.dataset.autocontinue.base import ContinueDatasetBase
 from PyFunceble.dataset.autocontinue.csv import CSVContinueDataset
 from PyFunceble.dataset.inactive.base import InactiveDatasetBase
+from PyFunceble.dataset.ipv4_reputation import IPV4ReputationDataset
 from PyFunceble.helpers.directory import DirectoryHelper
 from PyFunceble.helpers.download import DownloadHelper
 from PyFunceble.helpers.file import FileHelper
 from PyFunceble.query.platform import PlatformQueryTool
+from PyFunceble.utils.platform import PlatformUtility
 
 
 class SystemLauncher(SystemBase):
@@ -149,6 +151,7 @@ class SystemLauncher(SystemBase):
     file_printer: FilePrinter = FilePrinter()
     counter: FilesystemCounter = FilesystemCounter()
     registrar_counter: RegistrarCounter = RegistrarCounter()
+    lookup_timings_counter: LookupTimingsCounter = LookupTimingsCounter()
 
     execution_time_holder: Optional[ExecutionTime] = None
     file_preloader: Optional[FilePreloader] = None
@@ -195,7 +198,23 @@ class SystemLauncher(SystemBase):
 
         self.stdout_printer.guess_allow_coloration()
 
-        self.manager = multiprocessing.Manager()
+        if (
+            PyFunceble.storage.CONFIGURATION.cli_testing.direct_queues
+            and not PlatformUtility.is_mac_os()
+        ):
+            # Our process managers create their own queues.
+            #
+            # NOTE: Under Mac OS, our process managers fallback to the queues
+            # of our (shared) manager.
+            self.manager = None
+        else:
+            self.manager = multiprocessing.Manager()
+
+        if PyFunceble.storage.CONFIGURATION.cli_testing.mining:
+            # The second output queue is only read by the miner.
+            tester_output_queue_num = 2
+        else:
+            tester_output_queue_num = 1
 
         if not PyFunceble.storage.CONFIGURATION.cli_testing.chancy_tester:
             self.tester_process_manager = TesterProcessesManager(
@@ -204,7 +223,7 @@ class SystemLauncher(SystemBase):
                 continuous_integration=self.continuous_integration,
                 daemon=True,
                 output_workers_count=1,
-                output_queue_num=2,
+                output_queue_num=tester_output_queue_num,
             )
             self.producer_process_manager = ProducerProcessesManager(
                 self.manager,
@@ -221,7 +240,7 @@ class SystemLauncher(SystemBase):
                 continuous_integration=self.continuous_integration,
                 daemon=True,
                 output_workers_count=1,
-                output_queue_num=2,
+                output_queue_num=tester_output_queue_num,
             )
             self.producer_process_manager = ChancyProducerProcessesManager(
                 self.manager,
@@ -236,7 +255,9 @@ class SystemLauncher(SystemBase):
             self.manager,
             max_worker=PyFunceble.storage.CONFIGURATION.cli_testing.max_workers,
             continuous_integration=self.continuous_integration,
-            daemon=True,
+            # Not a daemon: it sorts the chunks of big files in a pool of
+            # processes - which daemonic processes are not allowed to create.
+            daemon=False,
             generate_output_queue=False,
             output_workers_count=0,
         )
@@ -574,12 +595,14 @@ class SystemLauncher(SystemBase):
                 ):
                     self.ci_stop_in_the_middle_if_time_exceeded()
 
-                    to_send = copy.deepcopy(protocol)
-                    to_send["subject"], to_send["idna_subject"] = subject, subject
-                    to_send["from_preload"] = True
-
-                    self.tester_process_manager.add_to_input_queue(
-                        to_send, worker_name="main"
+                    self.tester_process_manager.add_to_input_batch(
+                        {
+                            "subject": subject,
+                            "idna_subject": subject,
+                            "from_preload": True,
+                        },
+                        header=protocol,
+                        worker_name="main",
                     )
 
             else:
@@ -607,12 +630,13 @@ class SystemLauncher(SystemBase):
                             url2netloc=self.url2netloc,
                             cidr2subject=self.cidr2subject,
                         ):
-                            to_send = copy.deepcopy(protocol)
-                            to_send["subject"] = subject
-                            to_send["idna_subject"] = domain2idna.domain2idna(subject)
-
-                            self.tester_process_manager.add_to_input_queue(
-                                to_send, worker_name="main"
+                            self.tester_process_manager.add_to_input_batch(
+                                {
+                                    "subject": subject,
+                                    "idna_subject": domain2idna.domain2idna(subject),
+                                },
+                                header=protocol,
+                                worker_name="main",
                             )
 
             # Now, let's handle the inactive one :-)
@@ -625,16 +649,16 @@ class SystemLauncher(SystemBase):
                 ):
                     self.ci_stop_in_the_middle_if_time_exceeded()
 
-                    to_send = copy.deepcopy(protocol)
-                    to_send["from_inactive"] = True
-
                     # Note: Our test infrastructure need a subject
                     # but there is no subject in the table.
-                    to_send["subject"] = dataset["idna_subject"]
-                    to_send["idna_subject"] = dataset["idna_subject"]
-
-                    self.tester_process_manager.add_to_input_queue(
-                        to_send, worker_name="main"
+                    self.tester_process_manager.add_to_input_batch(
+                        {
+                            "from_inactive": True,
+                            "subject": dataset["idna_subject"],
+                            "idna_subject": dataset["idna_subject"],
+                        },
+                        header=protocol,
+                        worker_name="main",
                     )
 
             self.dir_files_sorter_process_manager.input_datasets.append(
@@ -655,29 +679,25 @@ class SystemLauncher(SystemBase):
             breakoff = initial_breakoff
 
             while True:
-                protocol_data = {}
-
                 for next_contract in next(
                     query_tool.pull_contract(self.tester_process_manager.max_worker)
                 ):
                     if "subject" not in next_contract or not next_contract["subject"]:
                         continue
 
-                    protocol_data = copy.deepcopy(protocol)
-
-                    protocol_data["checker_type"] = next_contract[
-                        "checker_type"
-                    ].upper()
-                    protocol_data["subject_type"] = next_contract["subject_type"]
-                    protocol_data["subject"] = protocol_data["idna_subject"] = (
-                        next_contract["subject"]["subject"]
-                    )
-                    protocol_data["contract"] = copy.deepcopy(next_contract)
-
-                    self.tester_process_manager.add_to_input_queue(
-                        protocol_data, worker_name="main"
+                    self.tester_process_manager.add_to_input_batch(
+                        {
+                            "checker_type": next_contract["checker_type"].upper(),
+                            "subject_type": next_contract["subject_type"],
+                            "subject": next_contract["subject"]["subject"],
+                            "idna_subject": next_contract["subject"]["subject"],
+                            "contract": next_contract,
+                        },
+                        header=protocol,
+                        worker_name="main",
                     )
 
+                self.tester_process_manager.flush_input_batch()
                 self.ci_stop_in_the_middle_if_time_exceeded()
 
                 if (
@@ -717,19 +737,21 @@ class SystemLauncher(SystemBase):
                     url2netloc=self.url2netloc,
                     cidr2subject=self.cidr2subject,
                 ):
-                    to_send = copy.deepcopy(protocol)
-                    to_send["subject"], to_send["idna_subject"] = (
-                        subject,
-                        domain2idna.domain2idna(subject),
-                    )
-
-                    self.tester_process_manager.add_to_input_queue(
-                        to_send, worker_name="main"
+                    self.tester_process_manager.add_to_input_batch(
+                        {
+                            "subject": subject,
+                            "idna_subject": domain2idna.domain2idna(subject),
+                        },
+                        header=protocol,
+                        worker_name="main",
                     )
             elif protocol["type"] == "file":
                 handle_file(protocol)
             elif protocol["type"] == "platform-contribution":
                 handle_platform_contribution()
+
+        self.tester_process_manager.flush_input_batch()
+
         return self
 
     def generate_waiting_files(self) -> "SystemLauncher":
@@ -820,6 +842,45 @@ class SystemLauncher(SystemBase):
                         self.stdout_printer.print_interpolated_line()
                         registrar_limit += 1
 
+        def generate_lookup_timings_file(parent_dirname: Union[str, None]) -> None:
+            """
+            Generates the lookup timings file.
+            """
+
+            if not PyFunceble.storage.CONFIGURATION.cli_testing.file_generation.no_file:
+                self.lookup_timings_counter.set_differ_to_inline(
+                    True
+                ).set_parent_dirname(parent_dirname)
+
+                destination = os.path.join(
+                    self.counter.get_output_basedir(),
+                    PyFunceble.cli.storage.OUTPUTS.logs.directories.parent,
+                    PyFunceble.cli.storage.OUTPUTS.logs.directories.percentage,
+                    PyFunceble.cli.storage.OUTPUTS.logs.filenames.lookup_timings,
+                )
+
+                stdout_header_printed = False
+
+                self.stdout_printer.template_to_use = "lookup_timings"
+                self.file_printer.template_to_use = "lookup_timings"
+                self.file_printer.destination = destination
+
+                for data in self.lookup_timings_counter.get_dataset_for_printer():
+                    self.file_printer.set_dataset(data).print_interpolated_line()
+
+                    # pylint: disable=line-too-long
+                    if (
+                        PyFunceble.storage.CONFIGURATION.cli_testing.display_mode.lookup_timings
+                        and not PyFunceble.storage.CONFIGURATION.cli_testing.display_mode.quiet
+                    ):
+                        self.stdout_printer.dataset = data
+
+                        if not stdout_header_printed:
+                            self.stdout_printer.print_header()
+                            stdout_header_printed = True
+
+                        self.stdout_printer.print_interpolated_line()
+
         def print_result_ascii(parent_dirname: Union[str, None]) -> None:
             """
             Generates the result repr.
@@ -854,8 +915,10 @@ class SystemLauncher(SystemBase):
                 if amount_protocol_without_dest >= 2:
                     # Show percentage, only if the amount of subjects is > 2.
                     generate_percentage_file(protocol["destination"])
+                    generate_lookup_timings_file(protocol["destination"])
             else:
                 generate_percentage_file(protocol["destination"])
+                generate_lookup_timings_file(protocol["destination"])
 
             if protocol["checker_type"] in self.registrar_counter.SUPPORTED_TEST_MODES:
                 generate_registrar_file(protocol["destination"])
@@ -1060,6 +1123,7 @@ class SystemLauncher(SystemBase):
         # The idea out here is to propate the stop signal.
         # Meaning that the tester will share it's stop signal to all
         # subsequencial queues after all submitted tasks are done.
+        self.tester_process_manager.flush_input_batch()
         self.tester_process_manager.send_stop_signal(worker_name="main")
 
         if self.miner_process_manager:
@@ -1093,6 +1157,11 @@ class SystemLauncher(SystemBase):
         """
 
         if not self.producer_process_manager.is_running():
+            if get_testing_mode() == "REPUTATION":
+                # We load the dataset before the creation of our workers so
+                # that they (forked) share it.
+                IPV4ReputationDataset().get_index()
+
             self.producer_process_manager.start()
 
             self.tester_process_manager.start()
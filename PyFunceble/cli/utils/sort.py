@@ -71,20 +71,18 @@ def standard(element: Any) -> List[Union[int, Any]]:
     if not element:
         return []
 
-    regex_helper = RegexHelper()
-
     element = Url2Netloc(element).get_converted().strip()
 
     if PyFunceble.facility.ConfigLoader.is_already_loaded():
-        element = regex_helper.set_regex(
+        element = RegexHelper.compiled(
             r"^%s\s+" % PyFunceble.storage.CONFIGURATION.cli_testing.hosts_ip
         ).replace_match(element, "")
 
-    cleaned = regex_helper.set_regex(r"[^a-zA-Z0-9\.]").replace_match(element, "")
+    cleaned = RegexHelper.compiled(r"[^a-zA-Z0-9\.]").replace_match(element, "")
 
     return [
         int(x) if x.isdigit() else x
-        for x in regex_helper.set_regex(r"(\d+)").split(cleaned)
+        for x in RegexHelper.compiled(r"(\d+)").split(cleaned)
     ]
 
 
@@ -104,7 +102,7 @@ def hierarchical(element: Any) -> List[Union[int, Any]]:
     element = Url2Netloc(element).get_converted().strip()
 
     if PyFunceble.facility.ConfigLoader.is_already_loaded():
-        element = RegexHelper(
+        element = RegexHelper.compiled(
             r"^%s\s+" % PyFunceble.storage.CONFIGURATION.cli_testing.hosts_ip
         ).replace_match(element, "")
 
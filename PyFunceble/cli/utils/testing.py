@@ -51,7 +51,7 @@ License:
 """
 
 import os
-from typing import List, Optional, Union
+from typing import Generator, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -64,12 +64,12 @@ from PyFunceble.converter.rpz_policy2subject import RPZPolicy2Subject
 from PyFunceble.converter.subject2complements import Subject2Complements
 from PyFunceble.converter.url2netloc import Url2Netloc
 from PyFunceble.converter.wildcard2subject import Wildcard2Subject
-from PyFunceble.dataset.autocontinue.csv import CSVContinueDataset
+from PyFunceble.dataset.autocontinue.indexed_csv import IndexedCSVContinueDataset
 from PyFunceble.dataset.autocontinue.sql import SQLDBContinueDataset
 from PyFunceble.dataset.base import DatasetBase
 from PyFunceble.dataset.csv_base import CSVDatasetBase
 from PyFunceble.dataset.db_base import DBDatasetBase
-from PyFunceble.dataset.inactive.csv import CSVInactiveDataset
+from PyFunceble.dataset.inactive.indexed_csv import IndexedCSVInactiveDataset
 from PyFunceble.dataset.inactive.sql import SQLDBInactiveDataset
 from PyFunceble.helpers.list import ListHelper
 from PyFunceble.helpers.regex import RegexHelper
@@ -92,12 +92,19 @@ def get_testing_mode() -> str:
 
 def get_continue_databaset_object(
     db_session: Optional[Session] = None,
+    *,
+    batched: bool = False,
 ) -> Union[DatasetBase, CSVDatasetBase, DBDatasetBase]:
     """
     Provides the continue object to work with.
 
     :param db_session:
         A database session to use.
+    :param batched:
+        Whether the writes may be batched (when supported).
+
+        .. warning::
+            When batched, the caller has to flush or close the dataset.
 
     :raise ValueError:
         When the given database type is unkown.
@@ -106,7 +113,7 @@ def get_continue_databaset_object(
     result = None
 
     if PyFunceble.storage.CONFIGURATION.cli_testing.db_type in "csv":
-        result = CSVContinueDataset()
+        result = IndexedCSVContinueDataset()
     elif PyFunceble.storage.CONFIGURATION.cli_testing.db_type in (
         "mariadb",
         "mysql",
@@ -114,6 +121,13 @@ def get_continue_databaset_object(
     ):
         result = SQLDBContinueDataset(db_session=db_session)
 
+        if batched:
+            result.set_batch_size(
+                PyFunceble.storage.CONFIGURATION.cli_testing.db_batch_size
+            ).set_batch_delay(
+                PyFunceble.storage.CONFIGURATION.cli_testing.db_batch_delay
+            )
+
     if result:
         result.set_authorized(
             bool(PyFunceble.storage.CONFIGURATION.cli_testing.autocontinue)
@@ -129,12 +143,19 @@ def get_continue_databaset_object(
 
 def get_inactive_dataset_object(
     db_session: Optional[Session] = None,
+    *,
+    batched: bool = False,
 ) -> Union[DatasetBase, CSVDatasetBase, DBDatasetBase]:
     """
     Provides the inactive object to work with.
 
     :param db_session:
         A database session to use.
+    :param batched:
+        Whether the writes may be batched (when supported).
+
+        .. warning::
+            When batched, the caller has to flush or close the dataset.
 
     :raise ValueError:
         When the given database type is unkown.
@@ -143,7 +164,7 @@ def get_inactive_dataset_object(
     result = None
 
     if PyFunceble.storage.CONFIGURATION.cli_testing.db_type == "csv":
-        result = CSVInactiveDataset()
+        result = IndexedCSVInactiveDataset()
     elif PyFunceble.storage.CONFIGURATION.cli_testing.db_type in (
         "mariadb",
         "mysql",
@@ -151,6 +172,13 @@ def get_inactive_dataset_object(
     ):
         result = SQLDBInactiveDataset(db_session=db_session)
 
+        if batched:
+            result.set_batch_size(
+                PyFunceble.storage.CONFIGURATION.cli_testing.db_batch_size
+            ).set_batch_delay(
+                PyFunceble.storage.CONFIGURATION.cli_testing.db_batch_delay
+            )
+
     if result:
         result.set_authorized(
             bool(PyFunceble.storage.CONFIGURATION.cli_testing.inactive_db)
@@ -175,7 +203,7 @@ def get_destination_from_origin(origin: str) -> str:
     if os.sep in origin:
         origin = origin.rsplit(os.sep, 1)[-1]
 
-    return RegexHelper("[^a-zA-Z0-9._-]").replace_match(origin, "_")
+    return RegexHelper.compiled("[^a-zA-Z0-9._-]").replace_match(origin, "_")
 
 
 def get_subjects_from_line(
@@ -191,9 +219,13 @@ def get_subjects_from_line(
     subject2complements: Optional[Subject2Complements] = None,
     url2netloc: Optional[Url2Netloc] = None,
     cidr2subject: Optional[CIDR2Subject] = None,
-) -> List[str]:
+) -> Generator[str, None, None]:
     """
-    Provides the list of subject to test.
+    Provides (lazily) the subject to test.
+
+    .. note::
+        The CIDR expansion happens at the very end and lazily. Therefore, a
+        large network never ends up (expanded) in memory.
     """
 
     result = []
@@ -269,13 +301,6 @@ def get_subjects_from_line(
             ]
         )
 
-    if PyFunceble.storage.CONFIGURATION.cli_testing.cidr_expand:
-        result = [
-            y
-            for x in result
-            for y in cidr2subject.set_data_to_convert(x).get_converted()
-        ]
-
     if checker_type.lower() != "syntax":
         for index, subject in enumerate(result):
             if not subject:
@@ -285,4 +310,14 @@ def get_subjects_from_line(
 
             result[index] = subject.replace(netloc, netloc.lower())
 
-    return ListHelper(result).remove_duplicates().remove_empty().subject
+    result = ListHelper(result).remove_duplicates().remove_empty().subject
+
+    if PyFunceble.storage.CONFIGURATION.cli_testing.cidr_expand:
+        cidr2subject.max_ipv6_addresses = int(
+            PyFunceble.storage.CONFIGURATION.cli_testing.cidr_max_ipv6_addresses
+        )
+
+        for subject in result:
+            yield from cidr2subject.iter_convert(subject)
+    else:
+        yield from result
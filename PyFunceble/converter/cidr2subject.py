@@ -51,8 +51,8 @@ License:
     limitations under the License.
 """
 
-from ipaddress import IPv4Network
-from typing import Any, List, Optional
+from ipaddress import IPv4Network, IPv6Network
+from typing import Any, Generator, List, Optional
 
 from PyFunceble.checker.syntax.ip import IPSyntaxChecker
 from PyFunceble.converter.base import ConverterBase
@@ -61,15 +61,24 @@ from PyFunceble.converter.base import ConverterBase
 class CIDR2Subject(ConverterBase):
     """
     Converts/Extracts the subjects of from the given CIDR.
+
+    .. note::
+        The addresses are provided lazily (and in order). Therefore, even a
+        large network can be expanded with a constant memory usage.
     """
 
+    STD_MAX_IPV6_ADDRESSES: int = 65536
+
     ip_syntax_checker: Optional[IPSyntaxChecker] = None
 
+    _max_ipv6_addresses: int = STD_MAX_IPV6_ADDRESSES
+
     def __init__(
         self,
         data_to_convert: Optional[Any] = None,
         *,
         ip_syntax_checker: Optional[IPSyntaxChecker] = None,
+        max_ipv6_addresses: Optional[int] = None,
     ) -> None:
         super().__init__(data_to_convert=data_to_convert)
 
@@ -78,6 +87,11 @@ class CIDR2Subject(ConverterBase):
         else:
             self.ip_syntax_checker = ip_syntax_checker
 
+        if max_ipv6_addresses is not None:
+            self.max_ipv6_addresses = max_ipv6_addresses
+        else:
+            self.max_ipv6_addresses = self.STD_MAX_IPV6_ADDRESSES
+
     @ConverterBase.data_to_convert.setter
     def data_to_convert(self, value: Any) -> None:
         """
@@ -93,6 +107,52 @@ class CIDR2Subject(ConverterBase):
         # pylint: disable=no-member
         super(CIDR2Subject, self.__class__).data_to_convert.fset(self, value)
 
+    @property
+    def max_ipv6_addresses(self) -> int:
+        """
+        Provides the current state of the :code:`_max_ipv6_addresses`
+        attribute.
+        """
+
+        return self._max_ipv6_addresses
+
+    @max_ipv6_addresses.setter
+    def max_ipv6_addresses(self, value: int) -> None:
+        """
+        Sets the maximal number of addresses an IPv6 network can have to be
+        expanded. Larger networks are provided as they are.
+
+        :param value:
+            The value to set. :code:`0` disables the expansion of IPv6
+            networks.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        if not isinstance(value, int):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError("<value> should be greater or equal to zero.")
+
+        self._max_ipv6_addresses = value
+
+    def set_max_ipv6_addresses(self, value: int) -> "CIDR2Subject":
+        """
+        Sets the maximal number of addresses an IPv6 network can have to be
+        expanded.
+
+        :param value:
+            The value to set.
+        """
+
+        self.max_ipv6_addresses = value
+
+        return self
+
     def get_converted(self) -> List[str]:
         """
         Provides the subject-s to test.
@@ -100,6 +160,13 @@ class CIDR2Subject(ConverterBase):
 
         return self.convert(self.data_to_convert)
 
+    def iter_converted(self) -> Generator[str, None, None]:
+        """
+        Provides (lazily) the subject-s to test.
+        """
+
+        return self.iter_convert(self.data_to_convert)
+
     def convert(self, data: Any, *, aggressive: bool = False) -> List[str]:
         """
         Converts the given dataset.
@@ -108,24 +175,41 @@ class CIDR2Subject(ConverterBase):
             The data to convert.
         """
 
+        return list(self.iter_convert(data, aggressive=aggressive))
+
+    def iter_convert(
+        self, data: Any, *, aggressive: bool = False
+    ) -> Generator[str, None, None]:
+        """
+        Converts (lazily) the given dataset.
+
+        :param data:
+            The data to convert.
+        """
+
         _ = aggressive
-        result = set()
 
         subject = data.strip()
 
-        if subject:
-            try:
-                self.ip_syntax_checker.set_subject(subject)
-                if self.ip_syntax_checker.is_valid_v4_range():
-                    result.update(
-                        str(x) for x in IPv4Network(self.ip_syntax_checker.subject)
-                    )
-                elif self.ip_syntax_checker.is_valid_v6_range():
-                    # Not Implemented yet.
-                    result.add(subject)
-                else:
-                    result.add(subject)
-            except ValueError:
-                result.add(subject)
-
-        return list(result)
+        if not subject:
+            return
+
+        try:
+            self.ip_syntax_checker.set_subject(subject)
+
+            if self.ip_syntax_checker.is_valid_v4_range():
+                network = IPv4Network(self.ip_syntax_checker.subject)
+            elif self.ip_syntax_checker.is_valid_v6_range():
+                network = IPv6Network(self.ip_syntax_checker.subject)
+
+                if network.num_addresses > self.max_ipv6_addresses:
+                    network = None
+            else:
+                network = None
+        except ValueError:
+            network = None
+
+        if network is None:
+            yield subject
+        else:
+            yield from (str(x) for x in network)
@@ -81,6 +81,8 @@ class SQLDBContinueDataset(SQLDBDatasetBase, ContinueDatasetBase):
             The session ID to cleanup.
         """
 
+        self.flush()
+
         self.db_session.query(self.ORM_OBJ).filter(
             self.ORM_OBJ.session_id == session_id
         ).delete(synchronize_session=False)
@@ -94,6 +96,8 @@ class SQLDBContinueDataset(SQLDBDatasetBase, ContinueDatasetBase):
 
     @SQLDBDatasetBase.execute_if_authorized(None)
     def get_to_test(self, session_id: str) -> Generator[Tuple[str], str, None]:
+        self.flush()
+
         twenty_years_ago = datetime.now(timezone.utc) - timedelta(days=365.25 * 20)
 
         result = (
@@ -51,7 +51,7 @@ License:
 """
 
 import functools
-from typing import Any, Generator, List, Optional
+from typing import Any, Generator, Iterable, List, Optional
 
 import PyFunceble.storage
 from PyFunceble.dataset.base import DatasetBase
@@ -294,6 +294,28 @@ class DBDatasetBase(DatasetBase):
 
         raise NotImplementedError()
 
+    def update_many(
+        self, rows: Iterable[dict], *, ignore_if_exist: bool = False
+    ) -> "DBDatasetBase":
+        """
+        Adds the given datasets into the database if they do not exists.
+        Update otherwise.
+
+        :param rows:
+            The rows or datasets to manipulate.
+
+        :param ignore_if_exist:
+            Ignores the insertion/update of the rows which already exists.
+
+        :raise TypeError:
+            When one of the given :code:`rows` is not a :py:class`dict`.
+        """
+
+        for row in rows:
+            self.update(row, ignore_if_exist=ignore_if_exist)
+
+        return self
+
     def get_content(self) -> Generator[Optional[dict], None, None]:
         """
         Provides a generator which provides the next line to read.
@@ -308,6 +330,21 @@ class DBDatasetBase(DatasetBase):
 
         raise NotImplementedError()
 
+    def flush(self) -> "DBDatasetBase":
+        """
+        Writes the pending changes (if any) into the dataset.
+        """
+
+        return self
+
+    def close(self) -> "DBDatasetBase":
+        """
+        Closes the dataset. Meaning that any pending work (if any) is
+        finished.
+        """
+
+        return self.flush()
+
     @execute_if_authorized(None)
     def get_filtered_content(
         self, filter_map: dict
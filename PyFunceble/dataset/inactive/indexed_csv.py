@@ -0,0 +1,198 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the interface for the indexed inactive CSV management.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Generator, Optional, Tuple
+
+from PyFunceble.dataset.inactive.csv import CSVInactiveDataset
+from PyFunceble.dataset.indexed_csv_base import CSVFileIndex, IndexedCSVDatasetBase
+
+
+class InactiveCSVFileIndex(CSVFileIndex):
+    """
+    Provides the index of the inactive CSV file.
+
+    On top of the primary (hash) index, we maintain a secondary index which
+    groups the keys by :code:`(destination, checker_type)` and by
+    :code:`tested_at` buckets. That way, the selection of the subjects to
+    retest is a range scan over a few buckets instead of a parse of the
+    whole file.
+    """
+
+    BUCKET_SIZE: int = 3600
+    """
+    The size (in seconds) of a single time bucket.
+    """
+
+    retest_buckets: Optional[
+        Dict[Tuple[str, str], Dict[int, Dict[Tuple[str, ...], float]]]
+    ] = None
+
+    def reset(self) -> "InactiveCSVFileIndex":
+        self.retest_buckets = {}
+
+        return super().reset()
+
+    def get_epoch(self, values: Tuple[str, ...]) -> float:
+        """
+        Provides the (epoch) time of inclusion of the given values.
+
+        :param values:
+            The values - ordered like :code:`fields`.
+        """
+
+        try:
+            return (
+                datetime.fromisoformat(values[self.fields.index("tested_at")])
+                .astimezone(timezone.utc)
+                .timestamp()
+            )
+        except (TypeError, ValueError):
+            return (datetime.now(timezone.utc) - timedelta(days=365)).timestamp()
+
+    def get_group(self, values: Tuple[str, ...]) -> Tuple[str, str]:
+        """
+        Provides the retest group of the given values.
+
+        :param values:
+            The values - ordered like :code:`fields`.
+        """
+
+        return (
+            values[self.fields.index("destination")],
+            values[self.fields.index("checker_type")],
+        )
+
+    def __forget(self, key: Tuple[str, ...]) -> None:
+        """
+        Removes the given key from the secondary index.
+
+        :param key:
+            The key to forget.
+        """
+
+        if key not in self.rows:
+            return
+
+        previous_values = self.rows[key]
+
+        group = self.retest_buckets.get(self.get_group(previous_values), {})
+        bucket = int(self.get_epoch(previous_values) // self.BUCKET_SIZE)
+
+        if bucket in group:
+            group[bucket].pop(key, None)
+
+            if not group[bucket]:
+                del group[bucket]
+
+    def set_row(self, values: Tuple[str, ...]) -> None:
+        key = self.get_values_key(values)
+        epoch = self.get_epoch(values)
+
+        self.__forget(key)
+        super().set_row(values)
+
+        self.retest_buckets.setdefault(self.get_group(values), {}).setdefault(
+            int(epoch // self.BUCKET_SIZE), {}
+        )[key] = epoch
+
+    def delete_row(self, values: Tuple[str, ...]) -> None:
+        self.__forget(self.get_values_key(values))
+
+        super().delete_row(values)
+
+    def get_to_retest(
+        self, destination: str, checker_type: str, max_epoch: float
+    ) -> Generator[Tuple[str, ...], None, None]:
+        """
+        Provides the values of the rows which were included before the given
+        time.
+
+        :param destination:
+            The destination to look for.
+        :param checker_type:
+            The checker type to look for.
+        :param max_epoch:
+            The maximal time of inclusion.
+        """
+
+        group = self.retest_buckets.get((destination, checker_type), {})
+        max_bucket = int(max_epoch // self.BUCKET_SIZE)
+
+        for bucket in sorted(x for x in group if x <= max_bucket):
+            # We work on a snapshot so that the caller can write while iterating.
+            for key, epoch in list(group[bucket].items()):
+                if epoch > max_epoch or key not in self.rows:
+                    continue
+
+                yield self.rows[key]
+
+
+class IndexedCSVInactiveDataset(IndexedCSVDatasetBase, CSVInactiveDataset):
+    """
+    Provides the interface for the management of the inactive CSV file through
+    an in-memory index.
+    """
+
+    INDEX_OBJ: type = InactiveCSVFileIndex
+
+    @IndexedCSVDatasetBase.execute_if_authorized(None)
+    def get_to_retest(
+        self, destination: str, checker_type: str, *, min_days: Optional[int]
+    ) -> Generator[Tuple[str, str, Optional[int]], dict, None]:
+        days_ago = datetime.now(timezone.utc) - timedelta(days=min_days)
+        index = self.get_index()
+
+        for values in index.get_to_retest(
+            destination, checker_type, days_ago.timestamp()
+        ):
+            yield self.get_parsed_row(index.to_dict(values))
@@ -71,6 +71,8 @@ class SQLDBInactiveDataset(SQLDBDatasetBase, InactiveDatasetBase):
     def get_to_retest(
         self, destination: str, checker_type: str, *, min_days: Optional[int]
     ) -> Generator[Tuple[str, str, Optional[int]], dict, None]:
+        self.flush()
+
         days_ago = datetime.now(timezone.utc) - timedelta(days=min_days)
 
         result = (
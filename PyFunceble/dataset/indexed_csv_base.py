@@ -0,0 +1,641 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the base of all indexed and append-only CSV stored datasets.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import csv
+import io
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Generator, Iterable, List, Optional, Tuple
+
+import PyFunceble.facility
+from PyFunceble.dataset.csv_base import CSVDatasetBase
+from PyFunceble.dataset.db_base import DBDatasetBase
+from PyFunceble.helpers.file import FileHelper
+
+
+class CSVFileIndex:
+    """
+    Provides an in-memory hash index of a single (append-only) CSV file.
+
+    The index is keyed on the comparison fields of the dataset and only keeps
+    the latest known version of each row. Because the file is only appended
+    to, we keep track of the last consumed byte offset and only read what was
+    appended since - by us or by any other process - when we synchronize.
+
+    :param source_file:
+        The CSV file to index.
+    :param fields:
+        The fields (columns) of the dataset.
+    :param comparison_fields:
+        The fields which (together) identifies a single row.
+    """
+
+    TOMBSTONE_MARKER: str = "__deleted__"
+    READ_CHUNK_SIZE: int = 1024 * 1024
+
+    source_file: Optional[str] = None
+    fields: Optional[List[str]] = None
+    comparison_fields: Optional[List[str]] = None
+
+    rows: Optional[Dict[Tuple[str, ...], Tuple[str, ...]]] = None
+    """
+    The indexed rows. Keys are the comparison values, values are the row
+    values - ordered like :code:`fields`.
+    """
+
+    dead_rows: int = 0
+    """
+    The number of (file) rows that are not reachable through the index
+    anymore. In other words, what a compaction would remove.
+    """
+
+    _offset: int = 0
+    _inode: Optional[int] = None
+    _file_fields: Optional[List[str]] = None
+    _key_positions: Optional[List[int]] = None
+
+    def __init__(
+        self, source_file: str, fields: List[str], comparison_fields: List[str]
+    ) -> None:
+        self.source_file = source_file
+        self.fields = list(fields)
+        self.comparison_fields = list(comparison_fields)
+
+        self._key_positions = [self.fields.index(x) for x in self.comparison_fields]
+
+        self.reset()
+
+    def reset(self) -> "CSVFileIndex":
+        """
+        Resets the index. The next synchronization will read the file from
+        the very beginning.
+        """
+
+        self.rows = {}
+        self.dead_rows = 0
+
+        self._offset = 0
+        self._inode = None
+        self._file_fields = None
+
+        return self
+
+    def get_key(self, row: dict) -> Tuple[str, ...]:
+        """
+        Provides the index key of the given row.
+
+        :param row:
+            The row to work with.
+        """
+
+        return tuple(
+            "" if row.get(x) is None else str(row[x]) for x in self.comparison_fields
+        )
+
+    def get_values(self, row: dict) -> Tuple[str, ...]:
+        """
+        Provides the values (as they are stored in the file) of the given row.
+
+        :param row:
+            The row to work with.
+        """
+
+        return tuple("" if row.get(x) is None else str(row[x]) for x in self.fields)
+
+    def get_values_key(self, values: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Provides the index key of the given (indexed) values.
+
+        :param values:
+            The values - ordered like :code:`fields`.
+        """
+
+        return tuple(values[x] for x in self._key_positions)
+
+    def to_dict(self, values: Tuple[str, ...]) -> dict:
+        """
+        Converts the given indexed values into a row.
+
+        :param values:
+            The indexed values.
+        """
+
+        return dict(zip(self.fields, values))
+
+    def set_row(self, values: Tuple[str, ...]) -> None:
+        """
+        Sets the given values into the index.
+
+        :param values:
+            The values - ordered like :code:`fields`.
+        """
+
+        key = self.get_values_key(values)
+
+        if key in self.rows:
+            self.dead_rows += 1
+
+        self.rows[key] = values
+
+    def delete_row(self, values: Tuple[str, ...]) -> None:
+        """
+        Deletes the given values from the index.
+
+        :param values:
+            The values - ordered like :code:`fields`.
+        """
+
+        key = self.get_values_key(values)
+
+        # The tombstone itself is a dead row.
+        self.dead_rows += 1
+
+        if key in self.rows:
+            del self.rows[key]
+            self.dead_rows += 1
+
+    def __parse_lines(self, text: str) -> None:
+        """
+        Parses the given (complete) CSV lines and index them.
+
+        :param text:
+            The lines to parse.
+        """
+
+        reader = csv.reader(io.StringIO(text, newline=""))
+
+        if self._file_fields is None:
+            try:
+                self._file_fields = next(reader)
+            except StopIteration:
+                return
+
+        positions = [
+            self._file_fields.index(x) if x in self._file_fields else None
+            for x in self.fields
+        ]
+        total_file_fields = len(self._file_fields)
+
+        for record in reader:
+            if not record:
+                continue
+
+            values = tuple(
+                record[x] if x is not None and x < len(record) else ""
+                for x in positions
+            )
+
+            if (
+                len(record) > total_file_fields
+                and record[total_file_fields] == self.TOMBSTONE_MARKER
+            ):
+                self.delete_row(values)
+            else:
+                self.set_row(values)
+
+    def sync(self) -> "CSVFileIndex":
+        """
+        Synchronizes the index with the file. Only the bytes that were appended
+        since our last synchronization are read - unless the file was
+        replaced or truncated in between.
+        """
+
+        try:
+            stats = os.stat(self.source_file)
+        except FileNotFoundError:
+            if self._inode is not None or self.rows:
+                self.reset()
+            return self
+
+        if stats.st_ino != self._inode or stats.st_size < self._offset:
+            self.reset()
+            self._inode = stats.st_ino
+
+        if stats.st_size == self._offset:
+            return self
+
+        with open(self.source_file, "rb") as file_stream:
+            file_stream.seek(self._offset)
+            remaining = b""
+
+            while True:
+                chunk = file_stream.read(self.READ_CHUNK_SIZE)
+
+                if not chunk:
+                    break
+
+                chunk = remaining + chunk
+                last_newline = chunk.rfind(b"\n")
+
+                if last_newline < 0:
+                    remaining = chunk
+                    continue
+
+                remaining = chunk[last_newline + 1 :]
+                complete_lines = chunk[: last_newline + 1]
+
+                # Partially written lines (by a concurrent writer) are kept for
+                # the next synchronization.
+                self._offset += len(complete_lines)
+                self.__parse_lines(complete_lines.decode("utf-8"))
+
+        return self
+
+    def append(self, values: Tuple[str, ...], *, tombstone: bool = False) -> None:
+        """
+        Appends the given values to the end of the file.
+
+        :param values:
+            The values - ordered like :code:`fields`.
+        :param tombstone:
+            Writes the values as a deletion marker.
+        """
+
+        self.append_many([values], tombstone=tombstone)
+
+    def append_many(
+        self, values_list: List[Tuple[str, ...]], *, tombstone: bool = False
+    ) -> None:
+        """
+        Appends the given list of values to the end of the file - in a single
+        write.
+
+        :param values_list:
+            The list of values - ordered like :code:`fields`.
+        :param tombstone:
+            Writes the values as deletion markers.
+        """
+
+        if not values_list:
+            return
+
+        self.sync()
+
+        output = io.StringIO(newline="")
+        writer = csv.writer(output)
+
+        if self._file_fields is None:
+            writer.writerow(self.fields)
+
+        for values in values_list:
+            if self._file_fields is not None and self._file_fields != self.fields:
+                # We keep the layout of the (already existing) file.
+                row = self.to_dict(values)
+                values = tuple(row.get(x, "") for x in self._file_fields)
+
+            if tombstone:
+                writer.writerow(list(values) + [self.TOMBSTONE_MARKER])
+            else:
+                writer.writerow(values)
+
+        # A single write call to reduce the chance of interleaved lines.
+        with open(self.source_file, "a", newline="", encoding="utf-8") as file_stream:
+            file_stream.write(output.getvalue())
+
+        self.sync()
+
+    def compact(self) -> "CSVFileIndex":
+        """
+        Rewrites the file so that it only contains the indexed rows.
+        """
+
+        self.sync()
+
+        if not self.dead_rows or not os.path.isfile(self.source_file):
+            return self
+
+        our_temp_file = tempfile.NamedTemporaryFile(
+            "w",
+            delete=False,
+            encoding="utf-8",
+            newline="",
+            dir=os.path.dirname(self.source_file) or None,
+        )
+
+        writer = csv.writer(our_temp_file)
+        writer.writerow(self.fields)
+        writer.writerows(self.rows.values())
+
+        our_temp_file.close()
+
+        os.replace(our_temp_file.name, self.source_file)
+
+        stats = os.stat(self.source_file)
+
+        self._inode = stats.st_ino
+        self._offset = stats.st_size
+        self._file_fields = list(self.fields)
+        self.dead_rows = 0
+
+        return self
+
+
+class IndexedCSVDatasetBase(CSVDatasetBase):
+    """
+    Provides the base of all CSV datasets which are read through an in-memory
+    index and written in an append-only fashion.
+
+    The file format stays compatible with the one of
+    :class:`~PyFunceble.dataset.csv_base.CSVDatasetBase`. Removals and updates
+    are appended and the file is compacted when :meth:`close` is called.
+    """
+
+    INDEX_OBJ: type = CSVFileIndex
+
+    _indexes: Optional[Dict[str, CSVFileIndex]] = None
+
+    def __post_init__(self) -> None:
+        self._indexes = {}
+
+        return super().__post_init__()
+
+    def __getstate__(self):  # pragma: no cover
+        state = dict(vars(self))
+        # We don't want to share a (potentially huge) index between processes.
+        # Each process rebuild its own.
+        state["_indexes"] = {}
+
+        return state
+
+    @DBDatasetBase.ensure_source_file_exists
+    def get_index(self) -> CSVFileIndex:
+        """
+        Provides the (synchronized) index of the current source file.
+        """
+
+        if self._indexes is None:
+            self._indexes = {}
+
+        if self.source_file not in self._indexes:
+            self._indexes[self.source_file] = self.INDEX_OBJ(
+                self.source_file, self.FIELDS, self.COMPARISON_FIELDS
+            )
+
+        return self._indexes[self.source_file].sync()
+
+    def get_prepared_row(self, row: dict) -> dict:
+        """
+        Prepares the given row so that it can be indexed or compared.
+
+        :param row:
+            The row to work with.
+        """
+
+        if self.remove_unneeded_fields:
+            row = self.get_filtered_row(row)
+        else:
+            row = dict(row)
+
+        if "tested_at" in row and isinstance(row["tested_at"], datetime):
+            row["tested_at"] = row["tested_at"].isoformat()
+
+        return row
+
+    def update(
+        self, row: dict, *, ignore_if_exist: bool = False
+    ) -> "IndexedCSVDatasetBase":
+        """
+        Adds the given dataset into the database if it does not exists.
+        Update otherwise.
+
+        :param row:
+            The row or dataset to manipulate.
+
+        :param ignore_if_exist:
+            Ignore the insertion/update if the row already exists.
+
+        :raise TypeError:
+            When the given :code:`row` is not a :py:class`dict`.
+        """
+
+        if not isinstance(row, dict):
+            raise TypeError(f"<row> should be {dict}, {type(row)} given.")
+
+        PyFunceble.facility.Logger.info("Started to update row.")
+
+        if not ignore_if_exist or not self.exists(row):
+            # As the latest appended row always wins, there is no need to remove
+            # the previous one.
+            self.add(row)
+
+        PyFunceble.facility.Logger.debug("Updated row:\n%r", row)
+        PyFunceble.facility.Logger.info("Finished to update row.")
+
+        return self
+
+    @DBDatasetBase.ensure_source_file_exists
+    @DBDatasetBase.execute_if_authorized(None)
+    def update_many(
+        self, rows: Iterable[dict], *, ignore_if_exist: bool = False
+    ) -> "IndexedCSVDatasetBase":
+        """
+        Adds the given datasets into the database if they do not exists.
+        Update otherwise.
+
+        Unlike :meth:`update`, all rows are appended in a single write.
+
+        :param rows:
+            The rows or datasets to manipulate.
+
+        :param ignore_if_exist:
+            Ignore the insertion/update of the rows which already exists.
+
+        :raise TypeError:
+            When one of the given :code:`rows` is not a :py:class`dict`.
+        """
+
+        PyFunceble.facility.Logger.info("Started to update rows.")
+
+        index = self.get_index()
+        seen = set()
+        to_append = []
+
+        for row in rows:
+            if not isinstance(row, dict):
+                raise TypeError(f"<row> should be {dict}, {type(row)} given.")
+
+            prepared_row = self.get_prepared_row(row)
+
+            if ignore_if_exist:
+                key = index.get_key(prepared_row)
+
+                if key in index.rows or key in seen:
+                    continue
+
+                seen.add(key)
+
+            to_append.append(index.get_values(prepared_row))
+
+        index.append_many(to_append)
+
+        PyFunceble.facility.Logger.debug("Updated %d rows.", len(to_append))
+        PyFunceble.facility.Logger.info("Finished to update rows.")
+
+        return self
+
+    @DBDatasetBase.ensure_source_file_exists
+    @DBDatasetBase.execute_if_authorized(None)
+    def add(self, row: dict) -> "IndexedCSVDatasetBase":
+        """
+        Appends the given dataset into the CSV file.
+
+        :param row:
+            The row or dataset to add.
+
+        :raise TypeError:
+            When the given :code:`row` is not a :py:class`dict`.
+        """
+
+        if not isinstance(row, dict):
+            raise TypeError(f"<row> should be {dict}, {type(row)} given.")
+
+        PyFunceble.facility.Logger.info("Started to add row.")
+
+        index = self.get_index()
+        index.append(index.get_values(self.get_prepared_row(row)))
+
+        PyFunceble.facility.Logger.debug("Added row:\n%r", row)
+        PyFunceble.facility.Logger.info("Finished to add row.")
+
+        return self
+
+    @DBDatasetBase.ensure_source_file_exists
+    @DBDatasetBase.execute_if_authorized(None)
+    def remove(self, row: dict) -> "IndexedCSVDatasetBase":
+        """
+        Removes the given dataset by appending a deletion marker into the CSV
+        file.
+
+        :param row:
+            The row or dataset to remove.
+
+        :raise TypeError:
+            When the given :code:`row` is not a :py:class`dict`.
+        """
+
+        if not isinstance(row, dict):
+            raise TypeError(f"<row> should be {dict}, {type(row)} given.")
+
+        PyFunceble.facility.Logger.info("Started to remove row.")
+
+        index = self.get_index()
+        prepared_row = self.get_prepared_row(row)
+
+        if index.get_key(prepared_row) in index.rows:
+            index.append(index.get_values(prepared_row), tombstone=True)
+
+        PyFunceble.facility.Logger.debug("Removed row:\n%r", row)
+        PyFunceble.facility.Logger.info("Finished to remove row.")
+
+        return self
+
+    @staticmethod
+    def get_parsed_row(row: dict) -> dict:
+        """
+        Parses the (stored) values of the given row into their final format.
+
+        :param row:
+            The row to work with.
+        """
+
+        if "tested_at" in row:
+            try:
+                row["tested_at"] = datetime.fromisoformat(row["tested_at"]).astimezone(
+                    timezone.utc
+                )
+            except (TypeError, ValueError):
+                row["tested_at"] = datetime.now(timezone.utc) - timedelta(days=365)
+
+        return row
+
+    @DBDatasetBase.ensure_source_file_exists
+    @DBDatasetBase.execute_if_authorized(None)
+    def get_content(self) -> Generator[Optional[dict], None, None]:
+        """
+        Provides a generator which provides the next (indexed) row.
+        """
+
+        index = self.get_index()
+
+        # We work on a snapshot so that the caller can write while iterating.
+        for values in list(index.rows.values()):
+            yield self.get_parsed_row(index.to_dict(values))
+
+    @DBDatasetBase.ensure_source_file_exists
+    @DBDatasetBase.execute_if_authorized(False)
+    def exists(self, row: dict) -> bool:
+        """
+        Checks if the given dataset exists in our dataset.
+
+        :param row:
+            The row or dataset to check.
+        """
+
+        index = self.get_index()
+
+        return index.get_key(self.get_prepared_row(row)) in index.rows
+
+    def close(self) -> "IndexedCSVDatasetBase":
+        """
+        Compacts all the files we indexed so far and release their index.
+        """
+
+        for source_file, index in list(self._indexes.items()):
+            if FileHelper(source_file).exists():
+                index.compact()
+
+                PyFunceble.facility.Logger.debug("Compacted: %r", source_file)
+
+            del self._indexes[source_file]
+
+        return self
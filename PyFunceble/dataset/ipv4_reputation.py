@@ -50,8 +50,12 @@ License:
     limitations under the License.
 """
 
+import bisect
+import ipaddress
+from array import array
 from typing import Any, Optional
 
+import PyFunceble.storage
 from PyFunceble.dataset.base import DatasetBase
 from PyFunceble.downloader.ipv4_reputation import IPV4ReputationDownloader
 from PyFunceble.helpers.file import FileHelper
@@ -60,9 +64,13 @@ from PyFunceble.helpers.file import FileHelper
 class IPV4ReputationDataset(DatasetBase):
     """
     Provides the interface for the lookup of the IPv4 reputation.
+
+    The dataset is loaded (once per process) into a sorted array of packed
+    IPv4. When it is loaded before the creation of our workers, the (forked)
+    workers share it instead of reading the file over and over.
     """
 
-    STORAGE_INDEX: Optional[str] = None
+    STORAGE_INDEX: Optional[str] = "IPV4_REPUTATION"
     downloader: Optional[IPV4ReputationDownloader] = None
 
     def __init__(self) -> None:
@@ -70,14 +78,15 @@ class IPV4ReputationDataset(DatasetBase):
         self.source_file = self.downloader.destination
 
     def __contains__(self, value: Any) -> bool:
-        with self.get_content() as file_stream:
-            for line in file_stream:
-                line = line.strip()
+        try:
+            value = int(ipaddress.IPv4Address(value))
+        except ValueError:
+            return False
 
-                if line.startswith(f"{value}#"):
-                    return True
+        index = self.get_index()
+        position = bisect.bisect_left(index, value)
 
-        return False
+        return position < len(index) and index[position] == value
 
     @DatasetBase.ensure_source_file_exists
     def get_content(self) -> open:
@@ -99,3 +108,40 @@ class IPV4ReputationDataset(DatasetBase):
                 raise FileNotFoundError(file_helper.path)
 
         return file_helper.open("r", encoding="utf-8")
+
+    @DatasetBase.ensure_source_file_exists
+    def get_index(self) -> array:
+        """
+        Provides the sorted array of (packed) IPv4 of the dataset.
+
+        .. note::
+            The array is built at the first call and then kept in our storage.
+        """
+
+        storage = getattr(PyFunceble.storage, self.STORAGE_INDEX)
+
+        if self.source_file not in storage:
+            storage[self.source_file] = self.load()
+
+        return storage[self.source_file]
+
+    def load(self) -> array:
+        """
+        Reads the dataset and provides its sorted array of (packed) IPv4.
+        """
+
+        result = set()
+
+        with self.get_content() as file_stream:
+            for line in file_stream:
+                subject = line.strip().split("#", 1)[0]
+
+                if not subject:
+                    continue
+
+                try:
+                    result.add(int(ipaddress.IPv4Address(subject)))
+                except ValueError:
+                    continue
+
+        return array("I", sorted(result))
@@ -51,10 +51,12 @@ License:
 """
 
 import functools
+import time
 from datetime import datetime, timezone
-from typing import Any, Generator, Optional
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
 import sqlalchemy.exc
+from sqlalchemy import and_, bindparam, or_
 from sqlalchemy.orm import Session
 
 import PyFunceble.cli.factory
@@ -68,19 +70,50 @@ class SQLDBDatasetBase(DBDatasetBase):
     """
 
     STD_KEEP_SESSION_OPEN: bool = False
+    STD_BATCH_SIZE: int = 0
+    STD_BATCH_DELAY: float = 1.0
+
+    MAX_ROWS_PER_LOOKUP: int = 500
     ORM_OBJ = None
 
     db_session: Optional[Session] = None
 
+    _batch_size: int = 0
+    _batch_delay: float = 1.0
+
+    _pending: Optional[Dict[Tuple[Any, ...], Tuple[str, dict, bool]]] = None
+    """
+    The rows waiting to be written. Keys are the comparison values and values
+    are the action to perform, the row and whether we should ignore the row
+    if it already exists.
+    """
+
+    _last_flush: float = 0.0
+
     def __init__(
         self,
         *,
         authorized: Optional[bool] = None,
         remove_unneeded_fields: Optional[bool] = None,
         db_session: Optional[Session] = None,
+        batch_size: Optional[int] = None,
+        batch_delay: Optional[float] = None,
     ) -> None:
         self.db_session = db_session
 
+        if batch_size is not None:
+            self.batch_size = batch_size
+        else:
+            self.batch_size = self.STD_BATCH_SIZE
+
+        if batch_delay is not None:
+            self.batch_delay = batch_delay
+        else:
+            self.batch_delay = self.STD_BATCH_DELAY
+
+        self._pending = {}
+        self._last_flush = time.monotonic()
+
         super().__init__(
             authorized=authorized, remove_unneeded_fields=remove_unneeded_fields
         )
@@ -109,12 +142,268 @@ class SQLDBDatasetBase(DBDatasetBase):
 
         return wrapper
 
+    @property
+    def batch_size(self) -> int:
+        """
+        Provides the current state of the :code:`_batch_size` attribute.
+        """
+
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: int) -> None:
+        """
+        Sets the number of rows to buffer before writing them into the
+        database.
+
+        :param value:
+            The value to set. :code:`0` disables the buffering.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError("<value> should be greater or equal to zero.")
+
+        self._batch_size = value
+
+    def set_batch_size(self, value: int) -> "SQLDBDatasetBase":
+        """
+        Sets the number of rows to buffer before writing them into the
+        database.
+
+        :param value:
+            The value to set.
+        """
+
+        self.batch_size = value
+
+        return self
+
+    @property
+    def batch_delay(self) -> float:
+        """
+        Provides the current state of the :code:`_batch_delay` attribute.
+        """
+
+        return self._batch_delay
+
+    @batch_delay.setter
+    def batch_delay(self, value: float) -> None:
+        """
+        Sets the maximal time (in seconds) a row can stay in the buffer.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`float` or
+            :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {float}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError("<value> should be greater or equal to zero.")
+
+        self._batch_delay = float(value)
+
+    def set_batch_delay(self, value: float) -> "SQLDBDatasetBase":
+        """
+        Sets the maximal time (in seconds) a row can stay in the buffer.
+
+        :param value:
+            The value to set.
+        """
+
+        self.batch_delay = value
+
+        return self
+
+    def get_pending_key(self, row: dict) -> Tuple[Any, ...]:
+        """
+        Provides the key of the given row inside our buffer.
+
+        :param row:
+            The row to work with.
+        """
+
+        return tuple(row.get(x) for x in self.COMPARISON_FIELDS)
+
+    def get_batch_row(self, row: dict) -> dict:
+        """
+        Provides the given row without the keys which are not a column of our
+        table.
+
+        :param row:
+            The row to work with.
+        """
+
+        columns = self.ORM_OBJ.__table__.columns.keys()
+
+        return {x: y for x, y in row.items() if x in columns and x != "id"}
+
+    def add_to_pending(
+        self, action: str, row: dict, *, ignore_if_exist: bool = False
+    ) -> "SQLDBDatasetBase":
+        """
+        Adds the given row to the buffer and flush the buffer when it is full
+        or too old.
+
+        :param action:
+            The action to perform. Can be :code:`update` or :code:`remove`.
+        :param row:
+            The row to buffer.
+        :param ignore_if_exist:
+            Ignores the update if the row already exists.
+        """
+
+        key = self.get_pending_key(row)
+
+        if action == "update" and ignore_if_exist and key in self._pending:
+            if self._pending[key][0] == "remove":
+                # The row will be removed first, so it will never exist.
+                self._pending[key] = (action, row, False)
+        else:
+            self._pending[key] = (action, row, ignore_if_exist)
+
+        if (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.batch_delay
+        ):
+            self.flush()
+
+        return self
+
+    def get_existing_row_ids(
+        self, keys: List[Tuple[Any, ...]]
+    ) -> Dict[Tuple[Any, ...], int]:
+        """
+        Provides the ID of the existing rows matching the given keys.
+
+        :param keys:
+            The comparison values to look for.
+        """
+
+        result = {}
+        columns = [getattr(self.ORM_OBJ, x) for x in self.COMPARISON_FIELDS]
+
+        for i in range(0, len(keys), self.MAX_ROWS_PER_LOOKUP):
+            query = self.db_session.query(self.ORM_OBJ.id, *columns).filter(
+                or_(
+                    *[
+                        and_(*[x == y for x, y in zip(columns, key)])
+                        for key in keys[i : i + self.MAX_ROWS_PER_LOOKUP]
+                    ]
+                )
+            )
+
+            for row in query:
+                key = tuple(row[1:])
+
+                if key not in result:
+                    result[key] = row[0]
+
+        return result
+
+    @DBDatasetBase.execute_if_authorized(None)
+    @ensure_orm_obj_is_given
+    def flush(self) -> "SQLDBDatasetBase":
+        """
+        Writes all buffered rows into the database - in a single transaction.
+        """
+
+        self._last_flush = time.monotonic()
+
+        if not self._pending:
+            return self
+
+        pending, self._pending = self._pending, {}
+
+        PyFunceble.facility.Logger.info("Started to flush %d rows.", len(pending))
+
+        table = self.ORM_OBJ.__table__
+        existing_ids = self.get_existing_row_ids(list(pending))
+
+        to_delete, to_update, to_insert = [], {}, {}
+
+        for key, (action, row, ignore_if_exist) in pending.items():
+            if action == "remove":
+                if key in existing_ids:
+                    to_delete.append(existing_ids[key])
+            elif key in existing_ids:
+                if not ignore_if_exist:
+                    batch_row = self.get_batch_row(row)
+                    to_update.setdefault(tuple(sorted(batch_row)), []).append(
+                        {**batch_row, "_pyf_id": existing_ids[key]}
+                    )
+            else:
+                batch_row = self.get_batch_row(row)
+                to_insert.setdefault(tuple(sorted(batch_row)), []).append(batch_row)
+
+        try:
+            if to_delete:
+                self.db_session.execute(table.delete().where(table.c.id.in_(to_delete)))
+
+            for rows in to_update.values():
+                self.db_session.execute(
+                    table.update().where(table.c.id == bindparam("_pyf_id")), rows
+                )
+
+            for rows in to_insert.values():
+                self.db_session.execute(table.insert(), rows)
+
+            self.db_session.commit()
+        except (sqlalchemy.exc.DataError, sqlalchemy.exc.IntegrityError):
+            # We let the standard (row by row) workflow handle the problematic
+            # rows.
+            self.db_session.rollback()
+
+            PyFunceble.facility.Logger.info(
+                "Could not flush rows at once. Writing them one by one."
+            )
+
+            batch_size, self.batch_size = self.batch_size, 0
+
+            try:
+                for action, row, ignore_if_exist in pending.values():
+                    if action == "remove":
+                        self.remove(row)
+                    else:
+                        self.update(row, ignore_if_exist=ignore_if_exist)
+            finally:
+                self.batch_size = batch_size
+
+        PyFunceble.facility.Logger.info("Finished to flush %d rows.", len(pending))
+
+        return self
+
+    def close(self) -> "SQLDBDatasetBase":
+        """
+        Writes all buffered rows into the database.
+        """
+
+        self.flush()
+
+        return self
+
     @DBDatasetBase.execute_if_authorized(None)
     def get_content(self) -> Generator[dict, None, None]:
         """
         Provides a generator which provides the next dataset to read.
         """
 
+        self.flush()
+
         for row in self.db_session.query(self.ORM_OBJ):
             row = row.to_dict()
 
@@ -144,7 +433,9 @@ class SQLDBDatasetBase(DBDatasetBase):
         if isinstance(row, type(self.ORM_OBJ)):
             row = row.to_dict()
 
-        if "id" in row:
+        if self.batch_size and "id" not in row:
+            self.add_to_pending("update", row, ignore_if_exist=ignore_if_exist)
+        elif "id" in row:
             self.db_session.execute(
                 self.ORM_OBJ.__table__.update().where(self.ORM_OBJ.id == row["id"]),
                 row,
@@ -166,6 +457,46 @@ class SQLDBDatasetBase(DBDatasetBase):
 
         return self
 
+    @DBDatasetBase.execute_if_authorized(None)
+    def update_many(
+        self, rows: Iterable[dict], *, ignore_if_exist: bool = False
+    ) -> "SQLDBDatasetBase":
+        """
+        Adds the given datasets into the database if they do not exists.
+        Update otherwise.
+
+        Unlike :meth:`update`, all rows are written through our buffer - in a
+        single transaction - whatever the configured batch size.
+
+        :param rows:
+            The rows or datasets to manipulate.
+
+        :param ignore_if_exist:
+            Ignores the insertion/update of the rows which already exists.
+        """
+
+        rows = list(rows)
+
+        if not rows:
+            return self
+
+        previous_batch_size, previous_batch_delay = self._batch_size, self._batch_delay
+
+        # One more than the number of rows, so that the buffer is never flushed
+        # while we are filling it.
+        self._batch_size, self._batch_delay = len(rows) + 1, float("inf")
+
+        try:
+            for row in rows:
+                self.update(row, ignore_if_exist=ignore_if_exist)
+        finally:
+            self._batch_size, self._batch_delay = (
+                previous_batch_size,
+                previous_batch_delay,
+            )
+
+        return self.flush()
+
     @DBDatasetBase.execute_if_authorized(None)
     @ensure_orm_obj_is_given
     def remove(self, row) -> "SQLDBDatasetBase":
@@ -187,7 +518,9 @@ class SQLDBDatasetBase(DBDatasetBase):
 
         PyFunceble.facility.Logger.info("Started to remove row.")
 
-        if not isinstance(row, type(self.ORM_OBJ)):
+        if self.batch_size and not isinstance(row, type(self.ORM_OBJ)):
+            self.add_to_pending("remove", row)
+        elif not isinstance(row, type(self.ORM_OBJ)):
             row_id = self.get_existing_row_id(row)
 
             if row_id is not None:
@@ -218,6 +551,12 @@ class SQLDBDatasetBase(DBDatasetBase):
             schema.
         """
 
+        if isinstance(row, dict) and self._pending:
+            key = self.get_pending_key(row)
+
+            if key in self._pending:
+                return self._pending[key][0] != "remove"
+
         return self.get_existing_row_id(row) is not None
 
     @DBDatasetBase.execute_if_authorized(None)
@@ -235,6 +574,8 @@ class SQLDBDatasetBase(DBDatasetBase):
                 f"<row> should be {dict} or {self.ORM_OBJ}, {type(row)} given."
             )
 
+        self.flush()
+
         if isinstance(row, type(self.ORM_OBJ)):
             row = row.to_dict()
 
@@ -264,6 +605,8 @@ class SQLDBDatasetBase(DBDatasetBase):
                 f"<row> should be {dict} or {self.ORM_OBJ}, {type(row)} given."
             )
 
+        self.flush()
+
         if isinstance(row, type(self.ORM_OBJ)):
             row = row.to_dict()
 
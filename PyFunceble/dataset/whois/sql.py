@@ -76,6 +76,8 @@ class SQLDBWhoisDataset(SQLDBDatasetBase, WhoisDatasetBase):
 
     @SQLDBDatasetBase.execute_if_authorized(None)
     def __contains__(self, value: str) -> bool:
+        self.flush()
+
         try:
             return (
                 self.db_session.query(self.ORM_OBJ)
@@ -93,6 +95,8 @@ class SQLDBWhoisDataset(SQLDBDatasetBase, WhoisDatasetBase):
 
     @SQLDBDatasetBase.execute_if_authorized(None)
     def __getitem__(self, value: Any) -> Optional[WhoisRecord]:
+        self.flush()
+
         try:
             return (
                 self.db_session.query(self.ORM_OBJ)
@@ -161,6 +165,8 @@ class SQLDBWhoisDataset(SQLDBDatasetBase, WhoisDatasetBase):
         in the past.
         """
 
+        self.flush()
+
         current_timestamp = int(datetime.now(timezone.utc).timestamp())
 
         try:
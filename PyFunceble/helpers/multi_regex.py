@@ -0,0 +1,290 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the helper which matches a data against a set of regexes at once.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import functools
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class MultiRegexHelper:
+    """
+    Matches a given data against a whole set of regexes at once.
+
+    The set is compiled once (per process) into:
+
+    - a table of literal suffixes (eg. :code:`\\.example\\.org$`),
+    - a table of literal prefixes (eg. :code:`^example\\.`),
+    - a table of literal (exact) values (eg. :code:`^example\\.org$`),
+    - a single combined alternation of all the other regexes.
+
+    Which let us answer the "does it match anything?" question with a handful
+    of (C level) lookups instead of a search per regex.
+
+    .. note::
+        As with :py:func:`re.search`, the indexes of the matching regexes are
+        provided in the order of the given regexes.
+
+    :param regexes:
+        The regexes to work with.
+    """
+
+    META_CHARACTERS: str = ".^$*+?{}[]\\|()"
+
+    _regexes: Tuple[str, ...] = ()
+    _compiled: Optional[tuple] = None
+
+    def __init__(self, regexes: Optional[Iterable[str]] = None) -> None:
+        if regexes is not None:
+            self.regexes = regexes
+
+    @property
+    def regexes(self) -> Tuple[str, ...]:
+        """
+        Provides the current state of the :code:`_regexes` attribute.
+        """
+
+        return self._regexes
+
+    @regexes.setter
+    def regexes(self, value: Iterable[str]) -> None:
+        """
+        Sets the regexes to work with.
+
+        :param value:
+            The regexes to work with.
+
+        :raise TypeError:
+            When :code:`value` is not an iterable of :py:class:`str`.
+        """
+
+        if isinstance(value, str):
+            raise TypeError(f"<value> should be an iterable of {str}, {str} given.")
+
+        value = tuple(value)
+
+        if not all(isinstance(x, str) for x in value):
+            raise TypeError(f"<value> should be an iterable of {str}.")
+
+        self._regexes = value
+        self._compiled = self.compile(value)
+
+    def set_regexes(self, value: Iterable[str]) -> "MultiRegexHelper":
+        """
+        Sets the regexes to work with.
+
+        :param value:
+            The regexes to work with.
+
+        :raise TypeError:
+            When :code:`value` is not an iterable of :py:class:`str`.
+        """
+
+        self.regexes = value
+
+        return self
+
+    @classmethod
+    def get_literal(cls, regex: str) -> Optional[str]:
+        """
+        Provides the literal string represented by the given regex - if the
+        given regex is a plain (escaped) string.
+
+        :param regex:
+            The regex to work with.
+        """
+
+        result = []
+        escaped = False
+
+        for char in regex:
+            if escaped:
+                if char.isalnum() or char == "_":
+                    # Special sequences like \d or \1.
+                    return None
+
+                result.append(char)
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char in cls.META_CHARACTERS:
+                return None
+            else:
+                result.append(char)
+
+        if escaped:
+            return None
+
+        return "".join(result)
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def compile(cls, regexes: Tuple[str, ...]) -> tuple:
+        """
+        Compiles the given regexes.
+
+        .. note::
+            The result is cached. Therefore, a given set of regexes is only
+            compiled once per process.
+
+        :param regexes:
+            The regexes to compile.
+        """
+
+        exacts: Dict[str, List[int]] = {}
+        suffixes: Dict[str, List[int]] = {}
+        prefixes: Dict[str, List[int]] = {}
+        others: Dict[int, re.Pattern] = {}
+
+        for index, regex in enumerate(regexes):
+            anchored_start = regex.startswith("^")
+            anchored_end = regex.endswith("$") and not regex.endswith("\\$")
+
+            literal = cls.get_literal(
+                regex[int(anchored_start) : len(regex) - int(anchored_end)]
+            )
+
+            if literal is None or not (anchored_start or anchored_end):
+                others[index] = re.compile(regex)
+            elif anchored_start and anchored_end:
+                exacts.setdefault(literal, []).append(index)
+            elif anchored_end:
+                suffixes.setdefault(literal, []).append(index)
+            else:
+                prefixes.setdefault(literal, []).append(index)
+
+        combined = None
+
+        if others and not any(
+            re.search(r"\\[1-9]|\(\?P=", x.pattern) for x in others.values()
+        ):
+            try:
+                combined = re.compile(
+                    "|".join(f"(?:{x.pattern})" for x in others.values())
+                )
+            except re.error:
+                # Most likely some (global) inline flags.
+                combined = None
+
+        return (
+            exacts,
+            tuple(suffixes.items()),
+            tuple(suffixes),
+            tuple(prefixes.items()),
+            tuple(prefixes),
+            others,
+            combined,
+        )
+
+    def get_matching_indexes(self, data: str) -> List[int]:
+        """
+        Provides the indexes of the regexes which match the given data.
+
+        :param data:
+            The data to work with.
+        """
+
+        if not self._compiled:
+            return []
+
+        (
+            exacts,
+            suffixes,
+            all_suffixes,
+            prefixes,
+            all_prefixes,
+            others,
+            combined,
+        ) = self._compiled
+
+        result = list(exacts.get(data, []))
+
+        if all_suffixes and data.endswith(all_suffixes):
+            for suffix, indexes in suffixes:
+                if data.endswith(suffix):
+                    result.extend(indexes)
+
+        if all_prefixes and data.startswith(all_prefixes):
+            for prefix, indexes in prefixes:
+                if data.startswith(prefix):
+                    result.extend(indexes)
+
+        if others and (combined is None or combined.search(data)):
+            result.extend(x for x, y in others.items() if y.search(data))
+
+        return sorted(result)
+
+    def match(self, data: str) -> bool:
+        """
+        Checks if the given data match (at least) one of the regexes.
+
+        :param data:
+            The data to work with.
+        """
+
+        if not self._compiled:
+            return False
+
+        exacts, _, all_suffixes, _, all_prefixes, others, combined = self._compiled
+
+        if data in exacts:
+            return True
+
+        if all_suffixes and data.endswith(all_suffixes):
+            return True
+
+        if all_prefixes and data.startswith(all_prefixes):
+            return True
+
+        if combined is not None:
+            return combined.search(data) is not None
+
+        return any(x.search(data) for x in others.values())
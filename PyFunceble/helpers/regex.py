@@ -51,7 +51,9 @@ License:
 """
 
 import re
-from typing import List, Optional, Union
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 class RegexHelper:
@@ -60,9 +62,22 @@ class RegexHelper:
 
     :param str regex: The regex to use.
     :param escape_regex: Escapes the given regex.
+
+    .. note::
+        The compiled patterns are kept in a bounded (LRU) cache which is
+        shared by all instances.
     """
 
+    STD_CACHE_MAX_SIZE: int = 512
+
+    _cache_max_size: int = 512
+    _cache: Dict[Tuple[str, int], "RegexHelper"] = OrderedDict()
+    _cache_lock: threading.Lock = threading.Lock()
+    # A (mutable) mapping on purpose: assigning class attributes is costly.
+    _cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
     _regex: Optional[str] = None
+    _pattern: Optional[re.Pattern] = None
     escape_regex: bool = False
 
     def __init__(self, regex: Optional[str] = None, escape_regex: bool = False):
@@ -71,6 +86,120 @@ class RegexHelper:
         if regex is not None:
             self.regex = regex
 
+    @classmethod
+    def compiled(cls, regex: str, *, escape_regex: bool = False) -> "RegexHelper":
+        """
+        Provides a (shared) helper with the given regex already compiled.
+
+        .. warning::
+            The provided helper is shared. Therefore, you shouldn't change its
+            regex.
+
+        :param regex:
+            The regex to work with.
+        :param escape_regex:
+            Escapes the given regex.
+        """
+
+        if escape_regex:
+            regex = re.escape(regex)
+
+        return cls.__get_cached_helper(regex, 0)
+
+    @classmethod
+    def get_compiled_pattern(cls, regex: str, flags: int = 0) -> re.Pattern:
+        """
+        Provides the compiled version of the given regex.
+
+        :param regex:
+            The regex to compile.
+        :param flags:
+            The flags to compile the regex with.
+        """
+
+        # pylint: disable=protected-access
+        return cls.__get_cached_helper(regex, flags)._pattern
+
+    @classmethod
+    def __get_cached_helper(cls, regex: str, flags: int) -> "RegexHelper":
+        """
+        Provides the cached helper of the given regex. If not cached yet, the
+        regex is compiled and cached.
+        """
+
+        key = (regex, flags)
+        result = cls._cache.get(key)
+
+        if result is not None:
+            cls._cache_stats["hits"] += 1
+
+            try:
+                cls._cache.move_to_end(key)
+            except KeyError:  # pragma: no cover ## Evicted in the meantime.
+                pass
+
+            return result
+
+        result = cls()
+        result._regex = regex
+        result._pattern = re.compile(regex, flags)
+
+        with cls._cache_lock:
+            cls._cache_stats["misses"] += 1
+            cls._cache[key] = result
+
+            while len(cls._cache) > cls._cache_max_size:
+                cls._cache.popitem(last=False)
+                cls._cache_stats["evictions"] += 1
+
+        return result
+
+    @classmethod
+    def set_cache_max_size(cls, value: int) -> None:
+        """
+        Sets the maximal number of compiled patterns to keep.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError("<value> should be greater than zero.")
+
+        with cls._cache_lock:
+            cls._cache_max_size = value
+
+            while len(cls._cache) > cls._cache_max_size:
+                cls._cache.popitem(last=False)
+                cls._cache_stats["evictions"] += 1
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Any]:
+        """
+        Provides the statistics of the cache of compiled patterns.
+        """
+
+        return {"size": len(cls._cache), **cls._cache_stats}
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clears the cache of compiled patterns.
+        """
+
+        with cls._cache_lock:
+            cls._cache.clear()
+
+            cls._cache_stats.update(hits=0, misses=0, evictions=0)
+
     @property
     def regex(self) -> Optional[str]:
         """
@@ -99,6 +228,19 @@ class RegexHelper:
         else:
             self._regex = re.escape(value)
 
+        self._pattern = None
+
+    @property
+    def pattern(self) -> re.Pattern:
+        """
+        Provides the compiled version of the current regex.
+        """
+
+        if self._pattern is None:
+            self._pattern = self.get_compiled_pattern(self.regex)
+
+        return self._pattern
+
     def set_regex(self, value: str) -> "RegexHelper":
         """
         Sets the regex to work with.
@@ -120,7 +262,7 @@ class RegexHelper:
         in the given data.
         """
 
-        pre_result = re.compile(self.regex)
+        pre_result = self.pattern
 
         return [x for x in data if not pre_result.search(str(x))]
 
@@ -130,7 +272,7 @@ class RegexHelper:
         in the given data.
         """
 
-        pre_result = re.compile(self.regex)
+        pre_result = self.pattern
 
         return [x for x in data if pre_result.search(str(x))]
 
@@ -157,7 +299,7 @@ class RegexHelper:
         """
 
         result = []
-        to_match = re.compile(self.regex)
+        to_match = self.pattern
 
         if rematch:
             pre_result = to_match.findall(data)
@@ -205,13 +347,12 @@ class RegexHelper:
         """
 
         if isinstance(replacement, str):
-            return re.sub(
-                self.regex,
-                replacement,
-                data,
-                occurences,
-                flags=re.MULTILINE if multiline else 0,
-            )
+            if multiline:
+                return self.get_compiled_pattern(self.regex, re.MULTILINE).sub(
+                    replacement, data, occurences
+                )
+
+            return self.pattern.sub(replacement, data, occurences)
         return data
 
     def split(self, data: str) -> List[str]:
@@ -222,4 +363,4 @@ class RegexHelper:
         :rtype: list
         """
 
-        return re.split(self.regex, data)
+        return self.pattern.split(data)
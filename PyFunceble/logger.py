@@ -50,11 +50,13 @@ License:
     limitations under the License.
 """
 
+import atexit
 import functools
 import logging
 import logging.handlers
+import multiprocessing
 import os
-import traceback
+import sys
 from typing import Generator, Optional, Tuple, Union
 
 import PyFunceble.cli.storage
@@ -75,6 +77,12 @@ class Logger:
         3. Through the :code:`PYFUNCEBLE_DEBUG` environment variable.
         4. Through the :code:`DEBUG_PYFUNCEBLE` environment variable.
         5. Through the :py:meth:`PyFunceble.logger.Logger.set_activated` method.
+
+    .. note::
+        When :code:`use_queue` is activated, the process which initiates the
+        loggers first starts a listener. The listener writes - from a thread of
+        that process - every records pushed into :code:`queue` by the loggers
+        of any processes sharing the same queue.
     """
 
     # pylint: disable=too-many-public-methods
@@ -97,10 +105,15 @@ class Logger:
     """
 
     STD_MIN_LEVEL: int = logging.INFO
+    STD_USE_QUEUE: bool = False
 
     _activated: bool = False
     _min_level: int = logging.INFO
     _output_directory: Optional[str] = None
+    _use_queue: bool = False
+    _queue: Optional[multiprocessing.Queue] = None
+
+    queue_listener: Optional[logging.handlers.QueueListener] = None
 
     own_formatter: logging.Formatter = logging.Formatter(OWN_FORMAT)
     root_formatter: logging.Formatter = logging.Formatter(ROOT_FORMAT)
@@ -121,6 +134,7 @@ class Logger:
         activated: Optional[bool] = None,
         min_level: Optional[int] = None,
         output_dir: Optional[str] = None,
+        use_queue: Optional[bool] = None,
     ) -> None:
         if output_dir:
             self.output_directory = output_dir
@@ -138,6 +152,11 @@ class Logger:
         else:
             self.guess_and_set_min_level()
 
+        if use_queue is not None:
+            self.use_queue = use_queue
+        else:
+            self.guess_and_set_use_queue()
+
     @property
     def on_screen(self) -> bool:
         """
@@ -249,6 +268,84 @@ class Logger:
 
         return self
 
+    @property
+    def use_queue(self) -> bool:
+        """
+        Provides the current state of the :code:`_use_queue` attribute.
+        """
+
+        return self._use_queue
+
+    @use_queue.setter
+    def use_queue(self, value: bool) -> None:
+        """
+        Sets the authorization to write the logs through a queue.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given value is not a :py:class:`bool`.
+        """
+
+        if not isinstance(value, bool):
+            raise TypeError(f"<value> should be {bool}, {type(value)} given.")
+
+        self._use_queue = value
+
+    def set_use_queue(self, value: bool) -> "Logger":
+        """
+        Sets the authorization to write the logs through a queue.
+
+        :param value:
+            The value to set.
+        """
+
+        self.use_queue = value
+
+        return self
+
+    @property
+    def queue(self) -> Optional[multiprocessing.Queue]:
+        """
+        Provides the current state of the :code:`_queue` attribute.
+        """
+
+        return self._queue
+
+    @queue.setter
+    def queue(self, value: Optional[multiprocessing.Queue]) -> None:
+        """
+        Sets the queue to push the log records into.
+
+        .. note::
+            A process which is given a queue never starts a listener. It
+            assumes that another process already listens to the given queue.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given value is not a queue.
+        """
+
+        if value is not None and not hasattr(value, "put_nowait"):
+            raise TypeError(f"<value> should be a queue, {type(value)} given.")
+
+        self._queue = value
+
+    def set_queue(self, value: Optional[multiprocessing.Queue]) -> "Logger":
+        """
+        Sets the queue to push the log records into.
+
+        :param value:
+            The value to set.
+        """
+
+        self.queue = value
+
+        return self
+
     @property
     def output_directory(self) -> Optional[str]:
         """
@@ -309,22 +406,19 @@ class Logger:
         )
 
     @staticmethod
-    def get_origin() -> dict:
+    @functools.lru_cache(maxsize=1024)
+    def get_origin_path(file_path: str, cwd: str) -> str:
         """
-        Provides the informatioon about where the logger was triggered.
+        Provides the path to display for the given file path.
 
-        :return:
-            A tuple, which is composed of the following.
-
-            (trigger file path, trigger line, trigger function/method name)
+        :param file_path:
+            The path of the file which triggered the logger.
+        :param cwd:
+            The current working directory. It's part of the cache key as the
+            provided path may be relative to it.
         """
 
-        stackback = [
-            y for x in [x.split("\n") for x in traceback.format_stack()] for y in x if y
-        ]
-        interest = stackback[-6].split(",")
-
-        complete_file = interest[0].strip()[6:-1].split(os.sep)
+        complete_file = file_path.split(os.sep)
 
         try:
             if complete_file[-2] != PyFunceble.storage.PROJECT_NAME:
@@ -334,13 +428,40 @@ class Logger:
         except IndexError:
             file = "/".join(complete_file)
 
-        line = interest[1].strip().split()[-1].strip()
-        func_name = interest[2].strip()[3:]
+        if PyFunceble.storage.PROJECT_NAME in file and os.path.isabs(file):
+            file = os.path.relpath(file, cwd)
 
-        if PyFunceble.storage.PROJECT_NAME in file:
-            file = os.path.relpath(file)
+        return file
 
-        return {"origin_path": file, "origin_line": line, "origin_func": func_name}
+    @staticmethod
+    def get_origin(depth: int = 2) -> dict:
+        """
+        Provides the informatioon about where the logger was triggered.
+
+        :param depth:
+            The number of frames to go back (from the caller of this method)
+            to reach the frame which triggered the logger.
+
+        :return:
+            A tuple, which is composed of the following.
+
+            (trigger file path, trigger line, trigger function/method name)
+        """
+
+        # Going through the frames is way cheaper than formatting the whole
+        # stack - which we did in the past.
+        try:
+            frame = sys._getframe(depth)  # pylint: disable=protected-access
+        except ValueError:  # pragma: no cover ## Safety!
+            return {"origin_path": "", "origin_line": "", "origin_func": ""}
+
+        return {
+            "origin_path": Logger.get_origin_path(
+                frame.f_code.co_filename, os.getcwd()
+            ),
+            "origin_line": str(frame.f_lineno),
+            "origin_func": frame.f_code.co_name,
+        }
 
     def single_logger_factory(level_name: str):  # pylint: disable=no-self-argument
         """
@@ -350,15 +471,18 @@ class Logger:
             The level to log.
         """
 
+        # Note: exception is not a level, it logs at the ERROR level.
+        # pylint: disable=protected-access,no-member
+        level = logging._nameToLevel.get(level_name.upper(), logging.ERROR)
+
         def single_logger(func):
             @functools.wraps(func)
             def wrapper(self, *args, **kwargs):
-                # pylint: disable=no-member, protected-access
+                # pylint: disable=no-member
 
-                if (
-                    self.authorized
-                    and logging._nameToLevel[level_name.upper()] >= self.min_level
-                ):
+                # Note: The level is checked first because it's way cheaper
+                # than the authorization (environment variables lookup).
+                if level >= self.min_level and self.authorized:
                     try:
                         logger = getattr(
                             getattr(self, f"{level_name.lower()}_logger"),
@@ -409,6 +533,21 @@ class Logger:
             else:
                 self.min_level = self.STD_MIN_LEVEL
 
+    def guess_and_set_use_queue(self) -> "Logger":
+        """
+        Tries to guess the authorization to write through a queue from the
+        configuration.
+        """
+
+        if PyFunceble.storage.CONFIGURATION and "queue" in (
+            PyFunceble.storage.CONFIGURATION.debug
+        ):
+            self.use_queue = bool(PyFunceble.storage.CONFIGURATION.debug.queue)
+        else:
+            self.use_queue = self.STD_USE_QUEUE
+
+        return self
+
     def guess_all_settings(self) -> "Logger":
         """
         Try to guess all settings.
@@ -469,12 +608,76 @@ class Logger:
             self.sqlalchemy_logger.setLevel(self.min_level)
             self.sqlalchemy_logger.propagate = False
 
+            if self.use_queue and self.queue is None:
+                self.start_queue_listener()
+
             for logger, level in self.get_next_logger():
                 logger.propagate = False
 
                 # pylint: disable=protected-access
                 logger.setLevel(logging._nameToLevel[level.upper()])
-                logger.addHandler(self.get_handler(level))
+
+                if self.queue is not None:
+                    logger.addHandler(logging.handlers.QueueHandler(self.queue))
+                else:
+                    logger.addHandler(self.get_handler(level))
+
+        return self
+
+    def start_queue_listener(self) -> "Logger":
+        """
+        Starts the listener which writes the records pushed into our queue.
+
+        .. note::
+            The queue is created if none was given.
+        """
+
+        if self.queue_listener is not None:
+            return self
+
+        if self.queue is None:
+            self.queue = multiprocessing.Queue()
+
+        handlers = []
+
+        for _, level in self.get_next_logger():
+            handler = self.get_handler(level)
+            # Our listener is shared by all levels. Therefore, we ensure that
+            # each file only get the records of its own logger.
+            handler.addFilter(logging.Filter(f"PyFunceble.{level}"))
+
+            handlers.append(handler)
+
+        self.queue_listener = logging.handlers.QueueListener(
+            self.queue, *handlers, respect_handler_level=True
+        )
+        self.queue_listener.start()
+
+        atexit.register(self.stop_queue_listener)
+
+        return self
+
+    def stop_queue_listener(self) -> "Logger":
+        """
+        Stops the listener - after writing every pending records.
+
+        .. warning::
+            As the loggers are still pushing into the queue, they are
+            destroyed.
+        """
+
+        if self.queue_listener is None:
+            return self
+
+        self.queue_listener.stop()
+
+        for handler in self.queue_listener.handlers:
+            handler.close()
+
+        self.queue_listener = None
+        self.queue = None
+
+        self.destroy_loggers()
 
         return self
 
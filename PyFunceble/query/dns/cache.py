@@ -0,0 +1,360 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides a TTL-aware cache of DNS answers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import PyFunceble.facility
+
+
+class DNSAnswerCache:
+    """
+    Provides a bounded (LRU) cache of DNS answers which respects the TTL of
+    the answers.
+
+    When a shared file is given, the answers are also written into (and read
+    from) a SQLite file so that every process can reuse them.
+
+    :param max_size:
+        The maximal number of answers to keep in memory.
+    :param shared_file:
+        The SQLite file to share the answers through.
+    """
+
+    STD_MAX_SIZE: int = 10000
+
+    MAX_NEGATIVE_TTL: int = 10800
+    """
+    The maximal time (in seconds) we keep a negative answer.
+    """
+
+    CLEANUP_EVERY: int = 1000
+    """
+    The number of writes between two cleanups of the shared file.
+    """
+
+    _max_size: int = 10000
+    _shared_file: Optional[str] = None
+
+    _dataset: Optional[OrderedDict] = None
+    _lock: Optional[threading.Lock] = None
+    _local: Optional[threading.local] = None
+    _writes: int = 0
+
+    def __init__(
+        self, *, max_size: Optional[int] = None, shared_file: Optional[str] = None
+    ) -> None:
+        self._dataset = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        if max_size is not None:
+            self.max_size = max_size
+        else:
+            self.max_size = self.STD_MAX_SIZE
+
+        if shared_file is not None:
+            self.shared_file = shared_file
+
+    def __len__(self) -> int:
+        return len(self._dataset)
+
+    def __getstate__(self) -> dict:
+        # Locks and connections can't be pickled.
+        return {"max_size": self.max_size, "shared_file": self.shared_file}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    @property
+    def max_size(self) -> int:
+        """
+        Provides the current state of the :code:`_max_size` attribute.
+        """
+
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        """
+        Sets the maximal number of answers to keep in memory.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError("<value> should be greater than zero.")
+
+        self._max_size = value
+
+    def set_max_size(self, value: int) -> "DNSAnswerCache":
+        """
+        Sets the maximal number of answers to keep in memory.
+
+        :param value:
+            The value to set.
+        """
+
+        self.max_size = value
+
+        return self
+
+    @property
+    def shared_file(self) -> Optional[str]:
+        """
+        Provides the current state of the :code:`_shared_file` attribute.
+        """
+
+        return self._shared_file
+
+    @shared_file.setter
+    def shared_file(self, value: str) -> None:
+        """
+        Sets the SQLite file to share the answers through.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`str`.
+        :raise ValueError:
+            When the given :code:`value` is empty.
+        """
+
+        if not isinstance(value, str):
+            raise TypeError(f"<value> should be {str}, {type(value)} given.")
+
+        if not value:
+            raise ValueError("<value> should not be empty.")
+
+        self._shared_file = value
+        self._local = threading.local()
+
+    def set_shared_file(self, value: str) -> "DNSAnswerCache":
+        """
+        Sets the SQLite file to share the answers through.
+
+        :param value:
+            The value to set.
+        """
+
+        self.shared_file = value
+
+        return self
+
+    def get_connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Provides the connection to the shared file of the current process and
+        thread.
+        """
+
+        if not self.shared_file:
+            return None
+
+        # A forked process should never reuse the connection of its parent.
+        if getattr(self._local, "pid", None) != os.getpid():
+            try:
+                connection = sqlite3.connect(self.shared_file, timeout=10.0)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS dns_answers ("
+                    "qname TEXT NOT NULL, "
+                    "rdtype TEXT NOT NULL, "
+                    "protocol TEXT NOT NULL, "
+                    "expires_at REAL NOT NULL, "
+                    "answers TEXT NOT NULL, "
+                    "PRIMARY KEY (qname, rdtype, protocol))"
+                )
+                connection.commit()
+            except sqlite3.Error:
+                PyFunceble.facility.Logger.exception(
+                    "Could not open the shared DNS cache %r.", self.shared_file
+                )
+                connection = None
+
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+
+        return self._local.connection
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[List[str]]:
+        """
+        Provides the cached answers of the given key.
+
+        :param key:
+            The :code:`(qname, rdtype, protocol)` to look for.
+
+        :return:
+            :code:`None` if nothing (valid) is cached. Otherwise, the answers.
+            An empty list is a cached negative answer.
+        """
+
+        now = time.time()
+
+        with self._lock:
+            if key in self._dataset:
+                expires_at, answers = self._dataset[key]
+
+                if expires_at > now:
+                    self._dataset.move_to_end(key)
+
+                    return list(answers)
+
+                del self._dataset[key]
+
+        connection = self.get_connection()
+
+        if connection is None:
+            return None
+
+        try:
+            row = connection.execute(
+                "SELECT expires_at, answers FROM dns_answers "
+                "WHERE qname = ? AND rdtype = ? AND protocol = ?",
+                key,
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if not row or row[0] <= now:
+            return None
+
+        answers = json.loads(row[1])
+        self.__remember(key, row[0], answers)
+
+        return answers
+
+    def set(self, key: Tuple[str, str, str], answers: List[str], ttl: int) -> None:
+        """
+        Caches the given answers.
+
+        :param key:
+            The :code:`(qname, rdtype, protocol)` to cache for.
+        :param answers:
+            The answers to cache. An empty list means a negative answer.
+        :param ttl:
+            The number of seconds the answers are valid for.
+        """
+
+        if not answers:
+            ttl = min(ttl, self.MAX_NEGATIVE_TTL)
+
+        if ttl <= 0:
+            return
+
+        expires_at = time.time() + ttl
+        answers = list(answers)
+
+        self.__remember(key, expires_at, answers)
+
+        connection = self.get_connection()
+
+        if connection is None:
+            return
+
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO dns_answers "
+                "(qname, rdtype, protocol, expires_at, answers) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*key, expires_at, json.dumps(answers)),
+            )
+
+            self._writes += 1
+
+            if self._writes % self.CLEANUP_EVERY == 0:
+                connection.execute(
+                    "DELETE FROM dns_answers WHERE expires_at <= ?", (time.time(),)
+                )
+
+            connection.commit()
+        except sqlite3.Error:
+            # The shared file is only a bonus.
+            pass
+
+    def __remember(
+        self, key: Tuple[str, str, str], expires_at: float, answers: List[str]
+    ) -> None:
+        """
+        Saves the given answers into our memory.
+        """
+
+        with self._lock:
+            self._dataset[key] = (expires_at, answers)
+            self._dataset.move_to_end(key)
+
+            while len(self._dataset) > self.max_size:
+                self._dataset.popitem(last=False)
+
+    def clear(self) -> "DNSAnswerCache":
+        """
+        Clears the (in-memory) cache.
+        """
+
+        with self._lock:
+            self._dataset.clear()
+
+        return self
@@ -52,9 +52,11 @@ License:
 
 # pylint: disable=too-many-lines
 
+import concurrent.futures
 import copy
 import functools
 import ipaddress
+import os
 import random
 import socket
 import time
@@ -70,6 +72,7 @@ import dns.rdatatype
 import PyFunceble.facility
 import PyFunceble.storage
 from PyFunceble.helpers.list import ListHelper
+from PyFunceble.query.dns.cache import DNSAnswerCache
 from PyFunceble.query.dns.nameserver import Nameservers
 from PyFunceble.query.record.dns import DNSQueryToolRecord
 
@@ -86,6 +89,7 @@ class DNSQueryTool:
     STD_FOLLOW_NAMESERVER_ORDER: bool = True
     STD_TRUST_SERVER: bool = False
     STD_DELAY: float = 0.0
+    STD_CONCURRENT_LOOKUP: bool = False
 
     SUPPORTED_PROTOCOL: List[str] = ["TCP", "UDP", "HTTPS", "TLS"]
 
@@ -105,12 +109,21 @@ class DNSQueryTool:
     _query_timeout: float = 5.0
     _trust_server: bool = False
     _delay: float = 0.0
+    _concurrent_lookup: bool = False
 
     dns_name: Optional[str] = None
 
     query_message: Optional[dns.message.QueryMessage] = None
     lookup_record: Optional[DNSQueryToolRecord] = None
 
+    shared_answer_cache: Optional[DNSAnswerCache] = None
+    """
+    The answer cache shared by all query tools of the current process.
+    """
+
+    _answer_cache: Optional[DNSAnswerCache] = None
+    _answer_ttl: Optional[int] = None
+
     def __init__(
         self,
         *,
@@ -119,6 +132,8 @@ class DNSQueryTool:
         preferred_protocol: Optional[str] = None,
         trust_server: Optional[bool] = None,
         delay: Optional[bool] = None,
+        concurrent_lookup: Optional[bool] = None,
+        answer_cache: Optional[DNSAnswerCache] = None,
     ) -> None:
         if nameservers is not None:
             self.nameservers.set_nameservers(nameservers)
@@ -145,6 +160,16 @@ class DNSQueryTool:
         else:
             self.guess_and_set_delay()
 
+        if concurrent_lookup is not None:
+            self.concurrent_lookup = concurrent_lookup
+        else:
+            self.guess_and_set_concurrent_lookup()
+
+        if answer_cache is not None:
+            self.answer_cache = answer_cache
+        else:
+            self.guess_and_set_answer_cache()
+
     def prepare_query(func):  # pylint: disable=no-self-argument
         """
         Prepare the query after running the decorated method.
@@ -620,6 +645,81 @@ class DNSQueryTool:
 
         return self
 
+    @property
+    def concurrent_lookup(self) -> bool:
+        """
+        Provides the current state of the :code:`_concurrent_lookup` attribute.
+        """
+
+        return self._concurrent_lookup
+
+    @concurrent_lookup.setter
+    def concurrent_lookup(self, value: bool) -> None:
+        """
+        Allows or disallows the concurrent query of multiple record types.
+
+        :param value:
+            The value to apply.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`bool`.
+        """
+
+        if not isinstance(value, bool):
+            raise TypeError(f"<value> should be {bool}, {type(value)} given.")
+
+        self._concurrent_lookup = value
+
+    def set_concurrent_lookup(self, value: bool) -> "DNSQueryTool":
+        """
+        Allows or disallows the concurrent query of multiple record types.
+
+        :param value:
+            The value to apply.
+        """
+
+        self.concurrent_lookup = value
+
+        return self
+
+    @property
+    def answer_cache(self) -> Optional[DNSAnswerCache]:
+        """
+        Provides the current state of the :code:`_answer_cache` attribute.
+        """
+
+        return self._answer_cache
+
+    @answer_cache.setter
+    def answer_cache(self, value: Optional[DNSAnswerCache]) -> None:
+        """
+        Sets the cache of DNS answers to use.
+
+        :param value:
+            The value to set. :code:`None` disables the cache.
+
+        :raise TypeError:
+            When the given :code:`value` is not a
+            :py:class:`~PyFunceble.query.dns.cache.DNSAnswerCache`.
+        """
+
+        if value is not None and not isinstance(value, DNSAnswerCache):
+            raise TypeError(f"<value> should be {DNSAnswerCache}, {type(value)} given.")
+
+        self._answer_cache = value
+
+    def set_answer_cache(self, value: Optional[DNSAnswerCache]) -> "DNSQueryTool":
+        """
+        Sets the cache of DNS answers to use.
+
+        :param value:
+            The value to set.
+        """
+
+        self.answer_cache = value
+
+        return self
+
     def guess_and_set_preferred_protocol(self) -> "DNSQueryTool":
         """
         Try to guess and set the preferred procol.
@@ -683,6 +783,52 @@ class DNSQueryTool:
         else:
             self.delay = self.STD_DELAY
 
+    def guess_and_set_concurrent_lookup(self) -> "DNSQueryTool":
+        """
+        Try to guess and set the concurrent lookup flag.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            if isinstance(PyFunceble.storage.CONFIGURATION.dns.concurrent_lookup, bool):
+                self.concurrent_lookup = (
+                    PyFunceble.storage.CONFIGURATION.dns.concurrent_lookup
+                )
+            else:
+                self.concurrent_lookup = self.STD_CONCURRENT_LOOKUP
+        else:
+            self.concurrent_lookup = self.STD_CONCURRENT_LOOKUP
+
+        return self
+
+    def guess_and_set_answer_cache(self) -> "DNSQueryTool":
+        """
+        Try to guess and set the cache of DNS answers to use.
+        """
+
+        if (
+            PyFunceble.facility.ConfigLoader.is_already_loaded()
+            and PyFunceble.storage.CONFIGURATION.dns.cache
+        ):
+            if DNSQueryTool.shared_answer_cache is None:
+                if PyFunceble.storage.CONFIGURATION.dns.shared_cache:
+                    shared_file = os.path.join(
+                        PyFunceble.storage.CONFIG_DIRECTORY,
+                        PyFunceble.storage.DNS_CACHE_FILENAME,
+                    )
+                else:
+                    shared_file = None
+
+                DNSQueryTool.shared_answer_cache = DNSAnswerCache(
+                    max_size=PyFunceble.storage.CONFIGURATION.dns.cache_size or None,
+                    shared_file=shared_file,
+                )
+
+            self.answer_cache = DNSQueryTool.shared_answer_cache
+        else:
+            self.answer_cache = None
+
+        return self
+
     def guess_all_settings(
         self,
     ) -> "DNSQueryTool":  # pragma: no cover ## Method themselves are more important
@@ -728,10 +874,26 @@ class DNSQueryTool:
         if rrset:
             result.extend([x.to_text() for x in rrset])
 
+            self._update_answer_ttl(rrset.ttl)
+        else:
+            for authority in response.authority:
+                if authority.rdtype == dns.rdatatype.RdataType.SOA and authority:
+                    # Negative caching (RFC 2308).
+                    self._update_answer_ttl(min(authority.ttl, authority[0].minimum))
+                    break
+
         PyFunceble.facility.Logger.debug("Result from response:\r%r", result)
 
         return result
 
+    def _update_answer_ttl(self, ttl: int) -> None:
+        """
+        Keeps the lowest TTL we got for the current query.
+        """
+
+        if self._answer_ttl is None or ttl < self._answer_ttl:
+            self._answer_ttl = ttl
+
     def _mix_order(
         self, data: Union[dict, List[str]]
     ) -> Union[dict, List[str]]:  # pragma: no cover ## Just a shuffle :-)
@@ -1050,4 +1212,90 @@ class DNSQueryTool:
         Process the query based on the preferred protocol.
         """
 
-        return getattr(self, self.preferred_protocol.lower())()
+        if self.answer_cache is None or not self.subject or not self.query_message:
+            return getattr(self, self.preferred_protocol.lower())()
+
+        cache_key = (
+            self.dns_name,
+            self.get_human_query_record_type(),
+            self.preferred_protocol,
+        )
+        result = self.answer_cache.get(cache_key)
+
+        if result is not None:
+            PyFunceble.facility.Logger.debug(
+                "Got answer of %r from cache: %r", cache_key, result
+            )
+
+            self.lookup_record.used_protocol = self.preferred_protocol
+            self.lookup_record.response = result
+
+            return result
+
+        self._answer_ttl = None
+
+        result = getattr(self, self.preferred_protocol.lower())()
+
+        if self._answer_ttl is not None and result is not None:
+            self.answer_cache.set(cache_key, result, self._answer_ttl)
+
+        return result
+
+    def query_first(self, record_types: List[str]) -> Dict[str, List[str]]:
+        """
+        Queries the given record types and provides the result of the first
+        one (in the given order) which gave us a positive answer.
+
+        When :code:`concurrent_lookup` is active, all record types are queried
+        at the same time. Otherwise, they are queried one after another until
+        a positive answer is given.
+
+        :param record_types:
+            The record types to query - ordered by priority.
+
+        :return:
+            A dict with the record type as index and the result as value or an
+            empty dict if none of the record type gave a positive answer.
+        """
+
+        if not self.concurrent_lookup or len(record_types) <= 1:
+            for record_type in record_types:
+                result = self.set_query_record_type(record_type).query()
+
+                if result:
+                    return {record_type: result}
+
+            return {}
+
+        def query_single(record_type: str) -> "DNSQueryTool":
+            query_tool = copy.copy(self)
+            query_tool.lookup_record = None
+
+            query_tool.set_query_record_type(record_type).query()
+
+            return query_tool
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(record_types))
+
+        try:
+            futures = [executor.submit(query_single, x) for x in record_types]
+
+            for record_type, future in zip(record_types, futures):
+                query_tool = future.result()
+
+                if query_tool.lookup_record.response:
+                    break
+        finally:
+            # We don't wait for the less important record types.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # We report the query we keep as if it was the last one we ran.
+        self.set_query_record_type(record_type)
+
+        for field in ("nameserver", "port", "used_protocol", "response"):
+            setattr(self.lookup_record, field, getattr(query_tool.lookup_record, field))
+
+        if query_tool.lookup_record.response:
+            return {record_type: query_tool.lookup_record.response}
+
+        return {}
@@ -58,6 +58,7 @@ import PyFunceble.facility
 import PyFunceble.factory
 import PyFunceble.storage
 from PyFunceble.converter.url2netloc import Url2Netloc
+from PyFunceble.query.requests.response_cache import ResponseCache
 
 
 class HTTPStatusCode:
@@ -76,6 +77,9 @@ class HTTPStatusCode:
     _allow_redirects: bool = False
     _url2netloc: Optional[Url2Netloc] = None
 
+    # When given, the response is read from (and shared through) this cache.
+    http_response_cache: Optional[ResponseCache] = None
+
     def __init__(
         self,
         subject: Optional[str] = None,
@@ -334,12 +338,20 @@ class HTTPStatusCode:
         """  # pylint: disable=line-too-long
 
         try:
-            req = PyFunceble.factory.Requester.get(
-                self.subject,
-                timeout=self.timeout,
-                verify=self.verify_certificate,
-                allow_redirects=True,
-            )
+            if self.http_response_cache is not None:
+                req = self.http_response_cache.get(
+                    self.subject,
+                    timeout=self.timeout,
+                    verify=self.verify_certificate,
+                    allow_redirects=True,
+                )
+            else:
+                req = PyFunceble.factory.Requester.get(
+                    self.subject,
+                    timeout=self.timeout,
+                    verify=self.verify_certificate,
+                    allow_redirects=True,
+                )
 
             first_origin = self._url2netloc.set_data_to_convert(
                 self.subject
@@ -58,6 +58,7 @@ import requests.models
 import PyFunceble.storage
 from PyFunceble.checker.syntax.ip import IPSyntaxChecker
 from PyFunceble.query.dns.query_tool import DNSQueryTool
+from PyFunceble.query.requests.resolving_cache import ResolvingCache
 
 
 class RequestAdapterBase(requests.adapters.HTTPAdapter):
@@ -66,7 +67,7 @@ class RequestAdapterBase(requests.adapters.HTTPAdapter):
     adapter.
     """
 
-    resolving_cache: dict = {}
+    resolving_cache: ResolvingCache = ResolvingCache()
     resolving_use_cache: bool = False
     timeout: float = 5.0
     proxy_pattern: dict = {}
@@ -198,13 +199,16 @@ class RequestAdapterBase(requests.adapters.HTTPAdapter):
 
     def resolve_with_cache(self, hostname: str) -> Optional[str]:
         """
-        Try to resolve using an internal cache.
+        Try to resolve using an internal (bounded and expiring) cache.
         """
 
-        if hostname not in self.resolving_cache:
-            self.resolving_cache[hostname] = self.resolve_without_cache(hostname)
+        try:
+            return self.resolving_cache[hostname]
+        except KeyError:
+            result = self.resolve_without_cache(hostname)
+            self.resolving_cache[hostname] = result
 
-        return self.resolving_cache[hostname]
+            return result
 
     def resolve_without_cache(self, hostname: str) -> Optional[str]:
         """
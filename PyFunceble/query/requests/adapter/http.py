@@ -64,6 +64,8 @@ class RequestHTTPAdapter(RequestAdapterBase):
     Provides our HTTP adapter.
     """
 
+    resolving_use_cache: bool = True
+
     # pylint: disable=arguments-differ
     def send(self, request, **kwargs) -> requests.Response:
         """
@@ -0,0 +1,322 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the cache of the hostnames resolved by our adapters.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ResolvingCache:
+    """
+    Provides a bounded (LRU) cache of resolved hostnames with a TTL based
+    eviction.
+
+    :param max_size:
+        The maximal number of hostnames to keep.
+    :param ttl:
+        The number of seconds a hostname is kept.
+    :param max_memory:
+        The maximal (approximate) number of bytes the cached entries may use.
+    """
+
+    STD_MAX_SIZE: int = 10000
+    STD_TTL: int = 300
+    STD_MAX_MEMORY: int = 16 * 1024 * 1024
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    _max_size: int = 10000
+    _ttl: int = 300
+    _max_memory: int = 16 * 1024 * 1024
+
+    _dataset: Optional[OrderedDict] = None
+    _memory: int = 0
+    _lock: Optional[threading.Lock] = None
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = None,
+        ttl: Optional[int] = None,
+        max_memory: Optional[int] = None,
+    ) -> None:
+        self._dataset = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.max_size = max_size if max_size is not None else self.STD_MAX_SIZE
+        self.ttl = ttl if ttl is not None else self.STD_TTL
+        self.max_memory = max_memory if max_memory is not None else self.STD_MAX_MEMORY
+
+    def __contains__(self, hostname: str) -> bool:
+        with self._lock:
+            return self.__get_entry(hostname) is not None
+
+    def __getitem__(self, hostname: str) -> Optional[str]:
+        with self._lock:
+            entry = self.__get_entry(hostname)
+
+            if entry is None:
+                self.misses += 1
+                raise KeyError(hostname)
+
+            self.hits += 1
+            self._dataset.move_to_end(hostname)
+
+            return entry[1]
+
+    def __setitem__(self, hostname: str, value: Optional[str]) -> None:
+        size = sys.getsizeof(hostname) + sys.getsizeof(value)
+
+        with self._lock:
+            if hostname in self._dataset:
+                self.__drop(hostname)
+
+            self._dataset[hostname] = (time.monotonic() + self.ttl, value, size)
+            self._memory += size
+
+            while self._dataset and (
+                len(self._dataset) > self.max_size or self._memory > self.max_memory
+            ):
+                self.__drop(next(iter(self._dataset)))
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._dataset)
+
+    def __getstate__(self) -> dict:
+        # Locks can't be pickled.
+        return {
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "max_memory": self.max_memory,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    def __get_entry(self, hostname: str) -> Optional[tuple]:
+        """
+        Provides the (non-expired) entry of the given hostname.
+        """
+
+        entry = self._dataset.get(hostname)
+
+        if entry is not None and entry[0] <= time.monotonic():
+            self.__drop(hostname)
+            self.evictions += 1
+
+            return None
+
+        return entry
+
+    def __drop(self, hostname: str) -> None:
+        """
+        Drops the given hostname.
+        """
+
+        self._memory -= self._dataset.pop(hostname)[2]
+
+    @property
+    def max_size(self) -> int:
+        """
+        Provides the current state of the :code:`_max_size` attribute.
+        """
+
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        """
+        Sets the maximal number of hostnames to keep.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError("<value> should be greater than zero.")
+
+        self._max_size = value
+
+    def set_max_size(self, value: int) -> "ResolvingCache":
+        """
+        Sets the maximal number of hostnames to keep.
+
+        :param value:
+            The value to set.
+        """
+
+        self.max_size = value
+
+        return self
+
+    @property
+    def ttl(self) -> int:
+        """
+        Provides the current state of the :code:`_ttl` attribute.
+        """
+
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: int) -> None:
+        """
+        Sets the number of seconds a hostname is kept.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError("<value> should be greater or equal to zero.")
+
+        self._ttl = value
+
+    def set_ttl(self, value: int) -> "ResolvingCache":
+        """
+        Sets the number of seconds a hostname is kept.
+
+        :param value:
+            The value to set.
+        """
+
+        self.ttl = value
+
+        return self
+
+    @property
+    def max_memory(self) -> int:
+        """
+        Provides the current state of the :code:`_max_memory` attribute.
+        """
+
+        return self._max_memory
+
+    @max_memory.setter
+    def max_memory(self, value: int) -> None:
+        """
+        Sets the maximal (approximate) number of bytes the cached entries may
+        use.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError("<value> should be greater than zero.")
+
+        self._max_memory = value
+
+    def set_max_memory(self, value: int) -> "ResolvingCache":
+        """
+        Sets the maximal (approximate) number of bytes the cached entries may
+        use.
+
+        :param value:
+            The value to set.
+        """
+
+        self.max_memory = value
+
+        return self
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Provides the statistics of the cache.
+        """
+
+        return {
+            "size": len(self._dataset),
+            "memory": self._memory,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> "ResolvingCache":
+        """
+        Clears the cache.
+        """
+
+        with self._lock:
+            self._dataset.clear()
+            self._memory = 0
+
+        return self
@@ -0,0 +1,306 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides our per-subject cache of HTTP responses.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+import requests.structures
+
+import PyFunceble.factory
+from PyFunceble.query.record.http_response import HTTPResponseRecord
+
+
+class ResponseCache:
+    """
+    Provides a cache of the HTTP responses of a single subject.
+
+    The idea is that every lookup or rule handler which needs the response of
+    a given URL, read it from here instead of sending its own request.
+
+    :param subject:
+        The subject the cached responses belong to.
+    :param max_body_size:
+        The maximal number of bytes of a body to keep (and read).
+    """
+
+    STD_MAX_BODY_SIZE: int = 2 * 1024 * 1024
+    STD_CHUNK_SIZE: int = 64 * 1024
+
+    hits: int = 0
+    misses: int = 0
+
+    _subject: Optional[str] = None
+    _max_body_size: int = 2 * 1024 * 1024
+
+    _dataset: Optional[
+        Dict[Tuple[str, bool], Union[HTTPResponseRecord, BaseException]]
+    ] = None
+
+    def __init__(
+        self, subject: Optional[str] = None, *, max_body_size: Optional[int] = None
+    ) -> None:
+        self._dataset = {}
+
+        if subject is not None:
+            self.subject = subject
+
+        self.max_body_size = (
+            max_body_size if max_body_size is not None else self.STD_MAX_BODY_SIZE
+        )
+
+    def __contains__(self, key: Tuple[str, bool]) -> bool:
+        return key in self._dataset
+
+    def __len__(self) -> int:
+        return len(self._dataset)
+
+    @property
+    def subject(self) -> Optional[str]:
+        """
+        Provides the current state of the :code:`_subject` attribute.
+        """
+
+        return self._subject
+
+    @subject.setter
+    def subject(self, value: str) -> None:
+        """
+        Sets the subject the cached responses belong to.
+
+        .. warning::
+            The cache is cleared when the subject changes.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`str`.
+        """
+
+        if not isinstance(value, str):
+            raise TypeError(f"<value> should be {str}, {type(value)} given.")
+
+        if value != self._subject:
+            self.clear()
+
+        self._subject = value
+
+    def set_subject(self, value: str) -> "ResponseCache":
+        """
+        Sets the subject the cached responses belong to.
+
+        :param value:
+            The value to set.
+        """
+
+        self.subject = value
+
+        return self
+
+    @property
+    def max_body_size(self) -> int:
+        """
+        Provides the current state of the :code:`_max_body_size` attribute.
+        """
+
+        return self._max_body_size
+
+    @max_body_size.setter
+    def max_body_size(self, value: int) -> None:
+        """
+        Sets the maximal number of bytes of a body to keep.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError("<value> should be greater or equal to zero.")
+
+        self._max_body_size = value
+
+    def set_max_body_size(self, value: int) -> "ResponseCache":
+        """
+        Sets the maximal number of bytes of a body to keep.
+
+        :param value:
+            The value to set.
+        """
+
+        self.max_body_size = value
+
+        return self
+
+    @staticmethod
+    def get_record_without_body(response: requests.Response) -> HTTPResponseRecord:
+        """
+        Provides the record of the given response - without its body.
+
+        :param response:
+            The response to convert.
+        """
+
+        return HTTPResponseRecord(
+            url=response.url,
+            status_code=response.status_code,
+            headers=requests.structures.CaseInsensitiveDict(response.headers),
+            cookies=dict(response.cookies),
+            history=[],
+        )
+
+    def get_body(self, response: requests.Response) -> str:
+        """
+        Reads (at most :code:`max_body_size` bytes of) the body of the given
+        (streamed) response.
+
+        :param response:
+            The response to read.
+        """
+
+        body = bytearray()
+
+        for chunk in response.iter_content(chunk_size=self.STD_CHUNK_SIZE):
+            body.extend(chunk)
+
+            if len(body) >= self.max_body_size:
+                break
+
+        return body[: self.max_body_size].decode(
+            response.encoding or "utf-8", errors="replace"
+        )
+
+    def get(
+        self, url: str, *, allow_redirects: bool = True, **kwargs
+    ) -> HTTPResponseRecord:
+        """
+        Provides the (cached) response of the given URL.
+
+        .. note::
+            When the request failed, the same exception is raised again each
+            time the response is asked for.
+
+        :param url:
+            The URL to query.
+        :param allow_redirects:
+            Whether we should follow the redirection - or not.
+        :param kwargs:
+            Any other arguments to give to the requester. They are not part of
+            the cache key.
+        """
+
+        key = (url, allow_redirects)
+
+        if key in self._dataset:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+            try:
+                self._dataset[key] = self.fetch(
+                    url, allow_redirects=allow_redirects, **kwargs
+                )
+            except Exception as exception:  # pylint: disable=broad-except
+                self._dataset[key] = exception
+
+        if isinstance(self._dataset[key], BaseException):
+            raise self._dataset[key]
+
+        return self._dataset[key]
+
+    def fetch(
+        self, url: str, *, allow_redirects: bool = True, **kwargs
+    ) -> HTTPResponseRecord:
+        """
+        Sends the request and provides the record of its response.
+
+        :param url:
+            The URL to query.
+        :param allow_redirects:
+            Whether we should follow the redirection - or not.
+        """
+
+        response = PyFunceble.factory.Requester.get(
+            url, allow_redirects=allow_redirects, stream=True, **kwargs
+        )
+
+        try:
+            result = self.get_record_without_body(response)
+            result.history = [self.get_record_without_body(x) for x in response.history]
+            result.text = self.get_body(response)
+        finally:
+            response.close()
+
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Provides the statistics of the cache.
+        """
+
+        return {"size": len(self._dataset), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> "ResponseCache":
+        """
+        Clears the cache.
+        """
+
+        self._dataset.clear()
+
+        return self
@@ -263,7 +263,7 @@ class ExpirationDateExtractor(ConverterBase):
         """
 
         for regex in self.PATTERNS:
-            expiration_date_line = RegexHelper(r"(?i)" + regex).match(
+            expiration_date_line = RegexHelper.compiled(r"(?i)" + regex).match(
                 self.data_to_convert, return_match=True, rematch=True, group=0
             )
 
@@ -281,7 +281,7 @@ class ExpirationDateExtractor(ConverterBase):
         """
 
         for index, date_regex in self.MARKER2DATE_REGEX.items():
-            matched = RegexHelper(date_regex).match(
+            matched = RegexHelper.compiled(date_regex).match(
                 extracted, return_match=True, rematch=True
             )
             date_parts = tuple()
@@ -318,7 +318,7 @@ class ExpirationDateExtractor(ConverterBase):
         if expiration_date_line:
             expiration_date = expiration_date_line[0].strip()
 
-            if RegexHelper(self.REGEX_DIGITS).match(
+            if RegexHelper.compiled(self.REGEX_DIGITS).match(
                 expiration_date, return_match=False
             ):
                 return self.__get_actual_expiration_date(expiration_date)
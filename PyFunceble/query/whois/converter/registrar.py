@@ -102,7 +102,7 @@ class RegistarExtractor(ConverterBase):
         """
 
         for regex in self.PATTERNS:
-            registrar_line = RegexHelper(r"(?i)" + regex).match(
+            registrar_line = RegexHelper.compiled(r"(?i)" + regex).match(
                 self.data_to_convert, return_match=True, rematch=True, group=0
             )
 
@@ -0,0 +1,565 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the rate limiter of our WHOIS queries.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+
+
+class _ServerState:  # pylint: disable=too-few-public-methods
+    """
+    Provides the state of the queries of a single WHOIS server.
+    """
+
+    __slots__ = (
+        "tokens",
+        "updated_at",
+        "blocked_until",
+        "failures",
+        "semaphore",
+        "metrics",
+    )
+
+    def __init__(self, tokens: float, max_concurrent_queries: int) -> None:
+        self.tokens = tokens
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.failures = 0
+
+        if max_concurrent_queries > 0:
+            self.semaphore = threading.BoundedSemaphore(max_concurrent_queries)
+        else:
+            self.semaphore = None
+
+        self.metrics = {
+            "queries": 0,
+            "successes": 0,
+            "empty_replies": 0,
+            "resets": 0,
+            "errors": 0,
+            "retries": 0,
+            "backoffs": 0,
+            "throttled_time": 0.0,
+        }
+
+
+class WhoisRateLimiter:
+    """
+    Provides the rate limits, the concurrency limits and the backoff to apply
+    to our queries. Each WHOIS server gets its own token bucket, concurrency
+    slots and backoff state.
+
+    :param rate_limit:
+        The number of queries per second allowed per server.
+        :code:`0` disables the rate limit.
+    :param burst:
+        The number of queries a server may receive at once - before the rate
+        limit kicks in.
+    :param max_concurrent_queries:
+        The maximal number of simultaneous queries per server.
+        :code:`0` disables the limit.
+    :param backoff:
+        The number of seconds to wait after the first failure of a server.
+        The delay is doubled for each consecutive failure.
+        :code:`0` disables the backoff.
+    :param max_backoff:
+        The maximal number of seconds to wait after a failure.
+
+    .. warning::
+        The limits are applied per process. When multiple testers are running,
+        each of them has its own limiter.
+    """
+
+    OUTCOME_SUCCESS: str = "success"
+    OUTCOME_EMPTY: str = "empty"
+    OUTCOME_RESET: str = "reset"
+    OUTCOME_ERROR: str = "error"
+
+    OUTCOME2METRIC: Dict[str, str] = {
+        OUTCOME_SUCCESS: "successes",
+        OUTCOME_EMPTY: "empty_replies",
+        OUTCOME_RESET: "resets",
+        OUTCOME_ERROR: "errors",
+    }
+
+    MAX_BACKOFF_EXPONENT: int = 32
+
+    STD_RATE_LIMIT: float = 1.0
+    STD_BURST: int = 5
+    STD_MAX_CONCURRENT_QUERIES: int = 2
+    STD_BACKOFF: float = 1.0
+    STD_MAX_BACKOFF: float = 60.0
+
+    _rate_limit: float = 1.0
+    _burst: int = 5
+    _max_concurrent_queries: int = 2
+    _backoff: float = 1.0
+    _max_backoff: float = 60.0
+
+    _servers: Optional[Dict[str, _ServerState]] = None
+    _lock: Optional[threading.Lock] = None
+
+    def __init__(
+        self,
+        *,
+        rate_limit: Optional[Union[float, int]] = None,
+        burst: Optional[int] = None,
+        max_concurrent_queries: Optional[int] = None,
+        backoff: Optional[Union[float, int]] = None,
+        max_backoff: Optional[Union[float, int]] = None,
+    ) -> None:
+        self._servers = {}
+        self._lock = threading.Lock()
+
+        self.rate_limit = rate_limit if rate_limit is not None else self.STD_RATE_LIMIT
+        self.burst = burst if burst is not None else self.STD_BURST
+        self.max_concurrent_queries = (
+            max_concurrent_queries
+            if max_concurrent_queries is not None
+            else self.STD_MAX_CONCURRENT_QUERIES
+        )
+        self.backoff = backoff if backoff is not None else self.STD_BACKOFF
+        self.max_backoff = (
+            max_backoff if max_backoff is not None else self.STD_MAX_BACKOFF
+        )
+
+    def __contains__(self, server: str) -> bool:
+        return server in self._servers
+
+    def __len__(self) -> int:
+        return len(self._servers)
+
+    def __getstate__(self) -> dict:
+        # Locks and semaphores can't be pickled.
+        return {
+            "rate_limit": self.rate_limit,
+            "burst": self.burst,
+            "max_concurrent_queries": self.max_concurrent_queries,
+            "backoff": self.backoff,
+            "max_backoff": self.max_backoff,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    @staticmethod
+    def _ensure_positive_number(value: Union[float, int]) -> float:
+        """
+        Ensures that the given value is a positive number.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int` nor
+            :py:class:`float`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int} or {float}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError("<value> should be greater or equal to zero.")
+
+        return float(value)
+
+    @property
+    def rate_limit(self) -> float:
+        """
+        Provides the current state of the :code:`_rate_limit` attribute.
+        """
+
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, value: Union[float, int]) -> None:
+        """
+        Sets the number of queries per second allowed per server.
+
+        :param value:
+            The value to set. :code:`0` disables the rate limit.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int` nor
+            :py:class:`float`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        self._rate_limit = self._ensure_positive_number(value)
+
+    def set_rate_limit(self, value: Union[float, int]) -> "WhoisRateLimiter":
+        """
+        Sets the number of queries per second allowed per server.
+
+        :param value:
+            The value to set.
+        """
+
+        self.rate_limit = value
+
+        return self
+
+    @property
+    def burst(self) -> int:
+        """
+        Provides the current state of the :code:`_burst` attribute.
+        """
+
+        return self._burst
+
+    @burst.setter
+    def burst(self, value: int) -> None:
+        """
+        Sets the number of queries a server may receive at once.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError("<value> should be greater than zero.")
+
+        self._burst = value
+
+    def set_burst(self, value: int) -> "WhoisRateLimiter":
+        """
+        Sets the number of queries a server may receive at once.
+
+        :param value:
+            The value to set.
+        """
+
+        self.burst = value
+
+        return self
+
+    @property
+    def max_concurrent_queries(self) -> int:
+        """
+        Provides the current state of the :code:`_max_concurrent_queries`
+        attribute.
+        """
+
+        return self._max_concurrent_queries
+
+    @max_concurrent_queries.setter
+    def max_concurrent_queries(self, value: int) -> None:
+        """
+        Sets the maximal number of simultaneous queries per server.
+
+        :param value:
+            The value to set. :code:`0` disables the limit.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+
+        .. note::
+            The new value only applies to the servers we did not query yet.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError("<value> should be greater or equal to zero.")
+
+        self._max_concurrent_queries = value
+
+    def set_max_concurrent_queries(self, value: int) -> "WhoisRateLimiter":
+        """
+        Sets the maximal number of simultaneous queries per server.
+
+        :param value:
+            The value to set.
+        """
+
+        self.max_concurrent_queries = value
+
+        return self
+
+    @property
+    def backoff(self) -> float:
+        """
+        Provides the current state of the :code:`_backoff` attribute.
+        """
+
+        return self._backoff
+
+    @backoff.setter
+    def backoff(self, value: Union[float, int]) -> None:
+        """
+        Sets the number of seconds to wait after the first failure of a server.
+
+        :param value:
+            The value to set. :code:`0` disables the backoff.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int` nor
+            :py:class:`float`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        self._backoff = self._ensure_positive_number(value)
+
+    def set_backoff(self, value: Union[float, int]) -> "WhoisRateLimiter":
+        """
+        Sets the number of seconds to wait after the first failure of a server.
+
+        :param value:
+            The value to set.
+        """
+
+        self.backoff = value
+
+        return self
+
+    @property
+    def max_backoff(self) -> float:
+        """
+        Provides the current state of the :code:`_max_backoff` attribute.
+        """
+
+        return self._max_backoff
+
+    @max_backoff.setter
+    def max_backoff(self, value: Union[float, int]) -> None:
+        """
+        Sets the maximal number of seconds to wait after a failure.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int` nor
+            :py:class:`float`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        self._max_backoff = self._ensure_positive_number(value)
+
+    def set_max_backoff(self, value: Union[float, int]) -> "WhoisRateLimiter":
+        """
+        Sets the maximal number of seconds to wait after a failure.
+
+        :param value:
+            The value to set.
+        """
+
+        self.max_backoff = value
+
+        return self
+
+    def __get_state(self, server: str) -> _ServerState:
+        """
+        Provides the state of the given server. The caller must hold the lock.
+        """
+
+        try:
+            return self._servers[server]
+        except KeyError:
+            self._servers[server] = _ServerState(
+                float(self.burst), self.max_concurrent_queries
+            )
+
+            return self._servers[server]
+
+    def __get_delay(self, state: _ServerState) -> float:
+        """
+        Consumes a token of the given server or provides the number of seconds
+        to wait before it is available. The caller must hold the lock.
+        """
+
+        now = time.monotonic()
+
+        if state.blocked_until > now:
+            return state.blocked_until - now
+
+        if not self.rate_limit:
+            return 0.0
+
+        if now > state.updated_at:
+            state.tokens = min(
+                float(self.burst),
+                state.tokens + (now - state.updated_at) * self.rate_limit,
+            )
+            state.updated_at = now
+
+        if state.tokens >= 1.0:
+            state.tokens -= 1.0
+            return 0.0
+
+        return (1.0 - state.tokens) / self.rate_limit
+
+    def acquire(self, server: str, *, retry: bool = False) -> float:
+        """
+        Waits until we are allowed to query the given server.
+
+        Every call must be followed by a call to :meth:`release`.
+
+        :param server:
+            The server we want to query.
+        :param retry:
+            Whether the query is a retry of a failed one.
+
+        :return:
+            The number of seconds we waited.
+        """
+
+        with self._lock:
+            state = self.__get_state(server)
+
+        started_at = time.monotonic()
+
+        if state.semaphore is not None:
+            state.semaphore.acquire()  # pylint: disable=consider-using-with
+
+        while True:
+            with self._lock:
+                delay = self.__get_delay(state)
+
+                if not delay:
+                    waited = time.monotonic() - started_at
+
+                    state.metrics["queries"] += 1
+                    state.metrics["throttled_time"] += waited
+
+                    if retry:
+                        state.metrics["retries"] += 1
+
+                    return waited
+
+            time.sleep(delay)
+
+    def release(self, server: str, outcome: str) -> "WhoisRateLimiter":
+        """
+        Releases the query slot of the given server and takes the outcome of
+        the query into consideration.
+
+        Any outcome other than :code:`success` makes the server unavailable for
+        an exponentially increasing amount of time.
+
+        :param server:
+            The server we queried.
+        :param outcome:
+            The outcome of the query.
+
+        :raise ValueError:
+            When the given :code:`outcome` is unknown.
+        """
+
+        with self._lock:
+            state = self.__get_state(server)
+
+        try:
+            if outcome not in self.OUTCOME2METRIC:
+                raise ValueError(f"<outcome> ({outcome!r}) is unknown.")
+
+            with self._lock:
+                state.metrics[self.OUTCOME2METRIC[outcome]] += 1
+
+                if outcome == self.OUTCOME_SUCCESS:
+                    state.failures = 0
+                else:
+                    state.failures += 1
+
+                    if self.backoff:
+                        # The exponent is capped, 2 ** 1024 can't be converted
+                        # into a float.
+                        blocked_until = time.monotonic() + min(
+                            self.max_backoff,
+                            self.backoff
+                            * 2 ** min(state.failures - 1, self.MAX_BACKOFF_EXPONENT),
+                        )
+
+                        state.blocked_until = max(state.blocked_until, blocked_until)
+
+                        # No burst once the server is available again.
+                        state.tokens = 0.0
+                        state.updated_at = state.blocked_until
+                        state.metrics["backoffs"] += 1
+        finally:
+            if state.semaphore is not None:
+                state.semaphore.release()
+
+        return self
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Provides the metrics of each server.
+        """
+
+        with self._lock:
+            return {
+                server: dict(state.metrics) for server, state in self._servers.items()
+            }
+
+    def clear(self) -> "WhoisRateLimiter":
+        """
+        Forgets the state and the metrics of all servers.
+        """
+
+        with self._lock:
+            self._servers.clear()
+
+        return self
@@ -52,12 +52,15 @@ License:
 
 import functools
 import socket
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
+import PyFunceble.facility
+import PyFunceble.storage
 from PyFunceble.dataset.iana import IanaDataset
 from PyFunceble.query.record.whois import WhoisQueryToolRecord
 from PyFunceble.query.whois.converter.expiration_date import ExpirationDateExtractor
 from PyFunceble.query.whois.converter.registrar import RegistarExtractor
+from PyFunceble.query.whois.limiter import WhoisRateLimiter
 
 # pylint: disable=protected-access
 
@@ -69,6 +72,7 @@ class WhoisQueryTool:
 
     BUFFER_SIZE: int = 4096
     STD_PORT: int = 43
+    STD_MAX_RETRIES: int = 0
 
     expiration_date_extractor: Optional[ExpirationDateExtractor] = None
     registrar_extractor: Optional[RegistarExtractor] = None
@@ -80,15 +84,24 @@ class WhoisQueryTool:
     _expiration_date: Optional[str] = None
     _record: Optional[str] = None
     _registrar: Optional[str] = None
+    _max_retries: int = 0
+    _rate_limiter: Optional[WhoisRateLimiter] = None
 
     lookup_record: Optional[WhoisQueryToolRecord] = None
 
+    shared_rate_limiter: Optional[WhoisRateLimiter] = None
+    """
+    The rate limiter shared by all query tools of the current process.
+    """
+
     def __init__(
         self,
         subject: Optional[str] = None,
         *,
         server: Optional[str] = None,
         query_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        rate_limiter: Optional[WhoisRateLimiter] = None,
     ) -> None:
         self.registrar_extractor = RegistarExtractor()
         self.expiration_date_extractor = ExpirationDateExtractor()
@@ -103,6 +116,16 @@ class WhoisQueryTool:
         if query_timeout is not None:
             self.set_query_timeout(query_timeout)
 
+        if max_retries is not None:
+            self.max_retries = max_retries
+        else:
+            self.guess_and_set_max_retries()
+
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        else:
+            self.guess_and_set_rate_limiter()
+
     def ensure_subject_is_given(func):  # pylint: disable=no-self-argument
         """
         Ensures that the subject is given before running the decorated method.
@@ -313,6 +336,125 @@ class WhoisQueryTool:
 
         return self
 
+    @property
+    def max_retries(self) -> int:
+        """
+        Provides the current state of the :code:`_max_retries` attribute.
+        """
+
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, value: int) -> None:
+        """
+        Sets the number of times we retry a query which got an empty reply or
+        a reset connection.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError("<value> should be greater or equal to zero.")
+
+        self._max_retries = value
+
+    def set_max_retries(self, value: int) -> "WhoisQueryTool":
+        """
+        Sets the number of times we retry a query which got an empty reply or
+        a reset connection.
+
+        :param value:
+            The value to set.
+        """
+
+        self.max_retries = value
+
+        return self
+
+    @property
+    def rate_limiter(self) -> Optional[WhoisRateLimiter]:
+        """
+        Provides the current state of the :code:`_rate_limiter` attribute.
+        """
+
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: Optional[WhoisRateLimiter]) -> None:
+        """
+        Sets the rate limiter to go through before querying a server.
+
+        :param value:
+            The value to set. :code:`None` disables the rate limiter.
+
+        :raise TypeError:
+            When the given :code:`value` is not a
+            :py:class:`~PyFunceble.query.whois.limiter.WhoisRateLimiter`.
+        """
+
+        if value is not None and not isinstance(value, WhoisRateLimiter):
+            raise TypeError(
+                f"<value> should be {WhoisRateLimiter}, {type(value)} given."
+            )
+
+        self._rate_limiter = value
+
+    def set_rate_limiter(self, value: Optional[WhoisRateLimiter]) -> "WhoisQueryTool":
+        """
+        Sets the rate limiter to go through before querying a server.
+
+        :param value:
+            The value to set.
+        """
+
+        self.rate_limiter = value
+
+        return self
+
+    def guess_and_set_max_retries(self) -> "WhoisQueryTool":
+        """
+        Try to guess and set the number of times we retry a query.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            self.max_retries = PyFunceble.storage.CONFIGURATION.whois.max_retries
+        else:
+            self.max_retries = self.STD_MAX_RETRIES
+
+        return self
+
+    def guess_and_set_rate_limiter(self) -> "WhoisQueryTool":
+        """
+        Try to guess and set the rate limiter to use.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            if WhoisQueryTool.shared_rate_limiter is None:
+                WhoisQueryTool.shared_rate_limiter = WhoisRateLimiter(
+                    rate_limit=PyFunceble.storage.CONFIGURATION.whois.rate_limit,
+                    burst=PyFunceble.storage.CONFIGURATION.whois.burst,
+                    max_concurrent_queries=(
+                        PyFunceble.storage.CONFIGURATION.whois.max_concurrent_queries
+                    ),
+                    backoff=PyFunceble.storage.CONFIGURATION.whois.backoff,
+                    max_backoff=PyFunceble.storage.CONFIGURATION.whois.max_backoff,
+                )
+
+            self.rate_limiter = WhoisQueryTool.shared_rate_limiter
+        else:
+            self.rate_limiter = None
+
+        return self
+
     @property
     @query_record
     @update_lookup_record
@@ -399,28 +541,35 @@ class WhoisQueryTool:
                 self.lookup_record.server = whois_server
                 self.lookup_record.query_timeout = self.query_timeout
 
-                req = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                req.settimeout(self.query_timeout)
-
-                try:
-                    req.connect((whois_server, self.STD_PORT))
-                    req.send(f"{self.subject}\r\n".encode())
-
-                    response = "".encode()
-
-                    while True:
-                        try:
-                            data = req.recv(self.BUFFER_SIZE)
-                        except (ConnectionResetError, socket.timeout):
-                            break
-
-                        response += data
+                response = b""
 
-                        if not data:
-                            break
+                for attempt in range(self.max_retries + 1):
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.acquire(whois_server, retry=attempt > 0)
 
-                    req.close()
+                    outcome = WhoisRateLimiter.OUTCOME_ERROR
 
+                    try:
+                        response, outcome = self._query_server(whois_server)
+                    finally:
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.release(whois_server, outcome)
+
+                    if outcome not in (
+                        WhoisRateLimiter.OUTCOME_EMPTY,
+                        WhoisRateLimiter.OUTCOME_RESET,
+                    ):
+                        break
+
+                    PyFunceble.facility.Logger.debug(
+                        "Got %r from %r while querying %r (attempt %d).",
+                        outcome,
+                        whois_server,
+                        self.subject,
+                        attempt + 1,
+                    )
+
+                if response:
                     try:
                         self.lookup_record.record = self._record = response.decode()
                     except UnicodeDecodeError:
@@ -430,8 +579,6 @@ class WhoisQueryTool:
                         self.lookup_record.record = self._record = response.decode(
                             "utf-8", "replace"
                         )
-                except socket.error:
-                    pass
 
             if self.lookup_record.record is None or not self.lookup_record.record:
                 self.lookup_record.record = self._record = ""
@@ -443,6 +590,57 @@ class WhoisQueryTool:
 
         return self.lookup_record.record
 
+    def _query_server(
+        self, server: str
+    ) -> Tuple[bytes, str]:  # pragma: no cover ## Needs a WHOIS server.
+        """
+        Sends the current subject to the given server and reads its reply.
+
+        :param server:
+            The server to query.
+
+        :return:
+            The reply and the outcome of the query.
+        """
+
+        chunks = []
+        reset = False
+
+        req = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        req.settimeout(self.query_timeout)
+
+        try:
+            req.connect((server, self.STD_PORT))
+            req.sendall(f"{self.subject}\r\n".encode())
+
+            while True:
+                try:
+                    data = req.recv(self.BUFFER_SIZE)
+                except ConnectionResetError:
+                    reset = True
+                    break
+                except socket.timeout:
+                    break
+
+                if not data:
+                    break
+
+                chunks.append(data)
+        except socket.error:
+            return b"", WhoisRateLimiter.OUTCOME_ERROR
+        finally:
+            req.close()
+
+        response = b"".join(chunks)
+
+        if response:
+            return response, WhoisRateLimiter.OUTCOME_SUCCESS
+
+        if reset:
+            return response, WhoisRateLimiter.OUTCOME_RESET
+
+        return response, WhoisRateLimiter.OUTCOME_EMPTY
+
     @query_record
     def get_record(
         self,
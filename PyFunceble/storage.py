@@ -67,6 +67,7 @@ DISTRIBUTED_CONFIGURATION_FILENAME: str = ".PyFunceble_production.yaml"
 
 CONFIGURATION_FILENAME: str = ".PyFunceble.yaml"
 ENV_FILENAME: str = ".pyfunceble-env"
+DNS_CACHE_FILENAME: str = "dns_cache.sqlite3"
 
 # pylint: disable=line-too-long
 
@@ -78,6 +79,7 @@ NOT_RESOLVED_STD_HOSTNAME: str = f"{secrets.token_hex(12)}.mock-resolver.pyfunce
 IANA: Optional[dict] = {}
 PUBLIC_SUFFIX: Optional[dict] = {}
 USER_AGENTS: Optional[dict] = {}
+IPV4_REPUTATION: Optional[dict] = {}
 
 load_dotenv(".env")
 load_dotenv(ENV_FILENAME)
@@ -0,0 +1,159 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides some utilities related to __slots__.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import dataclasses
+import functools
+import operator
+from typing import Any, Callable, Tuple, Type, TypeVar
+
+ClassT = TypeVar("ClassT")
+
+
+@functools.lru_cache(maxsize=None)
+def get_field_names(cls: type) -> Tuple[str, ...]:
+    """
+    Provides the (ordered) names of the fields of the given dataclass.
+
+    :param cls:
+        The dataclass to work with.
+    """
+
+    return tuple(x.name for x in dataclasses.fields(cls))
+
+
+@functools.lru_cache(maxsize=None)
+def get_fields_getter(cls: type) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Provides a function which provides the values of the fields of an
+    instance of the given dataclass - as a tuple ordered as the fields.
+
+    :param cls:
+        The dataclass to work with.
+    """
+
+    field_names = get_field_names(cls)
+
+    if len(field_names) == 1:
+        getter = operator.attrgetter(field_names[0])
+
+        return lambda x: (getter(x),)
+
+    return operator.attrgetter(*field_names)
+
+
+@functools.lru_cache(maxsize=None)
+def get_slots_setters(cls: type) -> Tuple[Callable[[Any, Any], None], ...]:
+    """
+    Provides the setters of the slots of the fields of the given (slotted)
+    dataclass - ordered as the fields.
+
+    :param cls:
+        The dataclass to work with.
+    """
+
+    result = []
+
+    for name in get_field_names(cls):
+        descriptor = next(x.__dict__[name] for x in cls.__mro__ if name in x.__dict__)
+        result.append(descriptor.__set__)
+
+    return tuple(result)
+
+
+def add_slots(cls: Type[ClassT]) -> Type[ClassT]:
+    """
+    Provides a copy of the given dataclass which stores its fields into
+    :code:`__slots__` instead of a per-instance :code:`__dict__`.
+
+    .. note::
+        This is what :code:`dataclasses.dataclass(slots=True)` does since
+        Python 3.10. We can't rely on it as we still support Python 3.9.
+
+    .. warning::
+        The zero-argument form of :code:`super()` can't be used in the methods
+        of the given class.
+
+    :param cls:
+        The dataclass to work with. The slots it may already declare are kept.
+    """
+
+    inherited_slots = set()
+
+    for base in cls.__mro__[1:]:
+        base_slots = base.__dict__.get("__slots__", ())
+
+        if isinstance(base_slots, str):
+            base_slots = (base_slots,)
+
+        inherited_slots.update(base_slots)
+
+    own_slots = cls.__dict__.get("__slots__", ())
+
+    if isinstance(own_slots, str):
+        own_slots = (own_slots,)
+
+    slots = tuple(own_slots) + tuple(
+        x
+        for x in get_field_names(cls)
+        if x not in inherited_slots and x not in own_slots
+    )
+
+    cls_dict = dict(cls.__dict__)
+
+    for name in slots:
+        cls_dict.pop(name, None)
+
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = slots
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
@@ -0,0 +1,122 @@
+"""
+This is a benchmark which compares the throughput (messages/sec) of the
+queues provided by our process managers.
+
+Note:
+* "manager" is the historical transport: a queue proxy which goes through
+    the server process of a `multiprocessing.Manager` for each message.
+* "direct" is the transport activated through `cli_testing.direct_queues`:
+    a `multiprocessing.Queue` which goes through a pipe.
+
+Usage:
+    python examples/benchmarks/queue_transport.py [messages] [consumers]
+"""
+
+import multiprocessing
+import sys
+import time
+
+from PyFunceble.cli.processes.base import ProcessesManagerBase
+
+DATASET = {
+    "type": "file",
+    "subject_type": "domain",
+    "destination": "hello.list",
+    "source": "hello.list",
+    "output_dir": "output/hello.list",
+    "checker_type": "AVAILABILITY",
+    "session_id": None,
+    "subject": "example.org",
+    "idna_subject": "example.org",
+}
+
+
+def consume(input_queue, output_queue):
+    """
+    Consumes the given input queue until a stop message is found.
+
+    Argument:
+        - input_queue: queue.Queue
+            The queue to read.
+        - output_queue: queue.Queue
+            The queue to write the number of consumed messages into.
+    """
+
+    consumed = 0
+
+    while True:
+        _, _, data = input_queue.get()
+
+        if data == "stop":
+            break
+
+        consumed += 1
+
+    output_queue.put(consumed)
+
+
+def benchmark(direct_queue, messages, consumers):
+    """
+    Sends the given number of messages through a queue which is read by the
+    given number of consumers.
+
+    Argument:
+        - direct_queue: bool
+            Whether we use the direct queues.
+        - messages: int
+            The number of messages to send.
+        - consumers: int
+            The number of consumers (processes) to start.
+
+    Returns: float
+        The number of messages per second.
+    """
+
+    manager = ProcessesManagerBase(
+        direct_queue=direct_queue, generate_output_queue=False
+    )
+    result_queue = manager.create_queue()
+
+    processes = [
+        multiprocessing.Process(
+            target=consume, args=(manager.input_queue, result_queue)
+        )
+        for _ in range(consumers)
+    ]
+
+    for process in processes:
+        process.start()
+
+    start_time = time.perf_counter()
+
+    for _ in range(messages):
+        manager.input_queue.put(("main", None, DATASET))
+
+    for _ in processes:
+        manager.input_queue.put(("main", None, "stop"))
+
+    consumed = sum(result_queue.get() for _ in processes)
+
+    elapsed = time.perf_counter() - start_time
+
+    for process in processes:
+        process.join()
+
+    if manager.manager is not None:
+        manager.manager.shutdown()
+
+    assert consumed == messages
+
+    return messages / elapsed
+
+
+if __name__ == "__main__":
+    MESSAGES = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    CONSUMERS = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    print(f"Sending {MESSAGES} messages to {CONSUMERS} consumers.")
+
+    for name, direct in (("manager", False), ("direct", True)):
+        print(
+            f"{name:>8}: {benchmark(direct, MESSAGES, CONSUMERS):>12.0f} messages/sec"
+        )
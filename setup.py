@@ -146,6 +146,7 @@ def get_requirements(*, mode="standard"):
         "postgresql": ["requirements.txt"],
         "psql-binary": ["requirements.txt"],
         "postgresql-binary": ["requirements.txt"],
+        "arrow": ["requirements.txt"],
     }
 
     ignored_modes_for_all = [
@@ -199,6 +200,9 @@ def get_requirements(*, mode="standard"):
     elif mode in ("psql-binary", "postgresql-binary", "all"):
         result.add("psycopg2-binary")
 
+    if mode in ("arrow", "all", "full"):
+        result.add("pyarrow")
+
     return list(result)
 
 
@@ -281,6 +285,7 @@ if __name__ == "__main__":
             "psql-binary": get_requirements(mode="psql-binary"),
             "postgresql": get_requirements(mode="postgresql"),
             "postgresql-binary": get_requirements(mode="postgresql-binary"),
+            "arrow": get_requirements(mode="arrow"),
             "full": get_requirements(mode="full"),
             "all": get_requirements(mode="all"),
         },
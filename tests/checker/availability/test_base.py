@@ -60,6 +60,8 @@ from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
 from PyFunceble.checker.base import CheckerBase
 from PyFunceble.config.loader import ConfigLoader
 from PyFunceble.query.dns.query_tool import DNSQueryTool
+from PyFunceble.query.record.http_response import HTTPResponseRecord
+from PyFunceble.query.requests.response_cache import ResponseCache
 from PyFunceble.query.whois.query_tool import WhoisQueryTool
 
 
@@ -1069,6 +1071,39 @@ class TestAvailabilityCheckerBase(unittest.TestCase):
 
         self.assertEqual(expected_source, actual_source)
 
+    def test_try_to_query_status_from_dns_timings(self) -> None:
+        """
+        Tests that the time spent by the DNS lookup is recorded into the
+        status.
+        """
+
+        self.checker.subject = "example.org"
+        self.checker.query_dns_record = lambda: {"NS": ["ns1.example.org"]}
+
+        self.checker.try_to_query_status_from_dns()
+
+        expected = ["dns"]
+        actual = list(self.checker.status.timings)
+
+        self.assertEqual(expected, actual)
+
+        first_timing = self.checker.status.timings["dns"]
+
+        self.assertGreater(first_timing, 0)
+
+        # Let's check that a second lookup is summed.
+        self.checker.try_to_query_status_from_dns()
+
+        self.assertGreater(self.checker.status.timings["dns"], first_timing)
+
+        # Let's check that a new subject resets the timings.
+        self.checker.subject = "example.net"
+
+        expected = {}
+        actual = self.checker.status.timings
+
+        self.assertEqual(expected, actual)
+
     def test_try_to_query_status_from_netinfo(self) -> None:
         """
         Tests the method that tries to define the status from the NETINFO
@@ -1377,6 +1412,36 @@ class TestAvailabilityCheckerBase(unittest.TestCase):
 
         self.assertIsInstance(actual, AvailabilityCheckerStatus)
 
+    @unittest.mock.patch.object(ResponseCache, "fetch")
+    def test_query_status_clears_http_response_cache(
+        self, fetch_patch: unittest.mock.MagicMock
+    ) -> None:
+        """
+        Tests that the cache of the HTTP responses is cleared each time we
+        query the status - even when the subject is the same.
+        """
+
+        fetch_patch.return_value = HTTPResponseRecord(
+            url="http://example.org:80", status_code=200
+        )
+
+        self.checker.subject = "example.org"
+        self.checker.http_response_cache.get("http://example.org:80")
+
+        self.assertEqual(1, len(self.checker.http_response_cache))
+
+        # Same subject: the setter keeps the cache.
+        self.checker.subject = "example.org"
+
+        self.assertEqual(1, len(self.checker.http_response_cache))
+
+        self.assertRaises(NotImplementedError, self.checker.query_status)
+
+        expected = 0
+        actual = len(self.checker.http_response_cache)
+
+        self.assertEqual(expected, actual)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -50,9 +50,11 @@ License:
     limitations under the License.
 """
 
+import pickle
 import unittest
 from datetime import datetime, timezone
 
+from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
 from PyFunceble.checker.status_base import CheckerStatusBase
 
 try:
@@ -136,6 +138,114 @@ class TestCheckerStatusBase(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_to_dict_cached(self) -> None:
+        """
+        Tests that the :py:class:`dict` representation is cached until an
+        attribute is set.
+        """
+
+        self.status.status = "ACTIVE"
+
+        first = self.status.to_dict()
+        first["ip"] = "0.0.0.0"
+
+        expected = "ACTIVE"
+        actual = self.status.to_dict()["status"]
+
+        self.assertEqual(expected, actual)
+        self.assertNotIn("ip", self.status.to_dict())
+
+        self.status.status = "INACTIVE"
+
+        expected = "INACTIVE"
+        actual = self.status.to_dict()["status"]
+
+        self.assertEqual(expected, actual)
+
+    def test_no_dict(self) -> None:
+        """
+        Tests that the fields are stored into slots.
+        """
+
+        self.assertFalse(hasattr(self.status, "__dict__"))
+
+        def set_unknown():
+            self.status.hello = "world"
+
+        self.assertRaises(AttributeError, set_unknown)
+
+    def test_to_tuple_from_tuple(self) -> None:
+        """
+        Tests the packing and unpacking of a status into a tuple.
+        """
+
+        test_datetime = datetime.now(timezone.utc)
+
+        self.status.status = "ACTIVE"
+        self.status.tested_at = test_datetime
+
+        packed = self.status.to_tuple()
+
+        expected = int(test_datetime.timestamp() * 1_000_000)
+        actual = packed[6]
+
+        self.assertAlmostEqual(expected, actual, delta=1)
+
+        expected = self.status
+        actual = CheckerStatusBase.from_tuple(CheckerStatusBase.SCHEMA_VERSION, packed)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(test_datetime, actual.tested_at)
+
+    def test_from_tuple_wrong_schema_version(self) -> None:
+        """
+        Tests the unpacking of a status for the case that the given schema
+        version is not the current one.
+        """
+
+        packed = self.status.to_tuple()
+
+        self.assertRaises(
+            ValueError,
+            lambda: CheckerStatusBase.from_tuple(
+                CheckerStatusBase.SCHEMA_VERSION + 1, packed
+            ),
+        )
+
+    def test_from_tuple_wrong_length(self) -> None:
+        """
+        Tests the unpacking of a status for the case that the number of given
+        values does not match the fields.
+        """
+
+        packed = self.status.to_tuple()
+
+        self.assertRaises(
+            ValueError,
+            lambda: CheckerStatusBase.from_tuple(
+                CheckerStatusBase.SCHEMA_VERSION, packed[:-1]
+            ),
+        )
+
+    def test_pickle(self) -> None:
+        """
+        Tests that a status survives a pickle round-trip.
+        """
+
+        status = AvailabilityCheckerStatus(
+            subject="example.org",
+            idna_subject="example.org",
+            status="ACTIVE",
+            tested_at=datetime.now(timezone.utc),
+        )
+        status.dns_lookup = {"A": ["192.0.2.1"]}
+        status.timings = {"dns": 0.1}
+
+        expected = status.to_dict()
+        actual = pickle.loads(pickle.dumps(status)).to_dict()
+
+        self.assertEqual(expected, actual)
+
 
 if __name__ == "__main__":
     unittest.main()
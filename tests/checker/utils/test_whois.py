@@ -150,6 +150,27 @@ class TestCheckerWhoisUtils(unittest.TestCase):
 
         self.assertIsInstance(actual, expected)
 
+    def test_get_whois_dataset_obj_batched(self) -> None:
+        """
+        Tests of the function which let us get a new WHOIS dataset object.
+
+        In this case, we check that the writes are only batched when asked.
+        """
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"db_type": "mysql", "db_batch_size": 10}}
+        ).start()
+
+        expected = 0
+        actual = whois.get_whois_dataset_object().batch_size
+
+        self.assertEqual(expected, actual)
+
+        expected = 10
+        actual = whois.get_whois_dataset_object(batched=True).batch_size
+
+        self.assertEqual(expected, actual)
+
     def test_get_whois_dataset_obj_unknown(self) -> None:
         """
         Tests of the function which let us get a new WHOIS dataset object.
@@ -0,0 +1,321 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our columnar results writer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import datetime
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+import PyFunceble.cli.storage
+import PyFunceble.storage
+from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
+from PyFunceble.cli.filesystem.columnar import ColumnarStatusWriter
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover ## Optional dependency
+    pyarrow = None
+
+
+class TestColumnarStatusWriter(unittest.TestCase):
+    """
+    Tests our columnar results writer.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.previous_output_directory = PyFunceble.cli.storage.OUTPUT_DIRECTORY
+        PyFunceble.cli.storage.OUTPUT_DIRECTORY = self.temp_dir.name
+
+        self.writer = ColumnarStatusWriter(
+            parent_dirname="hello.list", output_format="jsonl", batch_size=2
+        )
+        self.columnar_dir = os.path.join(
+            self.temp_dir.name,
+            "hello.list",
+            PyFunceble.cli.storage.OUTPUTS.columnar.directory,
+        )
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.writer.close()
+
+        PyFunceble.cli.storage.OUTPUT_DIRECTORY = self.previous_output_directory
+        self.temp_dir.cleanup()
+
+        del self.temp_dir
+        del self.writer
+
+    @staticmethod
+    def get_status(subject: str, status: str) -> AvailabilityCheckerStatus:
+        """
+        Provides a status to write.
+        """
+
+        result = AvailabilityCheckerStatus(
+            subject=subject,
+            idna_subject=subject,
+            status=status,
+            status_source="DNSLOOKUP",
+            tested_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        )
+        result.dns_lookup = {"A": ["192.0.2.1"], "NS": None}
+        result.http_status_code = 200
+        result.timings = {"dns": 0.5}
+
+        return result
+
+    def get_partition_files(self, status: str) -> list:
+        """
+        Provides the files of the given partition.
+        """
+
+        partition_dir = os.path.join(self.columnar_dir, status)
+
+        if not os.path.isdir(partition_dir):
+            return []
+
+        return [os.path.join(partition_dir, x) for x in os.listdir(partition_dir)]
+
+    def test_set_format_not_str(self) -> None:
+        """
+        Tests the method which let us set the format for the case that the
+        given value is not a string.
+        """
+
+        self.assertRaises(TypeError, lambda: self.writer.set_format(1))
+
+    def test_set_format_not_supported(self) -> None:
+        """
+        Tests the method which let us set the format for the case that the
+        given value is not supported.
+        """
+
+        self.assertRaises(ValueError, lambda: self.writer.set_format("csv"))
+
+    def test_set_batch_size_not_positive(self) -> None:
+        """
+        Tests the method which let us set the batch size for the case that
+        the given value is not positive.
+        """
+
+        self.assertRaises(ValueError, lambda: self.writer.set_batch_size(0))
+
+    def test_add_not_status(self) -> None:
+        """
+        Tests the method which let us add a status for the case that the
+        given value is not a status.
+        """
+
+        self.assertRaises(TypeError, lambda: self.writer.add({"status": "ACTIVE"}))
+
+    def test_get_columns(self) -> None:
+        """
+        Tests the method which let us get the columns of a status class.
+        """
+
+        columns = ColumnarStatusWriter.get_columns(AvailabilityCheckerStatus)
+
+        expected = [str, datetime.datetime, int, bool, dict, dict]
+        actual = [
+            columns[x]
+            for x in (
+                "idna_subject",
+                "tested_at",
+                "http_status_code",
+                "domain_syntax",
+                "dns_lookup",
+                "params",
+            )
+        ]
+
+        self.assertEqual(expected, actual)
+
+    def test_add_jsonl(self) -> None:
+        """
+        Tests the writing of the statuses in the jsonl format.
+        """
+
+        self.writer.add(self.get_status("example.org", "ACTIVE"))
+        self.writer.add(self.get_status("example.net", "INACTIVE"))
+
+        expected = []
+        actual = self.get_partition_files("ACTIVE")
+
+        self.assertEqual(expected, actual)
+
+        self.writer.add(self.get_status("example.com", "ACTIVE"))
+
+        partition_files = self.get_partition_files("ACTIVE")
+
+        expected = 1
+        actual = len(partition_files)
+
+        self.assertEqual(expected, actual)
+
+        self.writer.close()
+
+        with open(partition_files[0], "r", encoding="utf-8") as file_stream:
+            records = [json.loads(x) for x in file_stream]
+
+        expected = ["example.org", "example.com"]
+        actual = [x["idna_subject"] for x in records]
+
+        self.assertEqual(expected, actual)
+
+        expected = {"A": ["192.0.2.1"], "NS": None}
+        actual = records[0]["dns_lookup"]
+
+        self.assertEqual(expected, actual)
+
+        with open(
+            self.get_partition_files("INACTIVE")[0], "r", encoding="utf-8"
+        ) as file_stream:
+            records = [json.loads(x) for x in file_stream]
+
+        expected = ["example.net"]
+        actual = [x["idna_subject"] for x in records]
+
+        self.assertEqual(expected, actual)
+
+    def test_set_format_without_pyarrow(self) -> None:
+        """
+        Tests the method which let us set the format for the case that
+        pyarrow is not installed.
+        """
+
+        with unittest.mock.patch("PyFunceble.cli.filesystem.columnar.pyarrow", None):
+            self.writer.set_format("parquet")
+
+        expected = "jsonl"
+        actual = self.writer.format
+
+        self.assertEqual(expected, actual)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed.")
+    def test_add_parquet(self) -> None:
+        """
+        Tests the writing of the statuses in the parquet format.
+        """
+
+        self.writer.set_format("parquet")
+
+        for subject in ("example.org", "example.net", "example.com"):
+            self.writer.add(self.get_status(subject, "ACTIVE"))
+
+        self.writer.close()
+
+        table = pyarrow.parquet.read_table(self.get_partition_files("ACTIVE")[0])
+
+        expected = ["example.org", "example.net", "example.com"]
+        actual = table.column("idna_subject").to_pylist()
+
+        self.assertEqual(expected, actual)
+
+        expected = [200, 200, 200]
+        actual = table.column("http_status_code").to_pylist()
+
+        self.assertEqual(expected, actual)
+
+        expected = {"A": ["192.0.2.1"], "NS": None}
+        actual = json.loads(table.column("dns_lookup")[0].as_py())
+
+        self.assertEqual(expected, actual)
+
+        expected = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        actual = table.column("tested_at")[0].as_py()
+
+        self.assertEqual(expected, actual)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed.")
+    def test_add_arrow(self) -> None:
+        """
+        Tests the writing of the statuses in the arrow (IPC) format.
+        """
+
+        self.writer.set_format("arrow")
+
+        for subject in ("example.org", "example.net", "example.com"):
+            self.writer.add(self.get_status(subject, "INVALID"))
+
+        self.writer.close()
+
+        with pyarrow.ipc.open_file(
+            self.get_partition_files("INVALID")[0]
+        ) as file_stream:
+            table = file_stream.read_all()
+
+        expected = ["example.org", "example.net", "example.com"]
+        actual = table.column("idna_subject").to_pylist()
+
+        self.assertEqual(expected, actual)
+
+        expected = ["INVALID", "INVALID", "INVALID"]
+        actual = table.column("status").to_pylist()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
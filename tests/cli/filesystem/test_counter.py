@@ -0,0 +1,243 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our counter.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+
+import PyFunceble.cli.storage
+import PyFunceble.storage
+from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
+from PyFunceble.cli.filesystem.counter import FilesystemCounter
+from PyFunceble.helpers.dict import DictHelper
+
+
+class TestFilesystemCounter(unittest.TestCase):
+    """
+    Tests our counter.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.previous_output_directory = PyFunceble.cli.storage.OUTPUT_DIRECTORY
+        PyFunceble.cli.storage.OUTPUT_DIRECTORY = self.temp_dir.name
+
+        self.counter = FilesystemCounter(parent_dirname="hello.list")
+        self.source_file = os.path.join(
+            self.temp_dir.name, "hello.list", PyFunceble.cli.storage.COUNTER_FILE
+        )
+
+        self.status = AvailabilityCheckerStatus()
+        self.status.status = PyFunceble.storage.STATUS.up
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        PyFunceble.cli.storage.OUTPUT_DIRECTORY = self.previous_output_directory
+        self.temp_dir.cleanup()
+
+        del self.temp_dir
+        del self.counter
+        del self.status
+
+    def get_total_from_file(self) -> int:
+        """
+        Provides the total from the counter file.
+        """
+
+        return DictHelper().from_json_file(self.source_file)["counter"]["total"]
+
+    def test_count(self) -> None:
+        """
+        Tests the counting of a status.
+        """
+
+        self.counter.count(self.status).count(self.status)
+
+        expected = 2
+        actual = self.get_total_from_file()
+
+        self.assertEqual(expected, actual)
+
+        expected = ["counter.json"]
+        actual = os.listdir(os.path.dirname(self.source_file))
+
+        self.assertEqual(expected, actual)
+
+    def test_set_buffered_not_bool(self) -> None:
+        """
+        Tests the method which let us buffer the datasets for the case that
+        the given value is not a boolean.
+        """
+
+        self.assertRaises(TypeError, lambda: self.counter.set_buffered("yes"))
+
+    def test_count_buffered(self) -> None:
+        """
+        Tests the counting of a status for the case that we buffer the
+        dataset.
+        """
+
+        self.counter.set_buffered(True)
+        self.counter.FLUSH_INTERVAL = 3600.0
+
+        self.counter.count(self.status).count(self.status)
+
+        self.assertFalse(os.path.isfile(self.source_file))
+
+        expected = 2
+        actual = self.counter.fetch_dataset().dataset["counter"]["total"]
+
+        self.assertEqual(expected, actual)
+
+        self.counter.flush()
+
+        expected = 2
+        actual = self.get_total_from_file()
+
+        self.assertEqual(expected, actual)
+
+    def test_count_buffered_flush_every(self) -> None:
+        """
+        Tests that the buffered dataset is written every given number of
+        saves.
+        """
+
+        self.counter.set_buffered(True)
+        self.counter.FLUSH_EVERY = 3
+        self.counter.FLUSH_INTERVAL = 3600.0
+
+        for _ in range(4):
+            self.counter.count(self.status)
+
+        expected = 3
+        actual = self.get_total_from_file()
+
+        self.assertEqual(expected, actual)
+
+        self.counter.set_buffered(False)
+
+        expected = 4
+        actual = self.get_total_from_file()
+
+        self.assertEqual(expected, actual)
+
+    def test_count_buffered_flush_interval(self) -> None:
+        """
+        Tests that the buffered dataset is written every given number of
+        seconds.
+        """
+
+        self.counter.set_buffered(True)
+        self.counter.FLUSH_INTERVAL = 0.0
+
+        self.counter.count(self.status)
+
+        expected = 1
+        actual = self.get_total_from_file()
+
+        self.assertEqual(expected, actual)
+
+    def test_count_multiple_writers(self) -> None:
+        """
+        Tests the counting of a status for the case that multiple counters
+        write the same file.
+        """
+
+        other_counter = FilesystemCounter(parent_dirname="hello.list")
+
+        self.counter.count(self.status)
+        other_counter.count(self.status)
+        self.counter.count(self.status)
+
+        expected = 3
+        actual = self.get_total_from_file()
+
+        self.assertEqual(expected, actual)
+
+    def test_count_multiple_writers_buffered(self) -> None:
+        """
+        Tests the counting of a status for the case that multiple buffered
+        counters write the same file.
+
+        Each buffered counter overwrites the file with its own copy. This is
+        why a buffered counter should only be used by a single writer.
+        """
+
+        other_counter = FilesystemCounter(parent_dirname="hello.list")
+
+        for counter in (self.counter, other_counter):
+            counter.set_buffered(True)
+            counter.FLUSH_INTERVAL = 3600.0
+
+        self.counter.count(self.status)
+        other_counter.count(self.status)
+        self.counter.count(self.status)
+
+        self.counter.flush()
+        other_counter.flush()
+
+        expected = 1
+        actual = self.get_total_from_file()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
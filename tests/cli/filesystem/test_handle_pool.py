@@ -0,0 +1,246 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our pool of file handles.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+
+from PyFunceble.cli.filesystem.handle_pool import FileHandlePool
+from PyFunceble.cli.filesystem.printer.file import FilePrinter
+
+
+class TestFileHandlePool(unittest.TestCase):
+    """
+    Tests our pool of file handles.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.pool = FileHandlePool(max_handles=2, buffer_size=1024, flush_interval=3600)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.pool.close()
+        self.temp_dir.cleanup()
+
+        del self.temp_dir
+        del self.pool
+
+    def get_path(self, *parts: str) -> str:
+        """
+        Provides a path inside our temporary directory.
+        """
+
+        return os.path.join(self.temp_dir.name, *parts)
+
+    @staticmethod
+    def read(file_path: str) -> str:
+        """
+        Provides the content of the given file.
+        """
+
+        with open(file_path, "r", encoding="utf-8") as file_stream:
+            return file_stream.read()
+
+    def test_set_max_handles_not_int(self) -> None:
+        """
+        Tests the method which let us set the maximum number of handles for
+        the case that the given value is not an integer.
+        """
+
+        self.assertRaises(TypeError, lambda: self.pool.set_max_handles("2"))
+
+    def test_set_max_handles_not_positive(self) -> None:
+        """
+        Tests the method which let us set the maximum number of handles for
+        the case that the given value is not positive.
+        """
+
+        self.assertRaises(ValueError, lambda: self.pool.set_max_handles(0))
+
+    def test_set_buffer_size_not_positive(self) -> None:
+        """
+        Tests the method which let us set the size of the buffers for the case
+        that the given value is not positive.
+        """
+
+        self.assertRaises(ValueError, lambda: self.pool.set_buffer_size(0))
+
+    def test_set_flush_interval_negative(self) -> None:
+        """
+        Tests the method which let us set the flush interval for the case
+        that the given value is negative.
+        """
+
+        self.assertRaises(ValueError, lambda: self.pool.set_flush_interval(-1))
+
+    def test_write_and_flush(self) -> None:
+        """
+        Tests that the written data are buffered until we flush them.
+        """
+
+        file_path = self.get_path("hello", "world.txt")
+
+        self.pool.write(file_path, "hello\n").write(file_path, "world\n")
+
+        self.assertTrue(file_path in self.pool)
+
+        expected = ""
+        actual = self.read(file_path)
+
+        self.assertEqual(expected, actual)
+
+        self.pool.flush()
+
+        expected = "hello\nworld\n"
+        actual = self.read(file_path)
+
+        self.assertEqual(expected, actual)
+
+    def test_write_flush_interval(self) -> None:
+        """
+        Tests that the written data are flushed once the flush interval is
+        exceeded.
+        """
+
+        file_path = self.get_path("world.txt")
+
+        self.pool.set_flush_interval(0).write(file_path, "hello\n")
+
+        expected = "hello\n"
+        actual = self.read(file_path)
+
+        self.assertEqual(expected, actual)
+
+    def test_write_lru(self) -> None:
+        """
+        Tests that the least recently used handle is closed (and therefore
+        flushed) when the pool is full.
+        """
+
+        first, second, third = [self.get_path(f"{x}.txt") for x in range(3)]
+
+        self.pool.write(first, "1\n").write(second, "2\n").write(first, "1\n")
+        self.pool.write(third, "3\n")
+
+        expected = 2
+        actual = len(self.pool)
+
+        self.assertEqual(expected, actual)
+
+        self.assertTrue(first in self.pool)
+        self.assertFalse(second in self.pool)
+
+        expected = "2\n"
+        actual = self.read(second)
+
+        self.assertEqual(expected, actual)
+
+        self.pool.write(second, "2\n").close()
+
+        expected = 0
+        actual = len(self.pool)
+
+        self.assertEqual(expected, actual)
+
+        expected = ["1\n1\n", "2\n2\n", "3\n"]
+        actual = [self.read(x) for x in (first, second, third)]
+
+        self.assertEqual(expected, actual)
+
+    def test_file_printer(self) -> None:
+        """
+        Tests that the file printer writes the same content through the pool
+        as it does without it.
+        """
+
+        without_pool = self.get_path("without_pool.txt")
+        with_pool = self.get_path("with_pool.txt")
+
+        file_printer = FilePrinter("plain", destination=without_pool)
+
+        for destination in (without_pool, with_pool):
+            if destination == with_pool:
+                file_printer.set_file_handle_pool(self.pool)
+
+            file_printer.set_destination(destination)
+
+            for subject in ("example.org", "example.net"):
+                file_printer.set_dataset(
+                    {"idna_subject": subject}
+                ).print_interpolated_line()
+
+        self.pool.close()
+
+        expected = self.read(without_pool).splitlines()[2:]
+        actual = self.read(with_pool).splitlines()[2:]
+
+        self.assertEqual(expected, actual)
+
+        expected = ["# Generated by", "# Date of generation"]
+        actual = [
+            x[: len(y)] for x, y in zip(self.read(with_pool).splitlines(), expected)
+        ]
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our lookup timings counter.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import tempfile
+import unittest
+
+import PyFunceble.cli.storage
+from PyFunceble.cli.filesystem.lookup_timings import LookupTimingsCounter
+
+
+class TestLookupTimingsCounter(unittest.TestCase):
+    """
+    Tests our lookup timings counter.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.previous_output_directory = PyFunceble.cli.storage.OUTPUT_DIRECTORY
+        PyFunceble.cli.storage.OUTPUT_DIRECTORY = self.temp_dir.name
+
+        self.counter = LookupTimingsCounter(parent_dirname="hello.list")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        PyFunceble.cli.storage.OUTPUT_DIRECTORY = self.previous_output_directory
+        self.temp_dir.cleanup()
+
+        del self.temp_dir
+        del self.counter
+
+    def test_count(self) -> None:
+        """
+        Tests the counting of some timings.
+        """
+
+        for duration in range(1, 101):
+            self.counter.count({"dns": duration / 1000, "whois": 0.5})
+
+        # Let's check that the dataset is shared through the file.
+        counter = LookupTimingsCounter(parent_dirname="hello.list")
+
+        expected = ["dns", "whois"]
+        actual = [x["stage"] for x in counter.get_dataset_for_printer()]
+
+        self.assertEqual(expected, actual)
+
+        for percentile, expected in [(50, 50), (95, 95), (99, 99), (100, 100)]:
+            actual = counter.get_percentile("dns", percentile)
+
+            # We are allowed to be 10% off.
+            self.assertLessEqual(expected, actual)
+            self.assertLessEqual(actual, expected * counter.BUCKET_GROWTH)
+
+        expected = 500
+        actual = counter.get_percentile("whois", 50)
+
+        self.assertAlmostEqual(expected, actual)
+
+        expected = {
+            "stage": "whois",
+            "amount": 100,
+            "p50": "500.00",
+            "p95": "500.00",
+            "p99": "500.00",
+        }
+        actual = counter.get_dataset_for_printer()[-1]
+
+        self.assertEqual(expected, actual)
+
+    def test_count_not_dict(self) -> None:
+        """
+        Tests the counting of some timings for the case that the given
+        timings are not a dict.
+        """
+
+        self.assertRaises(TypeError, lambda: self.counter.count(["dns"]))
+
+    def test_get_percentile_unknown_stage(self) -> None:
+        """
+        Tests the method which let us get a percentile for the case that the
+        stage was never counted.
+        """
+
+        expected = None
+        actual = self.counter.get_percentile("dns", 50)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_percentile_out_of_range(self) -> None:
+        """
+        Tests the method which let us get a percentile for the case that the
+        given percentile is out of range.
+        """
+
+        self.assertRaises(ValueError, lambda: self.counter.get_percentile("dns", 0))
+        self.assertRaises(ValueError, lambda: self.counter.get_percentile("dns", 101))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our processes manager base.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import multiprocessing.queues
+import unittest
+import unittest.mock
+
+from PyFunceble.cli.processes.base import ProcessesManagerBase
+from PyFunceble.config.loader import ConfigLoader
+from PyFunceble.utils.platform import PlatformUtility
+
+
+class TestProcessesManagerBase(unittest.TestCase):
+    """
+    Tests the base of our processes managers.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.manager = unittest.mock.MagicMock()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything previously initiated for the tests.
+        """
+
+        del self.manager
+
+    def test_set_direct_queue_not_bool(self) -> None:
+        """
+        Tests the method which let us set the usage of direct queues for the
+        case that the given value is not a boolean.
+        """
+
+        processes_manager = ProcessesManagerBase(
+            self.manager, direct_queue=False, batch_size=1
+        )
+
+        self.assertRaises(TypeError, lambda: processes_manager.set_direct_queue(1))
+
+    def test_create_queue_direct(self) -> None:
+        """
+        Tests that direct queues are created - without any manager - when
+        they are authorized.
+        """
+
+        processes_manager = ProcessesManagerBase(
+            direct_queue=True, batch_size=1, output_queue_num=2
+        )
+
+        self.assertIsNone(processes_manager.manager)
+
+        self.assertIsInstance(
+            processes_manager.input_queue, multiprocessing.queues.Queue
+        )
+
+        expected = 2
+        actual = len(processes_manager.output_queue)
+
+        self.assertEqual(expected, actual)
+
+        for output_queue in processes_manager.output_queue:
+            self.assertIsInstance(output_queue, multiprocessing.queues.Queue)
+
+        processes_manager.input_queue.put("hello")
+
+        expected = "hello"
+        actual = processes_manager.input_queue.get(timeout=5)
+
+        self.assertEqual(expected, actual)
+
+    def test_create_queue_direct_manager_given(self) -> None:
+        """
+        Tests that direct queues are created - even if a manager is given -
+        when they are authorized.
+        """
+
+        processes_manager = ProcessesManagerBase(
+            self.manager, direct_queue=True, batch_size=1
+        )
+
+        self.assertIsInstance(
+            processes_manager.input_queue, multiprocessing.queues.Queue
+        )
+
+        self.manager.Queue.assert_not_called()
+
+    def test_create_queue_manager(self) -> None:
+        """
+        Tests that the queues of the given manager are used when the direct
+        queues are not authorized.
+        """
+
+        processes_manager = ProcessesManagerBase(
+            self.manager, direct_queue=False, batch_size=1
+        )
+
+        expected = self.manager.Queue.return_value
+        actual = processes_manager.create_queue()
+
+        self.assertIs(expected, actual)
+
+        # input queue + output queue + our own call.
+        expected = 3
+        actual = self.manager.Queue.call_count
+
+        self.assertEqual(expected, actual)
+
+    @unittest.mock.patch.object(PlatformUtility, "is_mac_os")
+    def test_guess_and_set_direct_queue(
+        self, is_mac_os_patch: unittest.mock.MagicMock
+    ) -> None:
+        """
+        Tests the method which let us guess and set the usage of direct
+        queues.
+        """
+
+        is_mac_os_patch.return_value = False
+
+        config_loader = ConfigLoader()
+        config_loader.custom_config = {"cli_testing": {"direct_queues": True}}
+
+        config_loader.start()
+
+        processes_manager = ProcessesManagerBase(self.manager, batch_size=1)
+
+        expected = True
+        actual = processes_manager.direct_queue
+
+        self.assertEqual(expected, actual)
+
+        del config_loader
+
+    @unittest.mock.patch.object(PlatformUtility, "is_mac_os")
+    def test_guess_and_set_direct_queue_mac_os(
+        self, is_mac_os_patch: unittest.mock.MagicMock
+    ) -> None:
+        """
+        Tests the method which let us guess and set the usage of direct
+        queues for the case that we are under Mac OS.
+        """
+
+        is_mac_os_patch.return_value = True
+
+        config_loader = ConfigLoader()
+        config_loader.custom_config = {"cli_testing": {"direct_queues": True}}
+
+        config_loader.start()
+
+        processes_manager = ProcessesManagerBase(self.manager, batch_size=1)
+
+        expected = False
+        actual = processes_manager.direct_queue
+
+        self.assertEqual(expected, actual)
+
+        del config_loader
+
+    def test_guess_and_set_direct_queue_config_not_loaded(self) -> None:
+        """
+        Tests the method which let us guess and set the usage of direct
+        queues for the case that the configuration is not loaded.
+        """
+
+        processes_manager = ProcessesManagerBase(self.manager, batch_size=1)
+
+        expected = ProcessesManagerBase.STD_DIRECT_QUEUE
+        actual = processes_manager.direct_queue
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our batch of messages.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import pickle
+import unittest
+
+from PyFunceble.cli.processes.batch import MessageBatch
+
+
+class TestMessageBatch(unittest.TestCase):
+    """
+    Tests our batch of messages.
+    """
+
+    def test_iter(self) -> None:
+        """
+        Tests the unpacking of a batch without header.
+        """
+
+        given = [("hello", "world"), ("world", "hello")]
+
+        expected = given
+        actual = list(MessageBatch(given))
+
+        self.assertEqual(expected, actual)
+
+    def test_iter_with_header(self) -> None:
+        """
+        Tests the unpacking of a batch with a header.
+        """
+
+        batch = MessageBatch(header={"type": "file", "subject": "hello.list"})
+        batch.append({"subject": "example.org"}).append({"subject": "example.net"})
+
+        expected = [
+            {"type": "file", "subject": "example.org"},
+            {"type": "file", "subject": "example.net"},
+        ]
+        actual = list(batch)
+
+        self.assertEqual(expected, actual)
+
+        actual[0]["type"] = "single"
+
+        expected = {"type": "file", "subject": "hello.list"}
+        actual = batch.header
+
+        self.assertEqual(expected, actual)
+
+    def test_len(self) -> None:
+        """
+        Tests the length of a batch.
+        """
+
+        expected = 2
+        actual = len(MessageBatch(["hello", "world"]))
+
+        self.assertEqual(expected, actual)
+
+    def test_pickle(self) -> None:
+        """
+        Tests that a batch can be shared through our queues.
+        """
+
+        batch = MessageBatch([{"subject": "example.org"}], header={"type": "file"})
+
+        expected = list(batch)
+        actual = list(pickle.loads(pickle.dumps(batch)))
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
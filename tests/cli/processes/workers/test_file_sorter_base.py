@@ -0,0 +1,340 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our file sorter base.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+
+from PyFunceble.cli.processes.workers.file_sorter_base import FileSorterWorkerBase
+from PyFunceble.cli.utils.sort import hierarchical, standard
+
+
+class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """
+    Provides an executor which keeps track of the maximal number of
+    submitted - but not yet finished - tasks.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.max_pending = 0
+
+    def task_done(self, _: concurrent.futures.Future) -> None:
+        """
+        Decrements the number of pending tasks.
+        """
+
+        with self.lock:
+            self.pending -= 1
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        with self.lock:
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+
+        result = super().submit(fn, *args, **kwargs)
+        result.add_done_callback(self.task_done)
+
+        return result
+
+
+class TestFileSorterWorkerBase(unittest.TestCase):
+    """
+    Tests our file sorter base.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.temp_dir.name, "hello.txt")
+
+        self.lines = [
+            "www.example.org\n",
+            "example.com\n",
+            "hello10.example.net\n",
+            "example.com\n",
+            "hello9.example.net\n",
+            "a.example.org\n",
+            "example.com",
+        ]
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.temp_dir.cleanup()
+
+        del self.temp_dir
+        del self.file
+        del self.lines
+
+    def test_iter_chunks(self) -> None:
+        """
+        Tests the splitting of lines into chunks fitting into a memory budget.
+        """
+
+        given = ["a\n", "b\n", "c"]
+
+        expected = [["a\n"], ["b\n"], ["c\n"]]
+        actual = list(FileSorterWorkerBase.iter_chunks(given, 1))
+
+        self.assertEqual(expected, actual)
+
+        expected = [["a\n", "b\n", "c\n"]]
+        actual = list(FileSorterWorkerBase.iter_chunks(given))
+
+        self.assertEqual(expected, actual)
+
+    def test_sort_chunk(self) -> None:
+        """
+        Tests the sorting of a single chunk and the reading of its records.
+        """
+
+        destination = FileSorterWorkerBase.sort_chunk(
+            ["b\n", "a\n", "b\n"], self.file, sorting_key=standard
+        )
+
+        expected = [[["a"], "a\n"], [["b"], "b\n"]]
+        actual = list(FileSorterWorkerBase.iter_chunk_records(destination))
+
+        self.assertEqual(expected, actual)
+
+    def test_process_file_sorting(self) -> None:
+        """
+        Tests the sorting of a file which is split into multiple chunks.
+        """
+
+        with open(self.file, "w", encoding="utf-8") as file_stream:
+            file_stream.writelines(self.lines)
+
+        FileSorterWorkerBase.process_file_sorting(
+            self.file,
+            write_header=False,
+            sorting_key=standard,
+            max_chunk_memory=256,
+        )
+
+        expected = [
+            "a.example.org\n",
+            "example.com\n",
+            "hello9.example.net\n",
+            "hello10.example.net\n",
+            "www.example.org\n",
+        ]
+
+        with open(self.file, "r", encoding="utf-8") as file_stream:
+            actual = file_stream.readlines()
+
+        self.assertEqual(expected, actual)
+
+    def test_process_file_sorting_hierarchical(self) -> None:
+        """
+        Tests the sorting of a file with the hierarchical sorting key.
+        """
+
+        with open(self.file, "w", encoding="utf-8") as file_stream:
+            file_stream.write("# Hello\n# World\n")
+            file_stream.writelines(self.lines)
+
+        FileSorterWorkerBase.process_file_sorting(
+            self.file, sorting_key=hierarchical, max_chunk_memory=256
+        )
+
+        expected = [
+            "example.com\n",
+            "hello9.example.net\n",
+            "hello10.example.net\n",
+            "a.example.org\n",
+            "www.example.org\n",
+        ]
+
+        with open(self.file, "r", encoding="utf-8") as file_stream:
+            actual = [x for x in file_stream if x.strip() and x[0] != "#"]
+
+        self.assertEqual(expected, actual)
+
+    def test_process_file_sorting_keep_duplicates(self) -> None:
+        """
+        Tests the sorting of a file for the case that we want to keep the
+        duplicates.
+        """
+
+        with open(self.file, "w", encoding="utf-8") as file_stream:
+            file_stream.writelines(self.lines)
+
+        FileSorterWorkerBase.process_file_sorting(
+            self.file,
+            remove_duplicates=False,
+            write_header=False,
+            sorting_key=standard,
+            max_chunk_memory=256,
+        )
+
+        expected = 3
+
+        with open(self.file, "r", encoding="utf-8") as file_stream:
+            actual = file_stream.read().count("example.com\n")
+
+        self.assertEqual(expected, actual)
+
+    def test_get_chunk_executor_single_worker(self) -> None:
+        """
+        Tests the method which let us get the pool of processes to sort the
+        chunks with for the case that only a single worker is allowed.
+        """
+
+        self.assertIsNone(FileSorterWorkerBase.get_chunk_executor(1))
+
+    def test_get_pending_chunks_slots(self) -> None:
+        """
+        Tests that the pending slots follow the number of workers of the pool.
+        """
+
+        slots = FileSorterWorkerBase.get_pending_chunks_slots(3)
+
+        expected = 3 * FileSorterWorkerBase.PENDING_CHUNKS_PER_WORKER
+        actual = 0
+
+        while slots.acquire(blocking=False):
+            actual += 1
+
+        self.assertEqual(expected, actual)
+
+    def test_sort_chunks_pending_bound(self) -> None:
+        """
+        Tests that no more chunks than the given slots are given to the
+        executor at the same time - even when it has more workers.
+        """
+
+        lines = [f"hello{x}.example.org\n" for x in reversed(range(50))]
+        sort_chunk = FileSorterWorkerBase.sort_chunk
+
+        def slow_sort_chunk(*args, **kwargs):
+            time.sleep(0.01)
+
+            return sort_chunk(*args, **kwargs)
+
+        with CountingExecutor(max_workers=8) as executor, unittest.mock.patch.object(
+            FileSorterWorkerBase, "sort_chunk", side_effect=slow_sort_chunk
+        ):
+            sorted_files = FileSorterWorkerBase.sort_chunks(
+                lines,
+                self.temp_dir.name,
+                sorting_key=standard,
+                max_chunk_memory=256,
+                executor=executor,
+                pending_chunks=FileSorterWorkerBase.get_pending_chunks_slots(1),
+            )
+
+        self.assertGreater(len(sorted_files), 10)
+        self.assertLessEqual(
+            executor.max_pending, FileSorterWorkerBase.PENDING_CHUNKS_PER_WORKER
+        )
+
+        expected = sorted(lines, key=standard)
+        actual = list(FileSorterWorkerBase.merge_chunks(sorted_files))
+
+        self.assertEqual(expected, actual)
+
+    @unittest.skipIf(
+        multiprocessing.get_start_method() != "fork",
+        "The chunks are only sorted in parallel with the fork start method.",
+    )
+    def test_process_file_sorting_parallel(self) -> None:
+        """
+        Tests the sorting of a file whose chunks are sorted in parallel.
+        """
+
+        with open(self.file, "w", encoding="utf-8") as file_stream:
+            file_stream.writelines(self.lines)
+
+        executor = FileSorterWorkerBase.get_chunk_executor(2)
+
+        self.assertIsInstance(executor, concurrent.futures.ProcessPoolExecutor)
+
+        with executor:
+            FileSorterWorkerBase.process_file_sorting(
+                self.file,
+                write_header=False,
+                sorting_key=standard,
+                max_chunk_memory=256,
+                executor=executor,
+            )
+
+        expected = [
+            "a.example.org\n",
+            "example.com\n",
+            "hello9.example.net\n",
+            "hello10.example.net\n",
+            "www.example.org\n",
+        ]
+
+        with open(self.file, "r", encoding="utf-8") as file_stream:
+            actual = file_stream.readlines()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,8 +50,10 @@ License:
     limitations under the License.
 """
 
+import itertools
 import unittest
 from collections import Counter
+from typing import Generator
 
 from PyFunceble.checker.syntax.ip import IPSyntaxChecker
 from PyFunceble.converter.cidr2subject import CIDR2Subject
@@ -182,6 +184,76 @@ class TestCIDR2Subject(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_get_converted_ipv6_range(self) -> None:
+        """
+        Tests the method which let us get the converted data for the case that
+        the given subject is an IPv6 network which is small enough to be
+        expanded.
+        """
+
+        given = "2001:4860:4860::/124"
+        expected = ["2001:4860:4860::"] + [
+            f"2001:4860:4860::{x:x}" for x in range(1, 15 + 1)
+        ]
+
+        self.converter.data_to_convert = given
+        actual = self.converter.get_converted()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_converted_ipv6_range_capped(self) -> None:
+        """
+        Tests the method which let us get the converted data for the case that
+        the given subject is an IPv6 network which is larger than the cap.
+        """
+
+        given = "2001:4860:4860::/124"
+        expected = ["2001:4860:4860::/124"]
+
+        self.converter.set_max_ipv6_addresses(15)
+        self.converter.data_to_convert = given
+        actual = self.converter.get_converted()
+
+        self.assertEqual(expected, actual)
+
+    def test_iter_converted(self) -> None:
+        """
+        Tests the method which let us get the converted data lazily.
+        """
+
+        given = "10.0.0.0/8"
+        expected = ["10.0.0.0", "10.0.0.1", "10.0.0.2"]
+
+        self.converter.data_to_convert = given
+        actual = self.converter.iter_converted()
+
+        self.assertIsInstance(actual, Generator)
+        self.assertEqual(expected, list(itertools.islice(actual, 3)))
+
+    def test_set_max_ipv6_addresses_not_int(self) -> None:
+        """
+        Tests the method which let us set the maximal number of IPv6 addresses
+        for the case that the given value is not an integer.
+        """
+
+        given = "15"
+
+        self.assertRaises(
+            TypeError, lambda: self.converter.set_max_ipv6_addresses(given)
+        )
+
+    def test_set_max_ipv6_addresses_negative(self) -> None:
+        """
+        Tests the method which let us set the maximal number of IPv6 addresses
+        for the case that the given value is negative.
+        """
+
+        given = -1
+
+        self.assertRaises(
+            ValueError, lambda: self.converter.set_max_ipv6_addresses(given)
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,188 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of the indexed inactive CSV dataset.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from PyFunceble.dataset.inactive.indexed_csv import IndexedCSVInactiveDataset
+
+
+class TestIndexedCSVInactiveDataset(unittest.TestCase):
+    """
+    Tests the indexed inactive CSV dataset.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.dataset = IndexedCSVInactiveDataset(
+            authorized=True, config_dir=self.temp_dir.name
+        )
+        self.dataset.source_file = os.path.join(self.temp_dir.name, "inactive.csv")
+
+        self.now = datetime.now(timezone.utc)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.temp_dir.cleanup()
+
+        del self.temp_dir
+        del self.dataset
+        del self.now
+
+    def test_get_to_retest(self) -> None:
+        """
+        Tests the selection of the subjects to retest.
+        """
+
+        for subject, days, destination in [
+            ("example.org", 3, "hello.list"),
+            ("example.net", 0, "hello.list"),
+            ("example.com", 2, "world.list"),
+            ("example.dev", 7, "hello.list"),
+        ]:
+            self.dataset.update(
+                {
+                    "idna_subject": subject,
+                    "checker_type": "AVAILABILITY",
+                    "destination": destination,
+                    "tested_at": self.now - timedelta(days=days),
+                }
+            )
+
+        expected = ["example.dev", "example.org"]
+        actual = [
+            x["idna_subject"]
+            for x in self.dataset.get_to_retest(
+                "hello.list", "AVAILABILITY", min_days=1
+            )
+        ]
+
+        self.assertEqual(expected, actual)
+
+        expected = []
+        actual = list(self.dataset.get_to_retest("hello.list", "SYNTAX", min_days=1))
+
+        self.assertEqual(expected, actual)
+
+    def test_get_to_retest_after_update(self) -> None:
+        """
+        Tests the selection of the subjects to retest after an update or a
+        removal of a previously indexed subject.
+        """
+
+        for subject in ("example.org", "example.net"):
+            self.dataset.update(
+                {
+                    "idna_subject": subject,
+                    "checker_type": "AVAILABILITY",
+                    "destination": "hello.list",
+                    "tested_at": self.now - timedelta(days=5),
+                }
+            )
+
+        self.dataset.update(
+            {
+                "idna_subject": "example.org",
+                "checker_type": "AVAILABILITY",
+                "destination": "hello.list",
+                "tested_at": self.now,
+            }
+        )
+        self.dataset.remove(
+            {
+                "idna_subject": "example.net",
+                "checker_type": "AVAILABILITY",
+                "destination": "hello.list",
+            }
+        )
+
+        expected = []
+        actual = list(
+            self.dataset.get_to_retest("hello.list", "AVAILABILITY", min_days=1)
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_get_to_retest_parsed(self) -> None:
+        """
+        Tests that the provided rows have their time of inclusion parsed.
+        """
+
+        self.dataset.update(
+            {
+                "idna_subject": "example.org",
+                "checker_type": "AVAILABILITY",
+                "destination": "hello.list",
+                "tested_at": self.now - timedelta(days=5),
+            }
+        )
+
+        expected = self.now - timedelta(days=5)
+        actual = next(
+            self.dataset.get_to_retest("hello.list", "AVAILABILITY", min_days=1)
+        )["tested_at"]
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,333 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of the base of all our indexed CSV dataset.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+
+from PyFunceble.dataset.indexed_csv_base import CSVFileIndex, IndexedCSVDatasetBase
+
+
+class OurIndexedCSVDataset(IndexedCSVDatasetBase):
+    """
+    Provides a minimal dataset to test the base with.
+    """
+
+    FIELDS = ["idna_subject", "checker_type", "status"]
+    COMPARISON_FIELDS = ["idna_subject", "checker_type"]
+
+
+class TestIndexedCSVDatasetBase(unittest.TestCase):
+    """
+    Tests the base of all indexed CSV dataset.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.dataset = OurIndexedCSVDataset(authorized=True)
+        self.dataset.source_file = os.path.join(self.temp_dir.name, "test.csv")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.temp_dir.cleanup()
+
+        del self.temp_dir
+        del self.dataset
+
+    def test_add_and_exists(self) -> None:
+        """
+        Tests the addition of a new row and its existence.
+        """
+
+        self.dataset.add(
+            {"idna_subject": "example.org", "checker_type": "AVAILABILITY"}
+        )
+
+        self.assertTrue(
+            self.dataset.exists(
+                {"idna_subject": "example.org", "checker_type": "AVAILABILITY"}
+            )
+        )
+        self.assertFalse(
+            self.dataset.exists(
+                {"idna_subject": "example.org", "checker_type": "SYNTAX"}
+            )
+        )
+
+    def test_update(self) -> None:
+        """
+        Tests that an update only keeps the latest version of a row.
+        """
+
+        self.dataset.update(
+            {
+                "idna_subject": "example.org",
+                "checker_type": "AVAILABILITY",
+                "status": "ACTIVE",
+            }
+        )
+        self.dataset.update(
+            {
+                "idna_subject": "example.org",
+                "checker_type": "AVAILABILITY",
+                "status": "INACTIVE",
+            }
+        )
+
+        expected = [
+            {
+                "idna_subject": "example.org",
+                "checker_type": "AVAILABILITY",
+                "status": "INACTIVE",
+            }
+        ]
+        actual = list(self.dataset.get_content())
+
+        self.assertEqual(expected, actual)
+
+    def test_update_ignore_if_exist(self) -> None:
+        """
+        Tests that an update is ignored when asked and the row already exists.
+        """
+
+        self.dataset.update(
+            {
+                "idna_subject": "example.org",
+                "checker_type": "AVAILABILITY",
+                "status": "ACTIVE",
+            }
+        )
+        self.dataset.update(
+            {
+                "idna_subject": "example.org",
+                "checker_type": "AVAILABILITY",
+                "status": "INACTIVE",
+            },
+            ignore_if_exist=True,
+        )
+
+        expected = ["ACTIVE"]
+        actual = [x["status"] for x in self.dataset.get_content()]
+
+        self.assertEqual(expected, actual)
+
+    def test_update_many(self) -> None:
+        """
+        Tests the update of multiple rows at once.
+        """
+
+        self.dataset.update(
+            {
+                "idna_subject": "example.org",
+                "checker_type": "AVAILABILITY",
+                "status": "ACTIVE",
+            }
+        )
+
+        self.dataset.update_many(
+            [
+                {
+                    "idna_subject": "example.org",
+                    "checker_type": "AVAILABILITY",
+                    "status": "INACTIVE",
+                },
+                {
+                    "idna_subject": "example.net",
+                    "checker_type": "AVAILABILITY",
+                    "status": "ACTIVE",
+                },
+                {
+                    "idna_subject": "example.net",
+                    "checker_type": "AVAILABILITY",
+                    "status": "INACTIVE",
+                },
+            ],
+            ignore_if_exist=True,
+        )
+
+        expected = [("example.org", "ACTIVE"), ("example.net", "ACTIVE")]
+        actual = [(x["idna_subject"], x["status"]) for x in self.dataset.get_content()]
+
+        self.assertEqual(expected, actual)
+
+        with open(self.dataset.source_file, "r", encoding="utf-8") as file_stream:
+            # The header and our 2 rows.
+            expected = 3
+            actual = len(file_stream.readlines())
+
+        self.assertEqual(expected, actual)
+
+    def test_update_many_not_dict(self) -> None:
+        """
+        Tests the update of multiple rows at once for the case that one of the
+        given rows is not a dict.
+        """
+
+        self.assertRaises(
+            TypeError, lambda: self.dataset.update_many([{}, "example.org"])
+        )
+
+    def test_remove(self) -> None:
+        """
+        Tests the removal of a row.
+        """
+
+        self.dataset.add({"idna_subject": "example.org", "checker_type": "SYNTAX"})
+        self.dataset.add({"idna_subject": "example.net", "checker_type": "SYNTAX"})
+
+        self.dataset.remove({"idna_subject": "example.org", "checker_type": "SYNTAX"})
+
+        expected = ["example.net"]
+        actual = [x["idna_subject"] for x in self.dataset.get_content()]
+
+        self.assertEqual(expected, actual)
+
+    def test_sync_from_other_writer(self) -> None:
+        """
+        Tests that what another writer appended is seen without rebuilding
+        the whole index.
+        """
+
+        self.dataset.add({"idna_subject": "example.org", "checker_type": "SYNTAX"})
+
+        other_dataset = OurIndexedCSVDataset(authorized=True)
+        other_dataset.source_file = self.dataset.source_file
+
+        self.assertTrue(
+            other_dataset.exists(
+                {"idna_subject": "example.org", "checker_type": "SYNTAX"}
+            )
+        )
+
+        self.dataset.add({"idna_subject": "example.net", "checker_type": "SYNTAX"})
+        self.dataset.remove({"idna_subject": "example.org", "checker_type": "SYNTAX"})
+
+        self.assertTrue(
+            other_dataset.exists(
+                {"idna_subject": "example.net", "checker_type": "SYNTAX"}
+            )
+        )
+        self.assertFalse(
+            other_dataset.exists(
+                {"idna_subject": "example.org", "checker_type": "SYNTAX"}
+            )
+        )
+
+    def test_close(self) -> None:
+        """
+        Tests that the file is compacted when the dataset is closed.
+        """
+
+        for status in ("ACTIVE", "INACTIVE", "INVALID"):
+            self.dataset.update(
+                {
+                    "idna_subject": "example.org",
+                    "checker_type": "AVAILABILITY",
+                    "status": status,
+                }
+            )
+
+        self.dataset.add({"idna_subject": "example.net", "checker_type": "SYNTAX"})
+        self.dataset.remove({"idna_subject": "example.net", "checker_type": "SYNTAX"})
+
+        self.dataset.close()
+
+        with open(self.dataset.source_file, encoding="utf-8") as file_stream:
+            expected = [
+                "idna_subject,checker_type,status",
+                "example.org,AVAILABILITY,INVALID",
+            ]
+            actual = file_stream.read().splitlines()
+
+        self.assertEqual(expected, actual)
+
+    def test_partial_line_not_indexed(self) -> None:
+        """
+        Tests that a line which is still being written is not indexed.
+        """
+
+        with open(self.dataset.source_file, "w", encoding="utf-8") as file_stream:
+            file_stream.write(
+                "idna_subject,checker_type,status\r\nexample.org,SYNTAX,VALID\r\n"
+                "example.net,SYN"
+            )
+
+        index = CSVFileIndex(
+            self.dataset.source_file,
+            OurIndexedCSVDataset.FIELDS,
+            OurIndexedCSVDataset.COMPARISON_FIELDS,
+        ).sync()
+
+        expected = [("example.org", "SYNTAX")]
+        actual = list(index.rows.keys())
+
+        self.assertEqual(expected, actual)
+
+        with open(self.dataset.source_file, "a", encoding="utf-8") as file_stream:
+            file_stream.write("TAX,VALID\r\n")
+
+        expected = [("example.org", "SYNTAX"), ("example.net", "SYNTAX")]
+        actual = list(index.sync().rows.keys())
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,6 +50,7 @@ License:
     limitations under the License.
 """
 
+import ipaddress
 import tempfile
 import unittest
 import unittest.mock
@@ -125,6 +126,40 @@ class TestIPV4ReputationDataset(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_contains_not_ipv4(self) -> None:
+        """
+        Tests of the method which let us check if a given IP is into the
+        dataset.
+
+        In this case, we check against something which is not an IPv4.
+        """
+
+        given = "127.24.78"
+
+        expected = False
+        actual = given in self.ipv4_reputation_dataset
+
+        self.assertEqual(expected, actual)
+
+    def test_get_index(self) -> None:
+        """
+        Tests the method which let us get the sorted array of IPv4.
+        """
+
+        expected = sorted(
+            int(ipaddress.IPv4Address(x.split("#", 1)[0]))
+            for x in self.our_dataset.splitlines()
+            if x
+        )
+        actual = list(self.ipv4_reputation_dataset.get_index())
+
+        self.assertEqual(expected, actual)
+
+        self.assertIs(
+            self.ipv4_reputation_dataset.get_index(),
+            self.ipv4_reputation_dataset.get_index(),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,294 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our SQL dataset base.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import unittest
+from datetime import datetime, timezone
+
+import sqlalchemy
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from PyFunceble.database.sqlalchemy.all_schemas import Inactive
+from PyFunceble.database.sqlalchemy.base_schema import SchemaBase
+from PyFunceble.dataset.inactive.sql import SQLDBInactiveDataset
+from PyFunceble.dataset.sql_base import SQLDBDatasetBase
+
+# pylint: disable=protected-access,unnecessary-lambda
+
+
+@compiles(sqlalchemy.BigInteger, "sqlite")
+def compile_big_integer(*_, **__) -> str:
+    """
+    Lets SQLite autoincrement our (big integer) primary keys.
+    """
+
+    return "INTEGER"
+
+
+class TestSQLDBDatasetBase(unittest.TestCase):
+    """
+    Tests the base of all SQL dataset - through the inactive one.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.engine = sqlalchemy.create_engine("sqlite://")
+        SchemaBase.metadata.create_all(self.engine)
+
+        self.db_session = sessionmaker(bind=self.engine)()
+
+        self.dataset = SQLDBInactiveDataset(
+            db_session=self.db_session,
+            authorized=True,
+            batch_size=3,
+            batch_delay=3600.0,
+        )
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.db_session.close()
+        self.engine.dispose()
+
+        del self.dataset
+        del self.db_session
+        del self.engine
+
+    @staticmethod
+    def get_row(subject: str, destination: str = "hello.list") -> dict:
+        """
+        Provides a row to work with.
+        """
+
+        return {
+            "idna_subject": subject,
+            "checker_type": "AVAILABILITY",
+            "destination": destination,
+            "tested_at": datetime.now(timezone.utc),
+        }
+
+    def get_stored(self) -> list:
+        """
+        Provides the (subject, destination) of the rows stored into the
+        database.
+        """
+
+        return sorted(
+            (x.idna_subject, x.destination)
+            for x in self.db_session.query(Inactive).all()
+        )
+
+    def test_set_batch_size(self) -> None:
+        """
+        Tests the method which let us set the number of rows to buffer.
+        """
+
+        actual = self.dataset.set_batch_size(10)
+
+        self.assertIsInstance(actual, SQLDBDatasetBase)
+
+        expected = 10
+        actual = self.dataset.batch_size
+
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(TypeError, lambda: self.dataset.set_batch_size("10"))
+        self.assertRaises(ValueError, lambda: self.dataset.set_batch_size(-1))
+
+    def test_set_batch_delay(self) -> None:
+        """
+        Tests the method which let us set the maximal time a row can stay
+        buffered.
+        """
+
+        actual = self.dataset.set_batch_delay(10)
+
+        self.assertIsInstance(actual, SQLDBDatasetBase)
+
+        expected = 10.0
+        actual = self.dataset.batch_delay
+
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(TypeError, lambda: self.dataset.set_batch_delay("10"))
+        self.assertRaises(ValueError, lambda: self.dataset.set_batch_delay(-1))
+
+    def test_update_batched(self) -> None:
+        """
+        Tests that the updates are buffered until the batch is full.
+        """
+
+        self.dataset.update(self.get_row("example.org"))
+        self.dataset.update(self.get_row("example.net"))
+
+        expected = []
+        actual = self.get_stored()
+
+        self.assertEqual(expected, actual)
+
+        self.dataset.update(self.get_row("example.com"))
+
+        expected = [
+            ("example.com", "hello.list"),
+            ("example.net", "hello.list"),
+            ("example.org", "hello.list"),
+        ]
+        actual = self.get_stored()
+
+        self.assertEqual(expected, actual)
+
+        expected = {}
+        actual = self.dataset._pending
+
+        self.assertEqual(expected, actual)
+
+    def test_update_batched_delay(self) -> None:
+        """
+        Tests that the updates are written once the buffer is too old.
+        """
+
+        self.dataset.set_batch_delay(0)
+
+        self.dataset.update(self.get_row("example.org"))
+
+        expected = [("example.org", "hello.list")]
+        actual = self.get_stored()
+
+        self.assertEqual(expected, actual)
+
+    def test_flush_update_and_remove(self) -> None:
+        """
+        Tests that a flush updates the existing rows, inserts the new ones and
+        removes the removed ones.
+        """
+
+        self.dataset.set_batch_size(0)
+
+        self.dataset.update(self.get_row("example.org"))
+        self.dataset.update(self.get_row("example.net"))
+
+        self.dataset.set_batch_size(10)
+
+        given = self.get_row("example.org")
+        given["tested_at"] = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        self.dataset.update(given)
+        self.dataset.update(self.get_row("example.com"))
+        self.dataset.remove(self.get_row("example.net"))
+
+        expected = [("example.net", "hello.list"), ("example.org", "hello.list")]
+        actual = self.get_stored()
+
+        self.assertEqual(expected, actual)
+
+        self.dataset.flush()
+
+        expected = [("example.com", "hello.list"), ("example.org", "hello.list")]
+        actual = self.get_stored()
+
+        self.assertEqual(expected, actual)
+
+        expected = 2020
+        actual = (
+            self.db_session.query(Inactive)
+            .filter_by(idna_subject="example.org")
+            .one()
+            .tested_at.year
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_exists_flushes(self) -> None:
+        """
+        Tests that a read considers the buffered rows.
+        """
+
+        self.dataset.update(self.get_row("example.org"))
+
+        self.assertTrue(self.dataset.exists(self.get_row("example.org")))
+
+    def test_close(self) -> None:
+        """
+        Tests that the closing of the dataset writes the buffered rows.
+        """
+
+        self.dataset.update(self.get_row("example.org"))
+
+        actual = self.dataset.close()
+
+        self.assertIsInstance(actual, SQLDBDatasetBase)
+
+        expected = [("example.org", "hello.list")]
+        actual = self.get_stored()
+
+        self.assertEqual(expected, actual)
+
+    def test_close_not_authorized(self) -> None:
+        """
+        Tests the closing of the dataset for the case that we are not
+        authorized to operate.
+        """
+
+        self.dataset.set_authorized(False)
+
+        actual = self.dataset.close()
+
+        self.assertIsInstance(actual, SQLDBDatasetBase)
+
+
+if __name__ == "__main__":
+    unittest.main()
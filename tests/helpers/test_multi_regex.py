@@ -0,0 +1,180 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our multi regex helper.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import unittest
+
+from PyFunceble.helpers.multi_regex import MultiRegexHelper
+from PyFunceble.helpers.regex import RegexHelper
+
+
+class TestMultiRegexHelper(unittest.TestCase):
+    """
+    Tests our multi regex helper.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed for the test.
+        """
+
+        self.regexes = [
+            r"\.example\.org$",
+            r"^example\.",
+            r"^example\.net$",
+            r"\.blogspot\.",
+            r"\.hello.world$",
+            r"\.org$",
+            r"[0-9]+\.example",
+        ]
+
+        self.helper = MultiRegexHelper(self.regexes)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed for the test.
+        """
+
+        del self.regexes
+        del self.helper
+
+    def test_set_regexes_not_iterable_of_str(self) -> None:
+        """
+        Tests the method which let us set the regexes to work with for the case
+        that the given value is not an iterable of strings.
+        """
+
+        self.assertRaises(TypeError, lambda: self.helper.set_regexes("hello"))
+        self.assertRaises(TypeError, lambda: self.helper.set_regexes([1, 2]))
+
+    def test_get_literal(self) -> None:
+        """
+        Tests the method which let us get the literal string behind a regex.
+        """
+
+        expected = ".example.org"
+        actual = MultiRegexHelper.get_literal(r"\.example\.org")
+
+        self.assertEqual(expected, actual)
+
+        self.assertIsNone(MultiRegexHelper.get_literal(r"\.hello.world"))
+        self.assertIsNone(MultiRegexHelper.get_literal(r"\d+"))
+        self.assertIsNone(MultiRegexHelper.get_literal("hello\\"))
+
+    def test_get_matching_indexes(self) -> None:
+        """
+        Tests the method which let us get the indexes of the matching regexes.
+        """
+
+        for data in [
+            "www.example.org",
+            "example.org",
+            "example.net",
+            "hello.blogspot.com",
+            "hello.helloXworld",
+            "123.example.com",
+            "hello.world",
+            "example.com.example.org",
+        ]:
+            expected = [
+                i for i, x in enumerate(self.regexes) if RegexHelper(x).match(data)
+            ]
+            actual = self.helper.get_matching_indexes(data)
+
+            self.assertEqual(expected, actual, data)
+
+    def test_match(self) -> None:
+        """
+        Tests the method which let us check if any of the regexes match.
+        """
+
+        for data in [
+            "www.example.org",
+            "example.com",
+            "hello.blogspot.com",
+            "123.example.com",
+            "hello.world",
+            "example.net.com",
+        ]:
+            expected = any(RegexHelper(x).match(data) for x in self.regexes)
+            actual = self.helper.match(data)
+
+            self.assertEqual(expected, actual, data)
+
+    def test_match_no_regexes(self) -> None:
+        """
+        Tests the method which let us check if any of the regexes match for
+        the case that no regex was given.
+        """
+
+        self.assertFalse(MultiRegexHelper().match("example.org"))
+        self.assertEqual([], MultiRegexHelper([]).get_matching_indexes("hello"))
+
+    def test_match_with_backreference(self) -> None:
+        """
+        Tests the method which let us check if any of the regexes match for
+        the case that some regexes can't be combined.
+        """
+
+        helper = MultiRegexHelper([r"(a)\1", r"(?i)^HELLO", r"(b)c"])
+
+        self.assertTrue(helper.match("xaax"))
+        self.assertTrue(helper.match("hello"))
+        self.assertFalse(helper.match("xabx"))
+
+        expected = [0, 2]
+        actual = helper.get_matching_indexes("aabc")
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
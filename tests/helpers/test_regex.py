@@ -290,6 +290,92 @@ class TestRegexHelper(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_compiled(self) -> None:
+        """
+        Tests the method which let us get a shared and already compiled helper.
+        """
+
+        RegexHelper.clear_cache()
+
+        helper = RegexHelper.compiled("[a-z]+")
+
+        self.assertIs(helper, RegexHelper.compiled("[a-z]+"))
+        self.assertEqual("[a-z]+", helper.regex)
+        self.assertTrue(helper.match("hello", return_match=False))
+
+        expected = {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+        actual = RegexHelper.get_cache_stats()
+
+        self.assertEqual(expected, actual)
+
+    def test_compiled_escape(self) -> None:
+        """
+        Tests the method which let us get a shared and already compiled helper
+        for the case that we want to escape the regex.
+        """
+
+        expected = r"\.example\.org"
+        actual = RegexHelper.compiled(".example.org", escape_regex=True).regex
+
+        self.assertEqual(expected, actual)
+
+    def test_set_cache_max_size(self) -> None:
+        """
+        Tests the method which let us set the maximal size of the cache of
+        compiled patterns.
+        """
+
+        RegexHelper.clear_cache()
+
+        try:
+            RegexHelper.set_cache_max_size(2)
+
+            for regex in ("a", "b", "a", "c"):
+                RegexHelper.get_compiled_pattern(regex)
+
+            expected = {"size": 2, "hits": 1, "misses": 3, "evictions": 1}
+            actual = RegexHelper.get_cache_stats()
+
+            self.assertEqual(expected, actual)
+
+            # "b" was the least recently used one.
+            RegexHelper.get_compiled_pattern("a")
+            RegexHelper.get_compiled_pattern("b")
+
+            expected = {"size": 2, "hits": 2, "misses": 4, "evictions": 2}
+            actual = RegexHelper.get_cache_stats()
+
+            self.assertEqual(expected, actual)
+        finally:
+            RegexHelper.set_cache_max_size(RegexHelper.STD_CACHE_MAX_SIZE)
+
+    def test_set_cache_max_size_not_int(self) -> None:
+        """
+        Tests the method which let us set the maximal size of the cache of
+        compiled patterns for the case that the given value is not an integer.
+        """
+
+        self.assertRaises(TypeError, lambda: RegexHelper.set_cache_max_size("1"))
+        self.assertRaises(ValueError, lambda: RegexHelper.set_cache_max_size(0))
+
+    def test_replace_multiline(self) -> None:
+        """
+        Tests the replacement method for the case that we want a multiline
+        replacement.
+        """
+
+        expected = "hello\nhello"
+        actual = self.helper.set_regex("^world").replace_match(
+            "world\nworld", "hello", multiline=True
+        )
+
+        self.assertEqual(expected, actual)
+
+        expected = "hello\nworld"
+        actual = self.helper.set_regex("^world").replace_match("world\nworld", "hello")
+
+        self.assertEqual(expected, actual)
+
 
 if __name__ == "__main__":
     unittest.main()
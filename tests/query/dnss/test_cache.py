@@ -0,0 +1,226 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our cache of DNS answers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from PyFunceble.query.dns.cache import DNSAnswerCache
+
+
+class TestDNSAnswerCache(unittest.TestCase):
+    """
+    Tests our cache of DNS answers.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = DNSAnswerCache()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything previously initiated for the tests.
+        """
+
+        self.temp_dir.cleanup()
+
+        del self.temp_dir
+        del self.cache
+
+    def test_set_max_size(self) -> None:
+        """
+        Tests the method which let us set the maximal size of the cache.
+        """
+
+        given = 5
+        expected = 5
+
+        self.cache.set_max_size(given)
+        actual = self.cache.max_size
+
+        self.assertEqual(expected, actual)
+
+    def test_set_max_size_not_int(self) -> None:
+        """
+        Tests the method which let us set the maximal size of the cache for
+        the case that the given value is not an integer.
+        """
+
+        self.assertRaises(TypeError, lambda: self.cache.set_max_size("5"))
+
+    def test_set_max_size_zero(self) -> None:
+        """
+        Tests the method which let us set the maximal size of the cache for
+        the case that the given value is zero.
+        """
+
+        self.assertRaises(ValueError, lambda: self.cache.set_max_size(0))
+
+    def test_get_not_cached(self) -> None:
+        """
+        Tests the method which let us get an answer for the case that nothing
+        is cached.
+        """
+
+        expected = None
+        actual = self.cache.get(("example.org.", "A", "UDP"))
+
+        self.assertEqual(expected, actual)
+
+    def test_set_and_get(self) -> None:
+        """
+        Tests the method which let us cache and get an answer.
+        """
+
+        self.cache.set(("example.org.", "A", "UDP"), ["192.168.1.1"], 300)
+
+        expected = ["192.168.1.1"]
+        actual = self.cache.get(("example.org.", "A", "UDP"))
+
+        self.assertEqual(expected, actual)
+
+        expected = None
+        actual = self.cache.get(("example.org.", "A", "TCP"))
+
+        self.assertEqual(expected, actual)
+
+    def test_set_and_get_negative(self) -> None:
+        """
+        Tests the method which let us cache and get a negative answer.
+        """
+
+        self.cache.set(("example.org.", "A", "UDP"), [], 300)
+
+        expected = []
+        actual = self.cache.get(("example.org.", "A", "UDP"))
+
+        self.assertEqual(expected, actual)
+
+    def test_get_expired(self) -> None:
+        """
+        Tests the method which let us get an answer for the case that the
+        cached answer expired.
+        """
+
+        with unittest.mock.patch("time.time") as time_patch:
+            time_patch.return_value = 1000.0
+            self.cache.set(("example.org.", "A", "UDP"), ["192.168.1.1"], 300)
+
+            time_patch.return_value = 1301.0
+
+            expected = None
+            actual = self.cache.get(("example.org.", "A", "UDP"))
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(0, len(self.cache))
+
+    def test_set_zero_ttl(self) -> None:
+        """
+        Tests the method which let us cache an answer for the case that the
+        TTL is zero.
+        """
+
+        self.cache.set(("example.org.", "A", "UDP"), ["192.168.1.1"], 0)
+
+        expected = 0
+        actual = len(self.cache)
+
+        self.assertEqual(expected, actual)
+
+    def test_max_size(self) -> None:
+        """
+        Tests that the least recently used answers are dropped when the cache
+        is full.
+        """
+
+        self.cache.set_max_size(2)
+
+        self.cache.set(("a.example.org.", "A", "UDP"), ["192.168.1.1"], 300)
+        self.cache.set(("b.example.org.", "A", "UDP"), ["192.168.1.2"], 300)
+        self.cache.get(("a.example.org.", "A", "UDP"))
+        self.cache.set(("c.example.org.", "A", "UDP"), ["192.168.1.3"], 300)
+
+        expected = None
+        actual = self.cache.get(("b.example.org.", "A", "UDP"))
+
+        self.assertEqual(expected, actual)
+
+        expected = ["192.168.1.1"]
+        actual = self.cache.get(("a.example.org.", "A", "UDP"))
+
+        self.assertEqual(expected, actual)
+
+    def test_shared_file(self) -> None:
+        """
+        Tests that the answers are shared through the shared file.
+        """
+
+        shared_file = os.path.join(self.temp_dir.name, "dns_cache.sqlite3")
+
+        self.cache.set_shared_file(shared_file)
+        self.cache.set(("example.org.", "A", "UDP"), ["192.168.1.1"], 300)
+
+        other_cache = DNSAnswerCache(shared_file=shared_file)
+
+        expected = ["192.168.1.1"]
+        actual = other_cache.get(("example.org.", "A", "UDP"))
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
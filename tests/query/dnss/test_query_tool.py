@@ -59,8 +59,10 @@ import unittest.mock
 import dns.exception
 import dns.name
 import dns.query
+import dns.rdatatype
 
 from PyFunceble.config.loader import ConfigLoader
+from PyFunceble.query.dns.cache import DNSAnswerCache
 from PyFunceble.query.dns.query_tool import DNSQueryTool, DNSQueryToolRecord
 
 # pylint: disable=protected-access, too-many-lines, invalid-field-call
@@ -783,6 +785,182 @@ class TestDNSQueryTool(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_set_concurrent_lookup(self) -> None:
+        """
+        Tests the method which let us allow the concurrent lookup.
+        """
+
+        given = True
+        expected = True
+
+        self.query_tool.set_concurrent_lookup(given)
+        actual = self.query_tool.concurrent_lookup
+
+        self.assertEqual(expected, actual)
+
+    def test_set_concurrent_lookup_not_bool(self) -> None:
+        """
+        Tests the method which let us allow the concurrent lookup for the case
+        that the given value is not a boolean.
+        """
+
+        given = ["Hello", "World"]
+
+        self.assertRaises(
+            TypeError, lambda: self.query_tool.set_concurrent_lookup(given)
+        )
+
+    def test_set_concurrent_lookup_through_init(self) -> None:
+        """
+        Tests the method which let us allow the concurrent lookup.
+
+        In this test we check that the transfert of the value through the
+        constructor is working.
+        """
+
+        given = True
+
+        query_tool = DNSQueryTool(concurrent_lookup=given)
+
+        expected = True
+        actual = query_tool.concurrent_lookup
+
+        self.assertEqual(expected, actual)
+
+    def test_guess_and_set_concurrent_lookup(self) -> None:
+        """
+        Tests the method which let us guess and set the concurrent lookup flag.
+        """
+
+        config_loader = ConfigLoader()
+        config_loader.set_custom_config({"dns": {"concurrent_lookup": True}}).start()
+
+        self.query_tool.guess_and_set_concurrent_lookup()
+
+        expected = True
+        actual = self.query_tool.concurrent_lookup
+
+        self.assertEqual(expected, actual)
+
+    def test_guess_and_set_concurrent_lookup_none(self) -> None:
+        """
+        Tests the method which let us guess and set the concurrent lookup flag.
+
+        In this test, we check the case that the given value is set to None.
+        """
+
+        config_loader = ConfigLoader()
+        config_loader.set_custom_config({"dns": {"concurrent_lookup": None}}).start()
+
+        self.query_tool.guess_and_set_concurrent_lookup()
+
+        expected = self.query_tool.STD_CONCURRENT_LOOKUP
+        actual = self.query_tool.concurrent_lookup
+
+        self.assertEqual(expected, actual)
+
+    def test_query_first(self) -> None:
+        """
+        Tests the method which let us query the first record type which gives
+        a positive answer.
+        """
+
+        self.mock_udp_query.side_effect = lambda x, *_, **__: x.question[0].rdtype
+        self.query_tool._get_result_from_response = lambda x: (
+            ["192.168.1.1"] if x in (dns.rdatatype.A, dns.rdatatype.AAAA) else []
+        )
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.subject = "example.org"
+
+        for concurrent_lookup in (False, True):
+            self.query_tool.concurrent_lookup = concurrent_lookup
+
+            expected = {"A": ["192.168.1.1"]}
+            actual = self.query_tool.query_first(["NS", "A", "AAAA", "CNAME"])
+
+            self.assertEqual(expected, actual)
+
+            expected = "A"
+            actual = self.query_tool.lookup_record.query_record_type
+
+            self.assertEqual(expected, actual)
+
+            expected = ["192.168.1.1"]
+            actual = self.query_tool.lookup_record.response
+
+            self.assertEqual(expected, actual)
+
+    def test_query_first_no_answer(self) -> None:
+        """
+        Tests the method which let us query the first record type which gives
+        a positive answer.
+
+        In this test, we check the case that none of the record types gives a
+        positive answer.
+        """
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.subject = "example.org"
+
+        for concurrent_lookup in (False, True):
+            self.query_tool.concurrent_lookup = concurrent_lookup
+
+            expected = {}
+            actual = self.query_tool.query_first(["NS", "A", "AAAA", "CNAME"])
+
+            self.assertEqual(expected, actual)
+
+    def test_set_answer_cache(self) -> None:
+        """
+        Tests the method which let us set the cache of DNS answers.
+        """
+
+        given = DNSAnswerCache()
+        expected = given
+
+        self.query_tool.set_answer_cache(given)
+        actual = self.query_tool.answer_cache
+
+        self.assertIs(expected, actual)
+
+    def test_set_answer_cache_not_cache(self) -> None:
+        """
+        Tests the method which let us set the cache of DNS answers for the case
+        that the given value is not a cache.
+        """
+
+        given = ["Hello", "World"]
+
+        self.assertRaises(TypeError, lambda: self.query_tool.set_answer_cache(given))
+
+    def test_query_from_answer_cache(self) -> None:
+        """
+        Tests that a cached answer is given back without querying the
+        nameservers again.
+        """
+
+        def fake_get_result_from_response(_):
+            self.query_tool._update_answer_ttl(300)
+
+            return ["192.168.1.1"]
+
+        self.query_tool._get_result_from_response = fake_get_result_from_response
+        self.mock_udp_query.return_value = object()
+
+        self.query_tool.set_answer_cache(DNSAnswerCache())
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        expected = ["192.168.1.1"]
+
+        self.assertEqual(expected, self.query_tool.query())
+        self.assertEqual(expected, self.query_tool.query())
+
+        self.assertEqual(expected, self.query_tool.lookup_record.response)
+        self.assertEqual(1, self.mock_udp_query.call_count)
+
     def test_get_lookup_record(self) -> None:
         """
         Tests the method which let us get the lookup record.
@@ -0,0 +1,186 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our cache of resolved hostnames.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import unittest
+import unittest.mock
+
+from PyFunceble.query.requests.resolving_cache import ResolvingCache
+
+
+class TestResolvingCache(unittest.TestCase):
+    """
+    Tests our cache of resolved hostnames.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.cache = ResolvingCache()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything previously initiated for the tests.
+        """
+
+        del self.cache
+
+    def test_set_ttl_not_int(self) -> None:
+        """
+        Tests the method which let us set the TTL for the case that the given
+        value is not an integer.
+        """
+
+        self.assertRaises(TypeError, lambda: self.cache.set_ttl("5"))
+
+    def test_set_max_memory_zero(self) -> None:
+        """
+        Tests the method which let us set the maximal memory for the case that
+        the given value is zero.
+        """
+
+        self.assertRaises(ValueError, lambda: self.cache.set_max_memory(0))
+
+    def test_set_and_get(self) -> None:
+        """
+        Tests that we can cache and get a resolved hostname.
+        """
+
+        self.cache["example.org"] = "192.168.1.1"
+        self.cache["example.net"] = None
+
+        self.assertEqual("192.168.1.1", self.cache["example.org"])
+        self.assertIsNone(self.cache["example.net"])
+        self.assertRaises(KeyError, lambda: self.cache["example.com"])
+
+        expected = {"hits": 2, "misses": 1, "evictions": 0, "size": 2}
+        actual = self.cache.get_stats()
+
+        del actual["memory"]
+
+        self.assertEqual(expected, actual)
+
+    def test_get_expired(self) -> None:
+        """
+        Tests that an expired hostname is not given back.
+        """
+
+        self.cache.set_ttl(10)
+
+        with unittest.mock.patch("time.monotonic") as time_patch:
+            time_patch.return_value = 100.0
+            self.cache["example.org"] = "192.168.1.1"
+
+            time_patch.return_value = 111.0
+
+            self.assertNotIn("example.org", self.cache)
+            self.assertRaises(KeyError, lambda: self.cache["example.org"])
+
+        expected = 0
+        actual = len(self.cache)
+
+        self.assertEqual(expected, actual)
+
+    def test_max_size(self) -> None:
+        """
+        Tests that the least recently used hostnames are dropped when the
+        cache is full.
+        """
+
+        self.cache.set_max_size(2)
+
+        self.cache["a.example.org"] = "192.168.1.1"
+        self.cache["b.example.org"] = "192.168.1.2"
+        _ = self.cache["a.example.org"]
+        self.cache["c.example.org"] = "192.168.1.3"
+
+        self.assertIn("a.example.org", self.cache)
+        self.assertNotIn("b.example.org", self.cache)
+        self.assertIn("c.example.org", self.cache)
+
+        expected = 1
+        actual = self.cache.evictions
+
+        self.assertEqual(expected, actual)
+
+    def test_max_memory(self) -> None:
+        """
+        Tests that hostnames are dropped when the cache uses too much memory.
+        """
+
+        self.cache["a.example.org"] = "192.168.1.1"
+
+        self.cache.set_max_memory(self.cache.get_stats()["memory"] + 1)
+        self.cache["b.example.org"] = "192.168.1.2"
+
+        self.assertNotIn("a.example.org", self.cache)
+        self.assertIn("b.example.org", self.cache)
+
+    def test_clear(self) -> None:
+        """
+        Tests the method which let us clear the cache.
+        """
+
+        self.cache["example.org"] = "192.168.1.1"
+        self.cache.clear()
+
+        expected = {"size": 0, "memory": 0}
+        actual = {
+            x: y for x, y in self.cache.get_stats().items() if x in ("size", "memory")
+        }
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our cache of HTTP responses.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import unittest
+import unittest.mock
+
+import requests
+
+import PyFunceble.factory
+from PyFunceble.query.requests.response_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Tests our cache of HTTP responses.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.cache = ResponseCache("example.org")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything previously initiated for the tests.
+        """
+
+        del self.cache
+
+    @staticmethod
+    def get_response(
+        url: str, status_code: int = 200, content: bytes = b"Hello, World!"
+    ) -> requests.Response:
+        """
+        Provides a (fake) response.
+        """
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = status_code
+        response.headers["Server"] = "Hello"
+        response.encoding = "utf-8"
+        # pylint: disable=protected-access
+        response._content = content
+        response._content_consumed = True
+
+        return response
+
+    def test_set_subject_not_str(self) -> None:
+        """
+        Tests the method which let us set the subject for the case that the
+        given value is not a string.
+        """
+
+        self.assertRaises(TypeError, lambda: self.cache.set_subject(1))
+
+    def test_set_max_body_size_negative(self) -> None:
+        """
+        Tests the method which let us set the maximal body size for the case
+        that the given value is negative.
+        """
+
+        self.assertRaises(ValueError, lambda: self.cache.set_max_body_size(-1))
+
+    def test_get(self) -> None:
+        """
+        Tests that the same URL is only requested once.
+        """
+
+        with unittest.mock.patch.object(
+            PyFunceble.factory.Requester, "get"
+        ) as request_patch:
+            request_patch.return_value = self.get_response("http://example.org")
+
+            first = self.cache.get("http://example.org", timeout=5)
+            second = self.cache.get("http://example.org", timeout=10)
+
+            request_patch.assert_called_once_with(
+                "http://example.org", allow_redirects=True, stream=True, timeout=5
+            )
+
+        self.assertIs(first, second)
+
+        expected = "Hello, World!"
+        actual = first.text
+
+        self.assertEqual(expected, actual)
+
+        expected = "Hello"
+        actual = first.headers["server"]
+
+        self.assertEqual(expected, actual)
+
+        expected = {"size": 1, "hits": 1, "misses": 1}
+        actual = self.cache.get_stats()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_allow_redirects(self) -> None:
+        """
+        Tests that the redirection policy is part of the cache key.
+        """
+
+        with unittest.mock.patch.object(
+            PyFunceble.factory.Requester, "get"
+        ) as request_patch:
+            request_patch.side_effect = lambda url, **kwargs: self.get_response(url)
+
+            self.cache.get("http://example.org")
+            self.cache.get("http://example.org", allow_redirects=False)
+
+            expected = 2
+            actual = request_patch.call_count
+
+            self.assertEqual(expected, actual)
+
+        self.assertIn(("http://example.org", True), self.cache)
+        self.assertIn(("http://example.org", False), self.cache)
+
+    def test_get_body_capped(self) -> None:
+        """
+        Tests that the body of a response is capped.
+        """
+
+        self.cache.set_max_body_size(5)
+
+        with unittest.mock.patch.object(
+            PyFunceble.factory.Requester, "get"
+        ) as request_patch:
+            request_patch.return_value = self.get_response("http://example.org")
+
+            expected = "Hello"
+            actual = self.cache.get("http://example.org").text
+
+            self.assertEqual(expected, actual)
+
+    def test_get_exception(self) -> None:
+        """
+        Tests that a failed request is not sent again.
+        """
+
+        with unittest.mock.patch.object(
+            PyFunceble.factory.Requester, "get"
+        ) as request_patch:
+            request_patch.side_effect = requests.exceptions.ConnectionError()
+
+            self.assertRaises(
+                requests.exceptions.ConnectionError,
+                lambda: self.cache.get("http://example.org"),
+            )
+            self.assertRaises(
+                requests.exceptions.ConnectionError,
+                lambda: self.cache.get("http://example.org"),
+            )
+
+            request_patch.assert_called_once()
+
+    def test_get_history(self) -> None:
+        """
+        Tests that the redirection history is kept.
+        """
+
+        response = self.get_response("https://example.org")
+        response.history = [self.get_response("http://example.org", 301, b"")]
+
+        with unittest.mock.patch.object(
+            PyFunceble.factory.Requester, "get"
+        ) as request_patch:
+            request_patch.return_value = response
+
+            actual = self.cache.get("http://example.org")
+
+        expected = [301]
+
+        self.assertEqual(expected, [x.status_code for x in actual.history])
+
+    def test_set_subject_clears(self) -> None:
+        """
+        Tests that the cache is cleared when the subject changes.
+        """
+
+        with unittest.mock.patch.object(
+            PyFunceble.factory.Requester, "get"
+        ) as request_patch:
+            request_patch.return_value = self.get_response("http://example.org")
+
+            self.cache.get("http://example.org")
+
+        self.cache.set_subject("example.org")
+
+        expected = 1
+        actual = len(self.cache)
+
+        self.assertEqual(expected, actual)
+
+        self.cache.set_subject("example.net")
+
+        expected = 0
+        actual = len(self.cache)
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
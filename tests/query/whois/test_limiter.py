@@ -0,0 +1,466 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our WHOIS rate limiter.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+# pylint: disable=protected-access
+
+import pickle
+import threading
+import unittest
+import unittest.mock
+
+from PyFunceble.query.whois.limiter import WhoisRateLimiter
+
+
+class FakeClock:
+    """
+    Provides a clock which only moves when we sleep.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """
+        Provides the current time.
+        """
+
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Moves the clock forward.
+        """
+
+        self.now += seconds
+
+
+class TestWhoisRateLimiter(unittest.TestCase):
+    """
+    Tests our WHOIS rate limiter.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.clock = FakeClock()
+
+        self.patchers = [
+            unittest.mock.patch("time.monotonic", self.clock.monotonic),
+            unittest.mock.patch("time.sleep", self.clock.sleep),
+        ]
+
+        for patcher in self.patchers:
+            patcher.start()
+
+        self.limiter = WhoisRateLimiter(
+            rate_limit=2, burst=3, max_concurrent_queries=0, backoff=1, max_backoff=3
+        )
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        for patcher in self.patchers:
+            patcher.stop()
+
+        del self.limiter
+        del self.patchers
+        del self.clock
+
+    def test_set_rate_limit(self) -> None:
+        """
+        Tests the method which let us set the rate limit.
+        """
+
+        actual = self.limiter.set_rate_limit(10)
+
+        self.assertIsInstance(actual, WhoisRateLimiter)
+
+        expected = 10.0
+        actual = self.limiter.rate_limit
+
+        self.assertEqual(expected, actual)
+
+    def test_set_rate_limit_not_number(self) -> None:
+        """
+        Tests the method which let us set the rate limit for the case that the
+        given value is not a number.
+        """
+
+        self.assertRaises(TypeError, lambda: self.limiter.set_rate_limit("10"))
+        self.assertRaises(TypeError, lambda: self.limiter.set_rate_limit(True))
+
+    def test_set_rate_limit_negative(self) -> None:
+        """
+        Tests the method which let us set the rate limit for the case that the
+        given value is negative.
+        """
+
+        self.assertRaises(ValueError, lambda: self.limiter.set_rate_limit(-1))
+
+    def test_set_burst(self) -> None:
+        """
+        Tests the method which let us set the burst.
+        """
+
+        actual = self.limiter.set_burst(10)
+
+        self.assertIsInstance(actual, WhoisRateLimiter)
+
+        expected = 10
+        actual = self.limiter.burst
+
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(TypeError, lambda: self.limiter.set_burst(1.0))
+        self.assertRaises(ValueError, lambda: self.limiter.set_burst(0))
+
+    def test_set_max_concurrent_queries(self) -> None:
+        """
+        Tests the method which let us set the maximal number of simultaneous
+        queries.
+        """
+
+        actual = self.limiter.set_max_concurrent_queries(10)
+
+        self.assertIsInstance(actual, WhoisRateLimiter)
+
+        expected = 10
+        actual = self.limiter.max_concurrent_queries
+
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(
+            TypeError, lambda: self.limiter.set_max_concurrent_queries("10")
+        )
+        self.assertRaises(
+            ValueError, lambda: self.limiter.set_max_concurrent_queries(-1)
+        )
+
+    def test_set_backoff(self) -> None:
+        """
+        Tests the methods which let us set the backoff.
+        """
+
+        actual = self.limiter.set_backoff(2).set_max_backoff(30)
+
+        self.assertIsInstance(actual, WhoisRateLimiter)
+
+        expected = (2.0, 30.0)
+        actual = (self.limiter.backoff, self.limiter.max_backoff)
+
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(TypeError, lambda: self.limiter.set_backoff(None))
+        self.assertRaises(ValueError, lambda: self.limiter.set_max_backoff(-1))
+
+    def test_rate_limit(self) -> None:
+        """
+        Tests that the queries of a server are delayed once its burst is
+        consumed.
+        """
+
+        expected = [0.0, 0.0, 0.0, 0.5, 0.5]
+        actual = []
+
+        for _ in range(5):
+            actual.append(self.limiter.acquire("whois.example.org"))
+            self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_SUCCESS)
+
+        self.assertEqual(expected, actual)
+
+        # Other servers have their own bucket.
+        expected = 0.0
+        actual = self.limiter.acquire("whois.example.com")
+
+        self.assertEqual(expected, actual)
+
+    def test_rate_limit_refill(self) -> None:
+        """
+        Tests that the bucket of a server is refilled over time - up to the
+        burst.
+        """
+
+        for _ in range(3):
+            self.limiter.acquire("whois.example.org")
+            self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_SUCCESS)
+
+        self.clock.sleep(60)
+
+        expected = [0.0, 0.0, 0.0, 0.5]
+        actual = []
+
+        for _ in range(4):
+            actual.append(self.limiter.acquire("whois.example.org"))
+            self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_SUCCESS)
+
+        self.assertEqual(expected, actual)
+
+    def test_no_rate_limit(self) -> None:
+        """
+        Tests that the queries are never delayed when the rate limit is
+        disabled.
+        """
+
+        self.limiter.set_rate_limit(0)
+
+        for _ in range(10):
+            expected = 0.0
+            actual = self.limiter.acquire("whois.example.org")
+
+            self.assertEqual(expected, actual)
+
+            self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_SUCCESS)
+
+    def test_backoff(self) -> None:
+        """
+        Tests that a server which fails is not queried for an exponentially
+        increasing amount of time.
+        """
+
+        self.limiter.set_rate_limit(0)
+
+        expected = [0.0, 1.0, 2.0, 3.0, 3.0]
+        actual = []
+
+        for _ in range(5):
+            actual.append(self.limiter.acquire("whois.example.org"))
+            self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_EMPTY)
+
+        self.assertEqual(expected, actual)
+
+        expected = 3.0
+        actual = self.limiter.acquire("whois.example.org")
+
+        self.assertEqual(expected, actual)
+
+        self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_SUCCESS)
+
+        # A success resets the backoff.
+        expected = 0.0
+        actual = self.limiter.acquire("whois.example.org")
+
+        self.assertEqual(expected, actual)
+
+    def test_backoff_no_burst(self) -> None:
+        """
+        Tests that a server which failed gets its queries at the rate limit
+        once it is available again.
+        """
+
+        self.limiter.acquire("whois.example.org")
+        self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_RESET)
+
+        expected = [1.5, 0.5]
+        actual = []
+
+        for _ in range(2):
+            actual.append(self.limiter.acquire("whois.example.org"))
+            self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_SUCCESS)
+
+        self.assertEqual(expected, actual)
+
+    def test_backoff_long_failure_streak(self) -> None:
+        """
+        Tests that a long failure streak doesn't break the backoff nor leak the
+        query slots of the server.
+        """
+
+        self.limiter.set_rate_limit(0).set_max_concurrent_queries(1)
+
+        for _ in range(1100):
+            self.limiter.acquire("whois.example.org")
+            self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_ERROR)
+
+        expected = 3.0
+        actual = self.limiter.acquire("whois.example.org")
+
+        self.assertEqual(expected, actual)
+
+        expected = 1100
+        actual = self.limiter.get_metrics()["whois.example.org"]["errors"]
+
+        self.assertEqual(expected, actual)
+
+    def test_release_unknown_outcome(self) -> None:
+        """
+        Tests the method which let us release a query slot for the case that
+        the given outcome is unknown.
+        """
+
+        self.limiter.set_max_concurrent_queries(1)
+        self.limiter.acquire("whois.example.org")
+
+        self.assertRaises(
+            ValueError, lambda: self.limiter.release("whois.example.org", "hello")
+        )
+
+        # The query slot is given back anyway.
+        self.assertTrue(
+            self.limiter._servers["whois.example.org"].semaphore.acquire(blocking=False)
+        )
+
+    def test_max_concurrent_queries(self) -> None:
+        """
+        Tests that the number of simultaneous queries of a server is limited.
+        """
+
+        for patcher in self.patchers:
+            patcher.stop()
+
+        self.limiter.set_rate_limit(0).set_max_concurrent_queries(1)
+
+        self.limiter.acquire("whois.example.org")
+
+        acquired = threading.Event()
+
+        def acquire():
+            self.limiter.acquire("whois.example.org")
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+
+        self.assertFalse(acquired.wait(0.1))
+
+        # Other servers have their own slots.
+        self.limiter.acquire("whois.example.com")
+
+        self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_SUCCESS)
+
+        self.assertTrue(acquired.wait(5))
+
+        thread.join()
+
+        for patcher in self.patchers:
+            patcher.start()
+
+    def test_get_metrics(self) -> None:
+        """
+        Tests the method which let us get the metrics of each server.
+        """
+
+        for outcome in (
+            WhoisRateLimiter.OUTCOME_SUCCESS,
+            WhoisRateLimiter.OUTCOME_EMPTY,
+            WhoisRateLimiter.OUTCOME_RESET,
+            WhoisRateLimiter.OUTCOME_ERROR,
+        ):
+            self.limiter.acquire(
+                "whois.example.org",
+                retry=outcome != WhoisRateLimiter.OUTCOME_SUCCESS,
+            )
+            self.limiter.release("whois.example.org", outcome)
+
+        expected = {
+            "whois.example.org": {
+                "queries": 4,
+                "successes": 1,
+                "empty_replies": 1,
+                "resets": 1,
+                "errors": 1,
+                "retries": 3,
+                "backoffs": 3,
+                "throttled_time": 1.5 + 2.5,
+            }
+        }
+        actual = self.limiter.get_metrics()
+
+        self.assertEqual(expected, actual)
+
+    def test_clear(self) -> None:
+        """
+        Tests the method which let us forget everything about the servers.
+        """
+
+        self.limiter.acquire("whois.example.org")
+        self.limiter.release("whois.example.org", WhoisRateLimiter.OUTCOME_SUCCESS)
+
+        self.assertIn("whois.example.org", self.limiter)
+
+        self.limiter.clear()
+
+        self.assertNotIn("whois.example.org", self.limiter)
+
+        expected = 0
+        actual = len(self.limiter)
+
+        self.assertEqual(expected, actual)
+
+    def test_pickle(self) -> None:
+        """
+        Tests that the limiter can be pickled - without its state.
+        """
+
+        self.limiter.acquire("whois.example.org")
+
+        actual = pickle.loads(pickle.dumps(self.limiter))
+
+        self.assertIsInstance(actual, WhoisRateLimiter)
+
+        expected = (2.0, 3, 0, 1.0, 3.0)
+        actual = (
+            actual.rate_limit,
+            actual.burst,
+            actual.max_concurrent_queries,
+            actual.backoff,
+            actual.max_backoff,
+        )
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
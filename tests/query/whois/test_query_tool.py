@@ -56,6 +56,7 @@ import unittest
 import unittest.mock
 
 from PyFunceble.query.record.whois import WhoisQueryToolRecord
+from PyFunceble.query.whois.limiter import WhoisRateLimiter
 from PyFunceble.query.whois.query_tool import WhoisQueryTool
 
 
@@ -295,6 +296,172 @@ class TestWhoisQueryTool(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_set_max_retries_return(self) -> None:
+        """
+        Tests the response from the method which let us set the number of
+        retries.
+        """
+
+        given = 3
+
+        actual = self.query_tool.set_max_retries(given)
+
+        self.assertIsInstance(actual, WhoisQueryTool)
+
+    def test_set_max_retries_method(self) -> None:
+        """
+        Tests the method which let us set the number of retries.
+        """
+
+        given = 3
+        expected = 3
+
+        self.query_tool.set_max_retries(given)
+
+        actual = self.query_tool.max_retries
+
+        self.assertEqual(expected, actual)
+
+    def test_set_max_retries_not_int(self) -> None:
+        """
+        Tests the method which let us set the number of retries for the case
+        that the given value is not an integer.
+        """
+
+        given = 3.0
+
+        self.assertRaises(TypeError, lambda: self.query_tool.set_max_retries(given))
+
+    def test_set_max_retries_negative(self) -> None:
+        """
+        Tests the method which let us set the number of retries for the case
+        that the given value is negative.
+        """
+
+        given = -1
+
+        self.assertRaises(ValueError, lambda: self.query_tool.set_max_retries(given))
+
+    def test_set_max_retries_through_init(self) -> None:
+        """
+        Tests the overwritting of the number of retries through the class
+        constructor.
+        """
+
+        given = 3
+        expected = 3
+
+        query_tool = WhoisQueryTool(max_retries=given)
+        actual = query_tool.max_retries
+
+        self.assertEqual(expected, actual)
+
+    def test_set_rate_limiter(self) -> None:
+        """
+        Tests the method which let us set the rate limiter to use.
+        """
+
+        given = WhoisRateLimiter()
+
+        actual = self.query_tool.set_rate_limiter(given)
+
+        self.assertIsInstance(actual, WhoisQueryTool)
+        self.assertIs(given, self.query_tool.rate_limiter)
+
+        self.query_tool.set_rate_limiter(None)
+
+        self.assertIsNone(self.query_tool.rate_limiter)
+
+    def test_set_rate_limiter_not_limiter(self) -> None:
+        """
+        Tests the method which let us set the rate limiter to use for the case
+        that the given value is not a rate limiter.
+        """
+
+        given = "Hello, World!"
+
+        self.assertRaises(TypeError, lambda: self.query_tool.set_rate_limiter(given))
+
+    def test_query_retry(self) -> None:
+        """
+        Tests that a query which got an empty reply or a reset connection is
+        retried.
+        """
+
+        rate_limiter = WhoisRateLimiter(rate_limit=0, backoff=0)
+
+        self.query_tool.set_rate_limiter(rate_limiter).set_max_retries(2)
+        self.query_tool.server = "whois.example.org"
+        self.query_tool.subject = "example.org"
+
+        with unittest.mock.patch.object(
+            WhoisQueryTool,
+            "_query_server",
+            side_effect=[
+                (b"", WhoisRateLimiter.OUTCOME_EMPTY),
+                (b"", WhoisRateLimiter.OUTCOME_RESET),
+                (b"Hello, World!", WhoisRateLimiter.OUTCOME_SUCCESS),
+            ],
+        ) as query_server:
+            actual = self.query_tool.query()
+
+        expected = "Hello, World!"
+        self.assertEqual(expected, actual)
+
+        expected = 3
+        self.assertEqual(expected, query_server.call_count)
+
+        metrics = rate_limiter.get_metrics()["whois.example.org"]
+
+        expected = (3, 1, 1, 1, 2)
+        actual = (
+            metrics["queries"],
+            metrics["successes"],
+            metrics["empty_replies"],
+            metrics["resets"],
+            metrics["retries"],
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_query_retry_exhausted(self) -> None:
+        """
+        Tests that we give up once all retries are consumed and that errors
+        are not retried.
+        """
+
+        self.query_tool.set_rate_limiter(None).set_max_retries(1)
+        self.query_tool.server = "whois.example.org"
+        self.query_tool.subject = "example.org"
+
+        with unittest.mock.patch.object(
+            WhoisQueryTool,
+            "_query_server",
+            return_value=(b"", WhoisRateLimiter.OUTCOME_EMPTY),
+        ) as query_server:
+            actual = self.query_tool.query()
+
+        expected = ""
+        self.assertEqual(expected, actual)
+
+        expected = 2
+        self.assertEqual(expected, query_server.call_count)
+
+        self.query_tool.subject = "example.net"
+
+        with unittest.mock.patch.object(
+            WhoisQueryTool,
+            "_query_server",
+            return_value=(b"", WhoisRateLimiter.OUTCOME_ERROR),
+        ) as query_server:
+            actual = self.query_tool.query()
+
+        expected = ""
+        self.assertEqual(expected, actual)
+
+        expected = 1
+        self.assertEqual(expected, query_server.call_count)
+
     def test_read_expiration_date(self) -> None:
         """
         Tests the method which let us get the expiration date.
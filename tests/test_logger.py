@@ -0,0 +1,204 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our logger.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import inspect
+import logging
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+from PyFunceble.logger import Logger
+
+
+class TestLogger(unittest.TestCase):
+    """
+    Tests our logger.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.logger = Logger(
+            activated=True, min_level=logging.INFO, output_dir=self.temp_dir.name
+        )
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.logger.stop_queue_listener()
+        self.logger.destroy_loggers()
+        self.temp_dir.cleanup()
+
+        del self.logger
+        del self.temp_dir
+
+    def test_get_origin(self) -> None:
+        """
+        Tests the method which let us get the origin of a log record.
+        """
+
+        current_line = inspect.currentframe().f_lineno
+        actual = Logger.get_origin(depth=1)
+
+        expected = {
+            "origin_line": str(current_line + 1),
+            "origin_func": "test_get_origin",
+        }
+        actual = {x: actual[x] for x in expected}
+
+        self.assertEqual(expected, actual)
+
+    def test_get_origin_path(self) -> None:
+        """
+        Tests the method which let us get the path to display.
+        """
+
+        given = os.path.join(os.sep, "hello", "PyFunceble", "logger.py")
+
+        expected = "PyFunceble/logger.py"
+        actual = Logger.get_origin_path(given, os.path.join(os.sep, "hello"))
+
+        self.assertEqual(expected, actual)
+
+        given = os.path.join(os.sep, "hello", "PyFunceble", "cli", "storage.py")
+
+        expected = os.path.join("PyFunceble", "cli", "storage.py")
+        actual = Logger.get_origin_path(given, os.path.join(os.sep, "hello"))
+
+        self.assertEqual(expected, actual)
+
+        given = os.path.join(os.sep, "hello", "world", "logger.py")
+
+        expected = "/hello/world/logger.py"
+        actual = Logger.get_origin_path(given, os.path.join(os.sep, "hello"))
+
+        self.assertEqual(expected, actual)
+
+    def test_info(self) -> None:
+        """
+        Tests that the origin of a log record is the caller of the logger.
+        """
+
+        self.logger.info("Hello, World!")
+
+        with open(
+            os.path.join(self.temp_dir.name, "info.log"), "r", encoding="utf-8"
+        ) as file_stream:
+            content = file_stream.read()
+
+        self.assertIn("Hello, World!", content)
+        self.assertIn("@test_info |", content)
+
+    def test_debug_below_min_level(self) -> None:
+        """
+        Tests that nothing is logged when the level is under the minimum
+        level.
+        """
+
+        self.logger.debug("Hello, World!")
+
+        self.assertFalse(os.path.isfile(os.path.join(self.temp_dir.name, "debug.log")))
+
+    @unittest.skipIf(
+        multiprocessing.get_start_method() != "fork", "Child needs our logger."
+    )
+    def test_queue(self) -> None:
+        """
+        Tests that the records of several processes are written by our
+        listener.
+        """
+
+        self.logger.set_min_level(logging.DEBUG).set_use_queue(True).init_loggers()
+
+        self.assertIsNotNone(self.logger.queue_listener)
+
+        def child(queue) -> None:
+            self.logger.set_queue(queue).init_loggers()
+            self.logger.info("Hello from child!")
+
+        process = multiprocessing.Process(target=child, args=(self.logger.queue,))
+        process.start()
+        process.join()
+
+        self.logger.info("Hello from parent!")
+        self.logger.debug("Debugging!")
+        self.logger.stop_queue_listener()
+
+        self.assertIsNone(self.logger.queue_listener)
+
+        with open(
+            os.path.join(self.temp_dir.name, "info.log"), "r", encoding="utf-8"
+        ) as file_stream:
+            content = file_stream.read()
+
+        self.assertIn("Hello from child!", content)
+        self.assertIn("Hello from parent!", content)
+        self.assertIn("@child |", content)
+        self.assertNotIn("Debugging!", content)
+
+        with open(
+            os.path.join(self.temp_dir.name, "debug.log"), "r", encoding="utf-8"
+        ) as file_stream:
+            content = file_stream.read()
+
+        self.assertIn("Debugging!", content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our slots utilities.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://docs.pyfunceble.com
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2022, 2023, 2024 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        https://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import dataclasses
+import unittest
+from typing import Optional
+
+from PyFunceble.utils.slots import (
+    add_slots,
+    get_field_names,
+    get_fields_getter,
+    get_slots_setters,
+)
+
+
+@add_slots
+@dataclasses.dataclass
+class HelloWorld:
+    """
+    Provides a slotted dataclass to play with.
+    """
+
+    __slots__ = ("cache",)
+
+    hello: Optional[str] = None
+    world: Optional[int] = 1
+
+
+@add_slots
+@dataclasses.dataclass
+class FooBar(HelloWorld):
+    """
+    Provides a slotted dataclass which inherits from another one.
+    """
+
+    greeting: Optional[str] = "hi"
+
+
+class TestSlots(unittest.TestCase):
+    """
+    Tests our slots utilities.
+    """
+
+    def test_add_slots(self) -> None:
+        """
+        Tests the function which let us convert a dataclass into a slotted
+        one.
+        """
+
+        expected = ("cache", "hello", "world")
+        actual = HelloWorld.__slots__
+
+        self.assertEqual(expected, actual)
+
+        expected = ("greeting",)
+        actual = FooBar.__slots__
+
+        self.assertEqual(expected, actual)
+
+        given = FooBar(hello="world")
+
+        self.assertFalse(hasattr(given, "__dict__"))
+
+        expected = ("world", 1, "hi")
+        actual = (given.hello, given.world, given.greeting)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_field_names(self) -> None:
+        """
+        Tests the function which let us get the name of the fields of a
+        dataclass.
+        """
+
+        expected = ("hello", "world", "greeting")
+        actual = get_field_names(FooBar)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_fields_getter_and_slots_setters(self) -> None:
+        """
+        Tests the functions which let us get and set all the fields of a
+        slotted dataclass at once.
+        """
+
+        given = FooBar(hello="world")
+
+        expected = ("world", 1, "hi")
+        actual = get_fields_getter(FooBar)(given)
+
+        self.assertEqual(expected, actual)
+
+        for setter, value in zip(get_slots_setters(FooBar), ("a", 2, "b")):
+            setter(given, value)
+
+        expected = FooBar(hello="a", world=2, greeting="b")
+        actual = given
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()